@@ -1,3 +1,4 @@
 from .common import BaseEntityMixin
+from .resume_parse import ResumeParseResultColumns, ResumeParseSkillColumns
 
-__all__ = ["BaseEntityMixin"]
+__all__ = ["BaseEntityMixin", "ResumeParseResultColumns", "ResumeParseSkillColumns"]
@@ -0,0 +1,63 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, JSON, String, UniqueConstraint
+from sqlalchemy.orm import declared_attr
+
+
+class ResumeParseResultColumns:
+  """
+  Columns of ``resume_parse_result``, the structured output resume-reader
+  stores for one uploaded file of one user. resume-reader writes the table
+  and job-recommendation-system reads it; both map it from this mixin so
+  the two services cannot drift apart. The DDL lives in
+  job-recommendation-system/data/sql/Major_02_00_00/Major2_DDL.sql.
+
+      class ResumeParseResultEntity(ResumeParseResultColumns, BaseEntity):
+          pass
+
+  A service that maps ``users`` may redefine ``user_id`` with its foreign key.
+  """
+
+  __tablename__ = "resume_parse_result"
+  __table_args__ = (
+    UniqueConstraint("user_id", "content_hash", name="uq_resume_parse_result_user_hash"),
+    Index("idx_resume_parse_result_user_time", "user_id", "loggedInTime"),
+  )
+
+  id = Column(BigInteger, primary_key=True, autoincrement=True)
+  user_id = Column(BigInteger, nullable=False)
+  content_hash = Column(String(64), nullable=False)
+  filename = Column(String(255), nullable=True)
+  analyzer_version = Column(String(32), nullable=False)
+  taxonomy_version = Column(String(64), nullable=False)
+  probable_name = Column(String(255), nullable=True)
+  emails_json = Column(JSON, nullable=True)
+  phone_numbers_json = Column(JSON, nullable=True)
+  urls_json = Column(JSON, nullable=True)
+  sections_json = Column(JSON, nullable=True)
+  section_headers_json = Column(JSON, nullable=True)
+  page_count = Column(Integer, nullable=True)
+
+
+class ResumeParseSkillColumns:
+  """
+  Columns of ``resume_parse_skill``: one canonical skill found in a parse
+  result, with ``user_id`` repeated so skill lookups stay on one index.
+  """
+
+  __tablename__ = "resume_parse_skill"
+  __table_args__ = (
+    UniqueConstraint("parse_result_id", "skill", name="uq_resume_parse_skill_result_skill"),
+    Index("idx_resume_parse_skill_skill_user", "skill", "user_id"),
+    Index("idx_resume_parse_skill_user", "user_id"),
+  )
+
+  id = Column(BigInteger, primary_key=True, autoincrement=True)
+  user_id = Column(BigInteger, nullable=False)
+  skill = Column(String(128), nullable=False)
+
+  @declared_attr
+  def parse_result_id(cls):
+    return Column(
+      BigInteger,
+      ForeignKey("resume_parse_result.id", ondelete="CASCADE"),
+      nullable=False,
+    )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, Tuple
+
+# resume-reader stores canonical skill names; services that query them must
+# map user input through the same aliases, so the vocabulary lives here.
+SKILL_TAXONOMY_PATH_ENV = "RESUME_READER_SKILL_TAXONOMY_PATH"
+
+COMMON_SKILLS = {
+    "python",
+    "java",
+    "javascript",
+    "typescript",
+    "react",
+    "angular",
+    "node.js",
+    "c++",
+    "c#",
+    "sql",
+    "mysql",
+    "postgresql",
+    "mongodb",
+    "aws",
+    "azure",
+    "gcp",
+    "docker",
+    "kubernetes",
+    "git",
+    "linux",
+    "html",
+    "css",
+    "sass",
+    "django",
+    "flask",
+    "fastapi",
+    "spring",
+    "hibernate",
+    "go",
+    "ruby",
+    "php",
+    "swift",
+    "kotlin",
+    "machine learning",
+    "data analysis",
+    "pandas",
+    "numpy",
+    "tensorflow",
+    "pytorch",
+    "scikit-learn",
+    "jira",
+    "agile",
+    "scrum",
+}
+
+# Built-in aliases, applied on top of COMMON_SKILLS when no taxonomy file is configured.
+COMMON_SKILL_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "javascript": ("js", "ecmascript"),
+    "typescript": ("ts",),
+    "node.js": ("nodejs", "node js"),
+    "postgresql": ("postgres",),
+    "mongodb": ("mongo",),
+    "kubernetes": ("k8s",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "aws": ("amazon web services",),
+    "go": ("golang",),
+    "machine learning": ("ml",),
+    "scikit-learn": ("sklearn", "scikit learn"),
+    "react": ("react.js", "reactjs"),
+    "angular": ("angularjs", "angular.js"),
+}
+
+
+def normalize_skill(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def builtin_skills() -> Dict[str, Tuple[str, ...]]:
+    return {skill: COMMON_SKILL_ALIASES.get(skill, ()) for skill in COMMON_SKILLS}
+
+
+def compile_skill_aliases(skills: Mapping[str, Iterable[str]]) -> Dict[str, str]:
+    """Map every normalized spelling of ``{canonical: [alias, ...]}``, canonical names included, to its skill.
+
+    Raises ``ValueError`` when one alias points at two different skills.
+    """
+
+    aliases: Dict[str, str] = {}
+    for canonical, spellings in skills.items():
+        name = normalize_skill(canonical)
+        if not name:
+            continue
+        for spelling in (canonical, *spellings):
+            alias = normalize_skill(spelling)
+            if not alias:
+                continue
+            existing = aliases.get(alias)
+            if existing is not None and existing != name:
+                raise ValueError(f"Skill alias '{alias}' maps to both '{existing}' and '{name}'.")
+            aliases[alias] = name
+    return aliases
+
+
+def read_skill_taxonomy_file(path: str) -> Tuple[str, Dict[str, Iterable[str]]]:
+    """Read a JSON taxonomy file and return ``(version, {canonical: [alias, ...]})``.
+
+    The file holds ``{"version": "...", "skills": {"kubernetes": ["k8s"], ...}}``;
+    ``skills`` may also be a plain list of canonical names, and without a
+    ``version`` a digest of the file is used.
+    """
+
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    document = json.loads(raw)
+
+    skills = document.get("skills") if isinstance(document, dict) else None
+    if isinstance(skills, list):
+        skills = {name: () for name in skills}
+    if not isinstance(skills, dict):
+        raise ValueError(f"{path} must contain a 'skills' object or list.")
+
+    version = document.get("version")
+    if version is None:
+        version = f"file-{hashlib.sha256(raw).hexdigest()[:16]}"
+    return str(version), skills
+
+
+@lru_cache(maxsize=4)
+def _file_skill_aliases(path: str, _modified_ns: int) -> Mapping[str, str]:
+    return compile_skill_aliases(read_skill_taxonomy_file(path)[1])
+
+
+@lru_cache(maxsize=1)
+def _builtin_skill_aliases() -> Mapping[str, str]:
+    return compile_skill_aliases(builtin_skills())
+
+
+def skill_aliases_from_env() -> Mapping[str, str]:
+    """Alias map of the taxonomy resume-reader is configured with.
+
+    Reads the file named by RESUME_READER_SKILL_TAXONOMY_PATH, or the
+    built-in vocabulary without one. The file is re-read when it changes, so
+    a taxonomy reloaded in resume-reader is picked up here as well. The
+    returned mapping is shared; do not modify it.
+    """
+
+    path = os.getenv(SKILL_TAXONOMY_PATH_ENV)
+    if not path:
+        return _builtin_skill_aliases()
+    return _file_skill_aliases(path, os.stat(path).st_mtime_ns)
+
+
+def canonicalize_skill(term: str, aliases: Mapping[str, str]) -> str:
+    """Canonical name for ``term``; unknown terms come back normalized."""
+
+    normalized = normalize_skill(term)
+    return aliases.get(normalized, normalized)
+
+
+__all__ = [
+    "COMMON_SKILLS",
+    "COMMON_SKILL_ALIASES",
+    "SKILL_TAXONOMY_PATH_ENV",
+    "builtin_skills",
+    "canonicalize_skill",
+    "compile_skill_aliases",
+    "normalize_skill",
+    "read_skill_taxonomy_file",
+    "skill_aliases_from_env",
+]
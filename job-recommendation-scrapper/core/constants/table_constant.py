@@ -3,5 +3,9 @@
 
 class TableConstant:
     JOB_LISTINGS = "job_listings"
+    JOB_MASTER = "job_master"
+    JOB_NORMALIZATION_CHECKPOINT = "job_normalization_checkpoint"
+    JOB_RAW_CONTENT = "job_raw_content"
     JOB_RAW_SCRAPE = "job_raw_scrape"
     JOB_SOURCE = "job_source"
+    JOB_URL_VALIDATOR = "job_url_validator"
@@ -0,0 +1,30 @@
+"""SQLAlchemy model for job_master rows written by the normalizer."""
+
+from sqlalchemy import BigInteger, Column, DateTime, Numeric, String, Text, UniqueConstraint
+
+from core.baseEntity.baseEntity import BaseEntity
+from core.constants.table_constant import TableConstant
+
+
+class JobMasterEntity(BaseEntity):
+    """Normalized job posting; the table is owned by the admin dashboard schema."""
+
+    __tablename__ = TableConstant.JOB_MASTER
+    __table_args__ = (
+        UniqueConstraint("source_id", "external_job_id", name="uq_job_master_source_external"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    external_job_id = Column(String(255), nullable=True)
+    job_url = Column(Text, nullable=False)
+    source_id = Column(BigInteger, nullable=False)
+    title = Column(String(255), nullable=False)
+    # References company_master, which the scrapper does not map.
+    company_id = Column(BigInteger, nullable=True)
+    location = Column(String(255), nullable=True)
+    employment_type = Column(BigInteger, nullable=True)
+    experience_required = Column(String(255), nullable=True)
+    salary_min = Column(Numeric(15, 2), nullable=True)
+    salary_max = Column(Numeric(15, 2), nullable=True)
+    job_description = Column(Text, nullable=True)
+    posted_date = Column(DateTime, nullable=True)
@@ -0,0 +1,16 @@
+"""SQLAlchemy model for job_normalization_checkpoint rows."""
+
+from sqlalchemy import BigInteger, Column, String
+
+from core.baseEntity.baseEntity import BaseEntity
+from core.constants.table_constant import TableConstant
+
+
+class JobNormalizationCheckpointEntity(BaseEntity):
+    """High-water mark: the last job_raw_scrape id a normalization pipeline has processed."""
+
+    __tablename__ = TableConstant.JOB_NORMALIZATION_CHECKPOINT
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    pipeline_name = Column(String(64), nullable=False, unique=True)
+    last_raw_scrape_id = Column(BigInteger, nullable=False, default=0)
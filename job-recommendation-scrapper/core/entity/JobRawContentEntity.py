@@ -0,0 +1,25 @@
+"""SQLAlchemy model for job_raw_content rows."""
+
+from sqlalchemy import CHAR, BigInteger, Column, LargeBinary, String
+from sqlalchemy.dialects.mysql import LONGBLOB
+
+from core.baseEntity.baseEntity import BaseEntity
+from core.constants.table_constant import TableConstant
+from core.util.raw_content import CODEC_ZLIB, decompress_payload
+
+
+class JobRawContentEntity(BaseEntity):
+    """One compressed scrape payload, stored once per distinct content hash."""
+
+    __tablename__ = TableConstant.JOB_RAW_CONTENT
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    content_hash = Column(CHAR(64), nullable=False, unique=True)
+    codec = Column(String(16), nullable=False, default=CODEC_ZLIB)
+    raw_size = Column(BigInteger, nullable=False)
+    stored_size = Column(BigInteger, nullable=False)
+    content = Column(LargeBinary().with_variant(LONGBLOB(), "mysql"), nullable=False)
+
+    @property
+    def text(self) -> str:
+        return decompress_payload(self.content, self.codec)
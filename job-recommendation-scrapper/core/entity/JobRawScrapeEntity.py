@@ -1,16 +1,30 @@
 """SQLAlchemy model definition for job_raw_scrape rows."""
 
-from sqlalchemy import BigInteger, Column, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from typing import Optional
+
+from sqlalchemy import CHAR, BigInteger, Column, ForeignKey, Index, Text
+from sqlalchemy.orm import deferred, relationship
 
 from core.baseEntity.baseEntity import BaseEntity
 from core.constants.table_constant import TableConstant
+from core.util.url_hash import job_url_hash
+
+
+def _default_job_url_hash(context) -> str:
+    # A context-sensitive default also covers multi-row Core/bulk inserts,
+    # which skip ORM events.
+    return job_url_hash(context.get_current_parameters()["job_url"])
 
 
 class JobRawScrapeEntity(BaseEntity):
     """Captures the raw content fetched for a job posting."""
 
     __tablename__ = TableConstant.JOB_RAW_SCRAPE
+    __table_args__ = (
+        Index("idx_job_raw_scrape_url_hash_status_time", "job_url_hash", "status", "loggedInTime"),
+        Index("idx_job_raw_scrape_time", "loggedInTime"),
+        Index("idx_job_raw_scrape_source_time", "source_id", "loggedInTime"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     source_id = Column(
@@ -19,13 +33,30 @@ class JobRawScrapeEntity(BaseEntity):
         nullable=False,
     )
     job_url = Column(Text, nullable=False)
-    raw_content = Column(Text, nullable=True)
+    job_url_hash = Column(CHAR(64), nullable=True, default=_default_job_url_hash)
+    # Legacy inline payload; new rows reference job_raw_content instead.
+    # Deferred so loading a scrape never drags the payload along.
+    raw_content = deferred(Column(Text, nullable=True))
+    content_hash = Column(
+        CHAR(64),
+        ForeignKey(f"{TableConstant.JOB_RAW_CONTENT}.content_hash", name="fk_job_raw_scrape_content"),
+        nullable=True,
+    )
     status = Column(BigInteger, nullable=True)
     error_message = Column(Text, nullable=True)
 
     source = relationship(
         "JobSourceEntity",
-        lazy="joined",
+        lazy="select",
         backref="raw_scrapes",
     )
+    content = relationship("JobRawContentEntity", lazy="select")
+
+    @property
+    def payload(self) -> Optional[str]:
+        """The scraped payload, decompressed from job_raw_content or read from the legacy column."""
+
+        if self.content_hash is not None and self.content is not None:
+            return self.content.text
+        return self.raw_content
 
@@ -0,0 +1,26 @@
+"""SQLAlchemy model for job_url_validator rows."""
+
+from sqlalchemy import CHAR, BigInteger, Column, DateTime, ForeignKey, Integer, String, Text
+
+from core.baseEntity.baseEntity import BaseEntity
+from core.constants.table_constant import TableConstant
+
+
+class JobUrlValidatorEntity(BaseEntity):
+    """Cache validators from the most recent fetch of a job URL."""
+
+    __tablename__ = TableConstant.JOB_URL_VALIDATOR
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_url_hash = Column(CHAR(64), nullable=False, unique=True)
+    job_url = Column(Text, nullable=False)
+    source_id = Column(
+        BigInteger,
+        ForeignKey(f"{TableConstant.JOB_SOURCE}.id", name="fk_job_url_validator_source"),
+        nullable=False,
+    )
+    etag = Column(String(512), nullable=True)
+    last_modified = Column(String(64), nullable=True)
+    content_hash = Column(CHAR(64), nullable=True)
+    last_status_code = Column(Integer, nullable=True)
+    last_checked_time = Column(DateTime, nullable=True)
@@ -0,0 +1,90 @@
+"""Repository helpers for the job_master table."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from core.entity.JobMasterEntity import JobMasterEntity
+
+# Columns refreshed when a (source_id, external_job_id) pair is seen again.
+_UPDATABLE_COLUMNS = (
+    "job_url",
+    "title",
+    "location",
+    "employment_type",
+    "experience_required",
+    "salary_min",
+    "salary_max",
+    "job_description",
+    "posted_date",
+)
+
+
+class JobMasterRepository:
+    """Reads and bulk-upserts normalized jobs.
+
+    Writes join the caller's transaction and never commit on their own.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_external_id(self, *, source_id: int, external_job_id: str) -> Optional[JobMasterEntity]:
+        return (
+            self.db.query(JobMasterEntity)
+            .filter(JobMasterEntity.source_id == source_id)
+            .filter(JobMasterEntity.external_job_id == external_job_id)
+            .first()
+        )
+
+    def upsert_many(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """Insert or refresh jobs keyed by (source_id, external_job_id); returns the rows sent.
+
+        When the same key appears more than once, the last row wins. On MySQL
+        this is one ``INSERT ... ON DUPLICATE KEY UPDATE`` for the whole batch.
+        """
+
+        latest: Dict[tuple, Dict[str, Any]] = {}
+        for row in rows:
+            latest[(row["source_id"], row["external_job_id"])] = row
+        values: List[Dict[str, Any]] = list(latest.values())
+        if not values:
+            return 0
+        table = JobMasterEntity.__table__
+
+        if self.db.get_bind().dialect.name == "mysql":
+            statement = mysql_insert(table)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in _UPDATABLE_COLUMNS}
+            )
+            self.db.connection().execute(statement, values)
+            return len(values)
+
+        # Portable fallback: update what exists, insert the rest.
+        existing = {
+            (source_id, external_job_id)
+            for source_id, external_job_id in self.db.execute(
+                select(table.c.source_id, table.c.external_job_id).where(
+                    table.c.source_id.in_({value["source_id"] for value in values}),
+                    table.c.external_job_id.in_({value["external_job_id"] for value in values}),
+                )
+            ).all()
+        }
+        inserts = []
+        for value in values:
+            if (value["source_id"], value["external_job_id"]) in existing:
+                self.db.execute(
+                    update(table)
+                    .where(
+                        table.c.source_id == value["source_id"],
+                        table.c.external_job_id == value["external_job_id"],
+                    )
+                    .values(**{column: value.get(column) for column in _UPDATABLE_COLUMNS})
+                )
+            else:
+                inserts.append(value)
+        if inserts:
+            self.db.connection().execute(table.insert(), inserts)
+        return len(values)
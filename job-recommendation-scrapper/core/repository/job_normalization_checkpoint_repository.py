@@ -0,0 +1,36 @@
+"""Repository helpers for the job_normalization_checkpoint table."""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.entity.JobNormalizationCheckpointEntity import JobNormalizationCheckpointEntity
+
+
+class JobNormalizationCheckpointRepository:
+    """High-water marks for normalization pipelines.
+
+    Writes join the caller's transaction and never commit on their own, so a
+    mark only moves together with the rows it accounts for.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def lock(self, pipeline_name: str) -> JobNormalizationCheckpointEntity:
+        """The checkpoint row for ``pipeline_name``, created on first use and locked FOR UPDATE.
+
+        The lock keeps two runs of the same pipeline from processing one
+        range twice; it is released when the caller's transaction ends.
+        """
+
+        query = (
+            select(JobNormalizationCheckpointEntity)
+            .where(JobNormalizationCheckpointEntity.pipeline_name == pipeline_name)
+            .with_for_update()
+        )
+        checkpoint = self.db.execute(query).scalar_one_or_none()
+        if checkpoint is None:
+            checkpoint = JobNormalizationCheckpointEntity(pipeline_name=pipeline_name, last_raw_scrape_id=0)
+            self.db.add(checkpoint)
+            self.db.flush()
+        return checkpoint
@@ -0,0 +1,75 @@
+"""Repository helpers for the job_raw_content table."""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from core.entity.JobRawContentEntity import JobRawContentEntity
+from core.util.raw_content import compress_payload, payload_hash
+
+
+class JobRawContentRepository:
+    """Content-addressed storage for compressed scrape payloads.
+
+    Writes join the caller's transaction and never commit on their own, so a
+    scrape row and the payload it references are stored together.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_hash(self, content_hash: str) -> Optional[JobRawContentEntity]:
+        return (
+            self.db.query(JobRawContentEntity)
+            .filter(JobRawContentEntity.content_hash == content_hash)
+            .first()
+        )
+
+    def store_payloads(self, payloads: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """Store each distinct payload once and return the content hash for every input.
+
+        ``None`` payloads map to ``None``. Payloads already stored are found
+        with one query and only the missing ones are compressed. On MySQL a
+        duplicate key is a no-op update, so concurrent writers of the same
+        payload do not conflict while every other error still surfaces.
+        """
+
+        payloads = list(payloads)
+        hashes: List[Optional[str]] = [None if payload is None else payload_hash(payload) for payload in payloads]
+        pending: Dict[str, str] = {
+            content_hash: payload
+            for content_hash, payload in zip(hashes, payloads)
+            if content_hash is not None
+        }
+        if not pending:
+            return hashes
+
+        existing = self.db.execute(
+            select(JobRawContentEntity.content_hash).where(JobRawContentEntity.content_hash.in_(list(pending)))
+        ).scalars()
+        for content_hash in existing:
+            pending.pop(content_hash, None)
+
+        if pending:
+            rows = []
+            for content_hash, payload in pending.items():
+                codec, compressed = compress_payload(payload)
+                rows.append(
+                    {
+                        "content_hash": content_hash,
+                        "codec": codec,
+                        "raw_size": len(payload.encode("utf-8")),
+                        "stored_size": len(compressed),
+                        "content": compressed,
+                    }
+                )
+            table = JobRawContentEntity.__table__
+            if self.db.get_bind().dialect.name == "mysql":
+                statement = mysql_insert(table)
+                statement = statement.on_duplicate_key_update(content_hash=statement.inserted.content_hash)
+            else:
+                statement = insert(table)
+            self.db.connection().execute(statement, rows)
+        return hashes
@@ -1,11 +1,15 @@
 """Repository helpers for the job_raw_scrape table."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload, undefer
 
 from core.entity.JobRawScrapeEntity import JobRawScrapeEntity
 from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.repository.job_raw_content_repository import JobRawContentRepository
+from core.util.url_hash import job_url_hash
 
 
 class JobRawScrapeRepository:
@@ -13,20 +17,68 @@ class JobRawScrapeRepository:
 
     def __init__(self, db_session: Session):
         self.db = db_session
+        self.contents = JobRawContentRepository(db_session)
 
     def create(self, scrape: JobRawScrapeEntity) -> JobRawScrapeEntity:
+        if scrape.raw_content is not None:
+            scrape.content_hash = self.contents.store_payloads([scrape.raw_content])[0]
+            scrape.raw_content = None
         self.db.add(scrape)
         self.db.commit()
         self.db.refresh(scrape)
         return scrape
 
+    def bulk_create(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """Insert ``rows`` (column -> value dicts) in one multi-row statement and commit.
+
+        ``raw_content`` values are moved into job_raw_content first, so the
+        chunk's payloads are deduplicated and compressed in the same
+        transaction; a row without a payload keeps any ``content_hash`` it
+        already names. Nothing is refreshed, so ids are not returned; callers
+        that need a row back should use :meth:`create`.
+        """
+
+        if not rows:
+            return 0
+        try:
+            hashes = self.contents.store_payloads(row.get("raw_content") for row in rows)
+            rows = [
+                {**row, "raw_content": None, "content_hash": content_hash or row.get("content_hash")}
+                for row, content_hash in zip(rows, hashes)
+            ]
+            self.db.execute(insert(JobRawScrapeEntity), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(rows)
+
     def fetch_latest_by_url(
         self,
         job_url: str,
         *,
         only_successful: bool = False,
     ) -> Optional[JobRawScrapeEntity]:
-        query = self.db.query(JobRawScrapeEntity).filter(JobRawScrapeEntity.job_url == job_url)
+        # The hash narrows the search through idx_job_raw_scrape_url_hash_status_time;
+        # comparing job_url as well guards against hash collisions.
+        scrape = self._latest_matching(
+            job_url,
+            JobRawScrapeEntity.job_url_hash == job_url_hash(job_url),
+            only_successful=only_successful,
+        )
+        if scrape is None:
+            # Rows written before the hash column existed keep a NULL hash until
+            # web.backfill_job_url_hash has run; every newer row is hashed, so
+            # a legacy row can only be the latest when the hash finds nothing.
+            scrape = self._latest_matching(
+                job_url,
+                JobRawScrapeEntity.job_url_hash.is_(None),
+                only_successful=only_successful,
+            )
+        return scrape
+
+    def _latest_matching(self, job_url: str, hash_filter, *, only_successful: bool) -> Optional[JobRawScrapeEntity]:
+        query = self.db.query(JobRawScrapeEntity).filter(hash_filter, JobRawScrapeEntity.job_url == job_url)
         if only_successful:
             query = query.filter(JobRawScrapeEntity.status == JobRawScrapeStatus.SUCCESS.value)
         query = query.order_by(JobRawScrapeEntity.loggedInTime.desc())
@@ -34,3 +86,114 @@ class JobRawScrapeRepository:
 
     def fetch_latest_successful_by_url(self, job_url: str) -> Optional[JobRawScrapeEntity]:
         return self.fetch_latest_by_url(job_url, only_successful=True)
+
+    def last_scraped_at_by_source(self, source_ids: Iterable[int]) -> Dict[int, datetime]:
+        """Most recent loggedInTime per source, read from the (source_id, loggedInTime) index."""
+
+        wanted = list(set(source_ids))
+        if not wanted:
+            return {}
+        rows = self.db.execute(
+            select(JobRawScrapeEntity.source_id, func.max(JobRawScrapeEntity.loggedInTime))
+            .where(JobRawScrapeEntity.source_id.in_(wanted))
+            .group_by(JobRawScrapeEntity.source_id)
+        ).all()
+        return {source_id: last_scraped for source_id, last_scraped in rows}
+
+    def list_page(
+        self,
+        *,
+        source_ids: Optional[Sequence[int]] = None,
+        statuses: Optional[Sequence[int]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        include_content: bool = False,
+    ) -> List[JobRawScrapeEntity]:
+        """One page of scrapes, newest first, ordered by (loggedInTime, id).
+
+        ``after`` is the (loggedInTime, id) of the last row of the previous
+        page; the next page starts strictly below it, so paging costs the same
+        at any depth. Payloads are only loaded with ``include_content``, and
+        the source is never joined.
+        """
+
+        query = self.db.query(JobRawScrapeEntity)
+        if source_ids:
+            query = query.filter(JobRawScrapeEntity.source_id.in_(list(source_ids)))
+        if statuses:
+            query = query.filter(JobRawScrapeEntity.status.in_(list(statuses)))
+        if since is not None:
+            query = query.filter(JobRawScrapeEntity.loggedInTime >= since)
+        if until is not None:
+            query = query.filter(JobRawScrapeEntity.loggedInTime < until)
+        if after is not None:
+            after_time, after_id = after
+            # MySQL does not range-scan on a row comparison, so the same bound
+            # is spelled out with a plain upper limit on loggedInTime the
+            # optimizer can seek the (loggedInTime) indexes with.
+            query = query.filter(
+                JobRawScrapeEntity.loggedInTime <= after_time,
+                or_(JobRawScrapeEntity.loggedInTime < after_time, JobRawScrapeEntity.id < after_id),
+            )
+        if include_content:
+            query = query.options(undefer(JobRawScrapeEntity.raw_content), selectinload(JobRawScrapeEntity.content))
+        return (
+            query.order_by(JobRawScrapeEntity.loggedInTime.desc(), JobRawScrapeEntity.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def list_after_id(
+        self,
+        after_id: int,
+        *,
+        statuses: Optional[Sequence[int]] = None,
+        limit: int = 500,
+    ) -> List[JobRawScrapeEntity]:
+        """Up to ``limit`` scrapes with an id above ``after_id``, oldest first, payloads loaded.
+
+        Walks the primary key, so each call costs the same however far the
+        caller has progressed.
+        """
+
+        query = self.db.query(JobRawScrapeEntity).filter(JobRawScrapeEntity.id > after_id)
+        if statuses:
+            query = query.filter(JobRawScrapeEntity.status.in_(list(statuses)))
+        return (
+            query.options(undefer(JobRawScrapeEntity.raw_content), selectinload(JobRawScrapeEntity.content))
+            .order_by(JobRawScrapeEntity.id)
+            .limit(limit)
+            .all()
+        )
+
+    def backfill_url_hashes(self, batch_size: int = 5000) -> int:
+        """Fill ``job_url_hash`` for one batch of rows that lack it; returns the rows updated.
+
+        Call repeatedly until it returns 0. Each batch walks the primary key
+        and commits on its own, so locks stay short on large tables.
+        """
+
+        rows = self.db.execute(
+            select(JobRawScrapeEntity.id, JobRawScrapeEntity.job_url)
+            .where(JobRawScrapeEntity.job_url_hash.is_(None))
+            .order_by(JobRawScrapeEntity.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return 0
+
+        table = JobRawScrapeEntity.__table__
+        try:
+            self.db.connection().execute(
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(job_url_hash=bindparam("url_hash")),
+                [{"row_id": row.id, "url_hash": job_url_hash(row.job_url)} for row in rows],
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(rows)
@@ -1,6 +1,6 @@
 """Repository helpers for job_source rows."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from sqlalchemy.orm import Session
 
@@ -29,6 +29,15 @@ class JobSourceRepository:
     def find_by_id(self, source_id: int) -> Optional[JobSourceEntity]:
         return self._session.get(JobSourceEntity, source_id)
 
+    def find_existing_ids(self, source_ids: Iterable[int]) -> Set[int]:
+        """Return the subset of ``source_ids`` that exist, in a single query."""
+
+        wanted = set(source_ids)
+        if not wanted:
+            return set()
+        rows = self._session.query(JobSourceEntity.id).filter(JobSourceEntity.id.in_(wanted)).all()
+        return {row.id for row in rows}
+
     def find_by_name(self, source_name: JobSourceName) -> Optional[JobSourceEntity]:
         query = self._session.query(JobSourceEntity).filter(
             JobSourceEntity.source_name == int(source_name)
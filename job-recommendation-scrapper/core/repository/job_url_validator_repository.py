@@ -0,0 +1,71 @@
+"""Repository helpers for the job_url_validator table."""
+
+from typing import Any, Dict, Iterable, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from core.entity.JobUrlValidatorEntity import JobUrlValidatorEntity
+from core.util.url_hash import job_url_hash
+
+_UPDATABLE_COLUMNS = (
+    "job_url",
+    "source_id",
+    "etag",
+    "last_modified",
+    "content_hash",
+    "last_status_code",
+    "last_checked_time",
+)
+
+
+class JobUrlValidatorRepository:
+    """Reads and upserts per-URL cache validators.
+
+    Writes join the caller's transaction and never commit on their own.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_urls(self, job_urls: Iterable[str]) -> Dict[str, JobUrlValidatorEntity]:
+        """Validators for ``job_urls`` keyed by URL, fetched with one indexed query."""
+
+        by_hash = {job_url_hash(url): url for url in job_urls}
+        if not by_hash:
+            return {}
+        rows = self.db.execute(
+            select(JobUrlValidatorEntity).where(JobUrlValidatorEntity.job_url_hash.in_(list(by_hash)))
+        ).scalars()
+        return {by_hash[row.job_url_hash]: row for row in rows if row.job_url_hash in by_hash}
+
+    def upsert_many(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Insert or refresh one validator per row; each row needs at least job_url and source_id."""
+
+        if not rows:
+            return
+        values = [{**row, "job_url_hash": job_url_hash(row["job_url"])} for row in rows]
+        table = JobUrlValidatorEntity.__table__
+
+        if self.db.get_bind().dialect.name == "mysql":
+            statement = mysql_insert(table)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in _UPDATABLE_COLUMNS if column in values[0]}
+            )
+            self.db.connection().execute(statement, values)
+            return
+
+        # Portable fallback: update what exists, insert the rest.
+        existing = set(
+            self.db.execute(
+                select(table.c.job_url_hash).where(table.c.job_url_hash.in_([value["job_url_hash"] for value in values]))
+            ).scalars()
+        )
+        for value in values:
+            if value["job_url_hash"] in existing:
+                changes = {column: value[column] for column in _UPDATABLE_COLUMNS if column in value}
+                self.db.execute(update(table).where(table.c.job_url_hash == value["job_url_hash"]).values(**changes))
+            else:
+                self.db.connection().execute(table.insert(), [value])
+                existing.add(value["job_url_hash"])
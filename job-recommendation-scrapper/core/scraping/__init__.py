@@ -0,0 +1,32 @@
+from .engine import FetchTask, ScrapeEngine, ScrapeEngineConfig, ScrapeRunStats, build_fetch_task
+from .job_parser import parse_job_payload
+from .normalizer import JOB_MASTER_PIPELINE, JobNormalizer, JobNormalizerConfig, NormalizeRunStats
+from .rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    SourceRateLimiter,
+    parse_rate_limit,
+)
+from .schedule import SCHEDULE_INTERVALS, due_sources, schedule_interval
+
+__all__ = [
+    "FetchTask",
+    "InMemoryRateLimitBackend",
+    "JOB_MASTER_PIPELINE",
+    "JobNormalizer",
+    "JobNormalizerConfig",
+    "NormalizeRunStats",
+    "RateLimitBackend",
+    "RedisRateLimitBackend",
+    "SCHEDULE_INTERVALS",
+    "ScrapeEngine",
+    "ScrapeEngineConfig",
+    "ScrapeRunStats",
+    "SourceRateLimiter",
+    "build_fetch_task",
+    "due_sources",
+    "parse_job_payload",
+    "parse_rate_limit",
+    "schedule_interval",
+]
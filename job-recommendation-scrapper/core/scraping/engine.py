@@ -0,0 +1,356 @@
+"""Asyncio scrape engine: fetch due sources and store the raw results in batches."""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+
+from core.entity.JobSourceEntity import JobSourceEntity
+from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.enums.scrape_type import ScrapeType
+from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
+from core.repository.job_source_repository import JobSourceRepository
+from core.repository.job_url_validator_repository import JobUrlValidatorRepository
+from core.util.raw_content import payload_hash
+
+from .rate_limit import SourceRateLimiter, parse_rate_limit
+from .schedule import due_sources
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the fetch stage on the results queue.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class ScrapeEngineConfig:
+    """Settings for one scrape engine process."""
+
+    concurrency: int = 8
+    queue_size: int = 500
+    batch_size: int = 200
+    flush_interval_seconds: float = 2.0
+    request_timeout_seconds: float = 30.0
+    poll_interval_seconds: float = 300.0
+    user_agent: str = "job-recommendation-scrapper/1.0"
+
+    @classmethod
+    def from_env(cls) -> "ScrapeEngineConfig":
+        return cls(
+            concurrency=max(1, int(os.getenv("SCRAPPER_ENGINE_CONCURRENCY") or 8)),
+            queue_size=max(1, int(os.getenv("SCRAPPER_ENGINE_QUEUE_SIZE") or 500)),
+            batch_size=max(1, int(os.getenv("SCRAPPER_ENGINE_BATCH_SIZE") or 200)),
+            flush_interval_seconds=float(os.getenv("SCRAPPER_ENGINE_FLUSH_INTERVAL_SECONDS") or 2),
+            request_timeout_seconds=float(os.getenv("SCRAPPER_ENGINE_REQUEST_TIMEOUT_SECONDS") or 30),
+            poll_interval_seconds=float(os.getenv("SCRAPPER_ENGINE_POLL_INTERVAL_SECONDS") or 300),
+            user_agent=os.getenv("SCRAPPER_ENGINE_USER_AGENT") or "job-recommendation-scrapper/1.0",
+        )
+
+
+@dataclass(frozen=True)
+class FetchTask:
+    source_id: int
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    rate_per_minute: Optional[float] = None
+    # Validators and payload hash from the previous fetch of ``url``, if any.
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+
+@dataclass
+class ScrapeRunStats:
+    sources_due: int = 0
+    # Due sources left out because their rate limit could not be parsed.
+    skipped: int = 0
+    fetched: int = 0
+    succeeded: int = 0
+    # Fetches answered 304, or 200 with the payload stored last time.
+    unchanged: int = 0
+    failed: int = 0
+    written: int = 0
+    write_failed: int = 0
+
+
+def build_fetch_task(source: JobSourceEntity) -> Optional[FetchTask]:
+    """What to request for ``source``: its API endpoint for API sources, otherwise its page URL.
+
+    Raises ``ValueError`` when the source's rate limit is not a valid value.
+    """
+
+    headers: Dict[str, str] = {}
+    url = source.source_url
+    if source.scrape_type is not None and int(source.scrape_type) == ScrapeType.API:
+        url = source.api_endpoint or source.source_url
+        headers["Accept"] = "application/json"
+        if source.api_key:
+            headers["Authorization"] = f"Bearer {source.api_key}"
+    if not url:
+        return None
+    return FetchTask(
+        source_id=source.id,
+        url=url.strip(),
+        headers=headers,
+        rate_per_minute=parse_rate_limit(source.rate_limit_per_min),
+    )
+
+
+class ScrapeEngine:
+    """Fetches due sources over a pooled HTTP client and stores the results in batches.
+
+    A run has two stages joined by a bounded queue: up to ``concurrency``
+    fetchers share one ``httpx.AsyncClient`` connection pool, and a single
+    writer drains the queue into multi-row inserts of up to ``batch_size``
+    rows (or whatever has arrived after ``flush_interval_seconds``). When
+    the database falls behind, the queue fills and fetchers wait, so fetch
+    speed never outruns the writes.
+
+    Every request first waits on ``rate_limiter`` for its source, so a
+    source's ``rate_limit_per_min`` holds across all fetchers (and, with a
+    shared backend, across processes). Job URLs fetched before are
+    requested conditionally with the ETag / Last-Modified stored in
+    job_url_validator. ``transport`` is handed to the HTTP
+    client; pass an ``httpx.MockTransport`` or similar to run the engine
+    without a network.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        config: Optional[ScrapeEngineConfig] = None,
+        *,
+        rate_limiter: Optional[SourceRateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._session_factory = session_factory
+        self._config = config or ScrapeEngineConfig()
+        self._rate_limiter = rate_limiter or SourceRateLimiter()
+        self._transport = transport
+
+    @property
+    def config(self) -> ScrapeEngineConfig:
+        return self._config
+
+    def _load_due_tasks(self, now: datetime) -> Tuple[List[FetchTask], int]:
+        with self._session_factory() as session:
+            sources = JobSourceRepository(session).list_sources(only_enabled=True)
+            last_scraped = JobRawScrapeRepository(session).last_scraped_at_by_source(
+                source.id for source in sources
+            )
+            tasks: List[FetchTask] = []
+            skipped = 0
+            for source in due_sources(sources, last_scraped, now):
+                try:
+                    task = build_fetch_task(source)
+                except ValueError:
+                    # Never scrape a source whose limit cannot be honoured.
+                    skipped += 1
+                    continue
+                if task is not None:
+                    tasks.append(task)
+            validators = JobUrlValidatorRepository(session).find_by_urls(task.url for task in tasks)
+        tasks = [self._with_validator(task, validators.get(task.url)) for task in tasks]
+        return tasks, skipped
+
+    @staticmethod
+    def _with_validator(task: FetchTask, validator) -> FetchTask:
+        if validator is None:
+            return task
+        return replace(
+            task,
+            etag=validator.etag,
+            last_modified=validator.last_modified,
+            content_hash=validator.content_hash,
+        )
+
+    def _store_batch(self, batch: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> None:
+        with self._session_factory() as session:
+            # Validators are flushed first and committed together with the scrape rows.
+            JobUrlValidatorRepository(session).upsert_many(
+                [validator for _, validator in batch if validator is not None]
+            )
+            JobRawScrapeRepository(session).bulk_create([row for row, _ in batch])
+
+    async def run_once(self, now: Optional[datetime] = None) -> ScrapeRunStats:
+        """Scrape every source that is due at ``now`` (UTC, default the current time) once."""
+
+        tasks, skipped = await asyncio.to_thread(self._load_due_tasks, now or datetime.utcnow())
+        stats = await self.run_tasks(tasks)
+        stats.skipped = skipped
+        return stats
+
+    async def run_tasks(self, tasks: List[FetchTask]) -> ScrapeRunStats:
+        stats = ScrapeRunStats(sources_due=len(tasks))
+        if not tasks:
+            return stats
+
+        pending: "asyncio.Queue[FetchTask]" = asyncio.Queue()
+        for task in tasks:
+            pending.put_nowait(task)
+        results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self._config.queue_size)
+
+        concurrency = min(self._config.concurrency, len(tasks))
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            timeout=self._config.request_timeout_seconds,
+            headers={"User-Agent": self._config.user_agent},
+            follow_redirects=True,
+            transport=self._transport,
+        ) as client:
+            writer = asyncio.create_task(self._write_results(results, stats))
+            fetchers = [
+                asyncio.create_task(self._fetch_worker(client, pending, results, stats))
+                for _ in range(concurrency)
+            ]
+            try:
+                await asyncio.gather(*fetchers)
+                await results.put(_DONE)
+                await writer
+            finally:
+                for worker in (*fetchers, writer):
+                    worker.cancel()
+        return stats
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                await self.run_once()
+            except Exception:  # noqa: BLE001
+                # One bad run (database down, unexpected bug) must not stop the worker.
+                logger.exception("Scrape run failed; retrying after the poll interval")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self._config.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fetch_worker(
+        self,
+        client: httpx.AsyncClient,
+        pending: "asyncio.Queue[FetchTask]",
+        results: "asyncio.Queue[Any]",
+        stats: ScrapeRunStats,
+    ) -> None:
+        while True:
+            try:
+                task = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            row, validator = await self._fetch(client, task)
+            stats.fetched += 1
+            if row["status"] == int(JobRawScrapeStatus.SUCCESS):
+                stats.succeeded += 1
+            elif row["status"] == int(JobRawScrapeStatus.UNCHANGED):
+                stats.unchanged += 1
+            else:
+                stats.failed += 1
+            await results.put((row, validator))
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, task: FetchTask
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Fetch ``task`` and return its scrape row plus the validator update, if there is one.
+
+        The request carries If-None-Match / If-Modified-Since from the last
+        fetch. A 304, or a 200 whose payload hashes to the stored one, is
+        recorded as UNCHANGED pointing at the existing content, so nothing
+        new is stored. Any failure, including a malformed URL, becomes an
+        ERROR row so one bad source never aborts the run.
+        """
+
+        row: Dict[str, Any] = {"source_id": task.source_id, "job_url": task.url, "raw_content": None}
+        try:
+            return await self._fetch_once(client, task, row)
+        except Exception as exc:  # noqa: BLE001
+            row.update(
+                raw_content=None,
+                status=int(JobRawScrapeStatus.ERROR),
+                error_message=str(exc) or type(exc).__name__,
+            )
+            return row, None
+
+    async def _fetch_once(
+        self, client: httpx.AsyncClient, task: FetchTask, row: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        headers = dict(task.headers)
+        # Only ask for a 304 when there is a stored payload it could refer to.
+        if task.content_hash and task.etag:
+            headers["If-None-Match"] = task.etag
+        if task.content_hash and task.last_modified:
+            headers["If-Modified-Since"] = task.last_modified
+
+        await self._rate_limiter.acquire(task.source_id, task.rate_per_minute)
+        response = await client.get(task.url, headers=headers)
+
+        validator: Dict[str, Any] = {
+            "job_url": task.url,
+            "source_id": task.source_id,
+            "etag": response.headers.get("ETag") or task.etag,
+            "last_modified": response.headers.get("Last-Modified") or task.last_modified,
+            "content_hash": task.content_hash,
+            "last_status_code": response.status_code,
+            "last_checked_time": datetime.utcnow(),
+        }
+        if response.status_code == httpx.codes.NOT_MODIFIED and task.content_hash:
+            row.update(status=int(JobRawScrapeStatus.UNCHANGED), error_message=None, content_hash=task.content_hash)
+            return row, validator
+        if not response.is_success:
+            row.update(
+                raw_content=response.text,
+                status=int(JobRawScrapeStatus.ERROR),
+                error_message=f"HTTP {response.status_code}",
+            )
+            # Keep the previous validators; an error page says nothing about the resource.
+            validator.update(etag=task.etag, last_modified=task.last_modified)
+            return row, validator
+
+        body = response.text
+        content_hash = payload_hash(body)
+        validator["content_hash"] = content_hash
+        if content_hash == task.content_hash:
+            row.update(status=int(JobRawScrapeStatus.UNCHANGED), error_message=None, content_hash=content_hash)
+        else:
+            row.update(raw_content=body, status=int(JobRawScrapeStatus.SUCCESS), error_message=None)
+        return row, validator
+
+    async def _write_results(self, results: "asyncio.Queue[Any]", stats: ScrapeRunStats) -> None:
+        batch: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = []
+        while True:
+            try:
+                item = await asyncio.wait_for(results.get(), timeout=self._config.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is not None and item is not _DONE:
+                batch.append(item)
+            if batch and (item is None or item is _DONE or len(batch) >= self._config.batch_size):
+                await self._flush(batch, stats)
+                batch = []
+            if item is _DONE:
+                return
+
+    async def _flush(
+        self, batch: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]], stats: ScrapeRunStats
+    ) -> None:
+        try:
+            await asyncio.to_thread(self._store_batch, batch)
+        except Exception:  # noqa: BLE001
+            # Keep draining: a stalled writer would block every fetcher on the full queue.
+            stats.write_failed += len(batch)
+        else:
+            stats.written += len(batch)
+
+
+__all__ = [
+    "FetchTask",
+    "ScrapeEngine",
+    "ScrapeEngineConfig",
+    "ScrapeRunStats",
+    "build_fetch_task",
+]
@@ -0,0 +1,255 @@
+"""Turn raw scrape payloads into job_master field dicts."""
+
+import json
+import re
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.enums.job_employment_type import JobEmploymentType
+from core.util.url_hash import job_url_hash
+
+# Keys under which JSON APIs commonly return their list of postings.
+_LIST_KEYS = ("jobs", "results", "data", "items", "postings", "jobPostings")
+
+_ID_KEYS = ("external_job_id", "job_id", "jobId", "id", "requisition_id", "requisitionId", "reference", "identifier")
+_URL_KEYS = ("job_url", "jobUrl", "url", "absolute_url", "apply_url", "applyUrl", "link")
+_TITLE_KEYS = ("title", "job_title", "jobTitle", "name", "position")
+_LOCATION_KEYS = ("location", "jobLocation", "city", "location_name")
+_EMPLOYMENT_KEYS = ("employment_type", "employmentType", "job_type", "jobType", "type")
+_EXPERIENCE_KEYS = ("experience_required", "experience", "experienceRequirements", "experience_level")
+_DESCRIPTION_KEYS = ("job_description", "description", "descriptionPlain", "content", "summary")
+_POSTED_KEYS = ("posted_date", "datePosted", "date_posted", "posted_at", "published_at", "created_at", "createdAt")
+_SALARY_MIN_KEYS = ("salary_min", "min_salary", "salaryMin", "minSalary")
+_SALARY_MAX_KEYS = ("salary_max", "max_salary", "salaryMax", "maxSalary")
+
+_EMPLOYMENT_TYPES = {
+    "fulltime": JobEmploymentType.FULL_TIME,
+    "permanent": JobEmploymentType.FULL_TIME,
+    "contract": JobEmploymentType.CONTRACT,
+    "contractor": JobEmploymentType.CONTRACT,
+    "temporary": JobEmploymentType.CONTRACT,
+    "freelance": JobEmploymentType.FREELANCE,
+}
+
+_LD_JSON_PATTERN = re.compile(
+    r"<script[^>]+type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# VARCHAR(255) columns in job_master.
+_SHORT_TEXT_LIMIT = 255
+
+
+def parse_job_payload(payload: Optional[str], job_url: str) -> List[Dict[str, Any]]:
+    """Jobs found in one scrape of ``job_url``, as job_master column -> value dicts.
+
+    JSON payloads may hold a single posting, a list, or a list under a key
+    such as ``jobs``; HTML pages are read through their schema.org
+    ``JobPosting`` JSON-LD blocks. Postings without a title are dropped, as
+    are postings with neither an id nor a URL of their own: keying them on
+    ``job_url`` would make every posting later scraped from that page
+    overwrite the last. ``source_id`` is left to the caller.
+    """
+
+    if not payload or not payload.strip():
+        return []
+    text = payload.strip()
+    if text[0] in "[{":
+        try:
+            postings = _json_postings(json.loads(text))
+        except ValueError:
+            postings = []
+    else:
+        postings = _html_postings(text)
+
+    jobs = []
+    for posting in postings:
+        job = _normalize(posting, job_url)
+        if job is not None:
+            jobs.append(job)
+    return jobs
+
+
+def _json_postings(document: Any) -> List[Dict[str, Any]]:
+    if isinstance(document, list):
+        return [item for item in document if isinstance(item, dict)]
+    if not isinstance(document, dict):
+        return []
+    for key in _LIST_KEYS:
+        items = document.get(key)
+        if isinstance(items, list):
+            return [item for item in items if isinstance(item, dict)]
+        if isinstance(items, dict):
+            nested = _json_postings(items)
+            if nested:
+                return nested
+    return [document]
+
+
+def _html_postings(page: str) -> List[Dict[str, Any]]:
+    postings: List[Dict[str, Any]] = []
+    for block in _LD_JSON_PATTERN.findall(page):
+        try:
+            document = json.loads(block.strip())
+        except ValueError:
+            continue
+        postings.extend(_ld_job_postings(document))
+    return postings
+
+
+def _ld_job_postings(node: Any) -> Iterable[Dict[str, Any]]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _ld_job_postings(item)
+    elif isinstance(node, dict):
+        types = node.get("@type")
+        if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+            yield node
+        elif "@graph" in node:
+            yield from _ld_job_postings(node["@graph"])
+
+
+def _normalize(posting: Dict[str, Any], scrape_url: str) -> Optional[Dict[str, Any]]:
+    title = _short_text(_first(posting, _TITLE_KEYS))
+    if not title:
+        return None
+
+    own_url = _text(_first(posting, _URL_KEYS))
+    external_id = _short_text(_identifier(_first(posting, _ID_KEYS)))
+    if external_id is None:
+        if own_url is None:
+            return None
+        external_id = job_url_hash(own_url)
+
+    salary_min, salary_max = _salary_range(posting)
+    return {
+        "external_job_id": external_id,
+        "job_url": own_url or scrape_url,
+        "title": title,
+        "location": _short_text(_location(_first(posting, _LOCATION_KEYS))),
+        "employment_type": _employment_type(_first(posting, _EMPLOYMENT_KEYS)),
+        "experience_required": _short_text(_experience(_first(posting, _EXPERIENCE_KEYS))),
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "job_description": _text(_first(posting, _DESCRIPTION_KEYS)),
+        "posted_date": _datetime(_first(posting, _POSTED_KEYS)),
+    }
+
+
+def _first(posting: Dict[str, Any], keys: Iterable[str]) -> Any:
+    for key in keys:
+        value = posting.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _short_text(value: Any) -> Optional[str]:
+    text = _text(value)
+    return text[:_SHORT_TEXT_LIMIT] if text else None
+
+
+def _identifier(value: Any) -> Any:
+    # schema.org identifiers are PropertyValue objects.
+    if isinstance(value, dict):
+        return value.get("value") or value.get("name")
+    return value
+
+
+def _location(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        return _location(value[0]) if value else None
+    if isinstance(value, dict):
+        if "address" in value:
+            return _location(value["address"])
+        parts = [
+            _text(value.get(key))
+            for key in ("name", "addressLocality", "city", "addressRegion", "region", "addressCountry", "country")
+        ]
+        seen: List[str] = []
+        for part in parts:
+            if part and part not in seen:
+                seen.append(part)
+        return ", ".join(seen) or None
+    return _text(value)
+
+
+def _employment_type(value: Any) -> Optional[int]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    text = _text(value)
+    if text is None:
+        return None
+    key = re.sub(r"[^a-z]", "", text.lower())
+    employment_type = _EMPLOYMENT_TYPES.get(key)
+    return int(employment_type) if employment_type is not None else None
+
+
+def _experience(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        months = value.get("monthsOfExperience")
+        if months is not None:
+            return f"{months} months"
+        return _text(value.get("description") or value.get("name"))
+    return _text(value)
+
+
+def _salary_range(posting: Dict[str, Any]):
+    low = _decimal(_first(posting, _SALARY_MIN_KEYS))
+    high = _decimal(_first(posting, _SALARY_MAX_KEYS))
+    salary = posting.get("baseSalary", posting.get("salary"))
+    if isinstance(salary, dict):
+        amount = salary.get("value", salary)
+        if isinstance(amount, dict):
+            low = low if low is not None else _decimal(amount.get("minValue", amount.get("min", amount.get("value"))))
+            high = high if high is not None else _decimal(amount.get("maxValue", amount.get("max", amount.get("value"))))
+        else:
+            low = low if low is not None else _decimal(amount)
+            high = high if high is not None else _decimal(amount)
+    elif salary is not None and low is None and high is None:
+        low = high = _decimal(salary)
+    return low, high
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    if value is None or isinstance(value, (bool, dict, list)):
+        return None
+    try:
+        amount = Decimal(str(value).replace(",", "").strip())
+    except InvalidOperation:
+        return None
+    # DECIMAL(15, 2) holds at most 13 integer digits.
+    if not amount.is_finite() or amount < 0 or amount >= Decimal(10) ** 13:
+        return None
+    return amount.quantize(Decimal("0.01"))
+
+
+def _datetime(value: Any) -> Optional[datetime]:
+    """Naive UTC datetime from an ISO-8601 string or a Unix timestamp in seconds or milliseconds."""
+
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            seconds = value / 1000 if value > 10 ** 11 else value
+            return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+        text = str(value).strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(text)
+    except (ValueError, OverflowError, OSError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+__all__ = ["parse_job_payload"]
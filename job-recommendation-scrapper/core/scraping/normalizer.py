@@ -0,0 +1,138 @@
+"""Batch stage that turns new raw scrapes into job_master rows."""
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.repository.job_master_repository import JobMasterRepository
+from core.repository.job_normalization_checkpoint_repository import JobNormalizationCheckpointRepository
+from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
+
+from .job_parser import parse_job_payload
+
+JOB_MASTER_PIPELINE = "job_master"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JobNormalizerConfig:
+    """Settings for the raw scrape -> job_master stage."""
+
+    chunk_size: int = 500
+    # Rows younger than this are left for the next run, so a scrape whose
+    # transaction commits after a higher id is not skipped by the mark.
+    settle_seconds: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "JobNormalizerConfig":
+        return cls(
+            chunk_size=max(1, int(os.getenv("SCRAPPER_NORMALIZE_CHUNK_SIZE") or 500)),
+            settle_seconds=max(0.0, float(os.getenv("SCRAPPER_NORMALIZE_SETTLE_SECONDS") or 60)),
+        )
+
+
+@dataclass
+class NormalizeRunStats:
+    chunks: int = 0
+    scrapes_read: int = 0
+    # Scrapes whose payload held no usable posting.
+    scrapes_without_jobs: int = 0
+    # Scrapes whose payload could not be read or parsed; the mark moves past them.
+    scrapes_failed: int = 0
+    jobs_upserted: int = 0
+    last_raw_scrape_id: int = 0
+
+
+class JobNormalizer:
+    """Parses successful raw scrapes into job_master, picking up where the last run stopped.
+
+    Each chunk is one transaction: lock the pipeline's checkpoint, read the
+    next ``chunk_size`` successful scrapes above its high-water mark, parse
+    their payloads, upsert the jobs in one statement and move the mark to
+    the last scrape read. A scrape whose payload cannot be decompressed or
+    parsed is counted in ``scrapes_failed`` and skipped, so one bad row never
+    holds the mark back. Any other failure rolls the chunk back whole, mark
+    included, so rerunning never loses or double-counts a scrape.
+    """
+
+    def __init__(self, session_factory: sessionmaker, config: Optional[JobNormalizerConfig] = None):
+        self._session_factory = session_factory
+        self._config = config or JobNormalizerConfig()
+
+    @property
+    def config(self) -> JobNormalizerConfig:
+        return self._config
+
+    def run(self, max_chunks: Optional[int] = None, now: Optional[datetime] = None) -> NormalizeRunStats:
+        """Process chunks until caught up (or ``max_chunks`` have run)."""
+
+        stats = NormalizeRunStats()
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=self._config.settle_seconds)
+        while max_chunks is None or stats.chunks < max_chunks:
+            if not self.run_chunk(cutoff, stats):
+                break
+        return stats
+
+    def run_chunk(self, cutoff: datetime, stats: NormalizeRunStats) -> bool:
+        """Normalize one chunk of scrapes logged before ``cutoff``; False once there is nothing left."""
+
+        with self._session_factory() as session:
+            try:
+                checkpoint = JobNormalizationCheckpointRepository(session).lock(JOB_MASTER_PIPELINE)
+                scrapes = JobRawScrapeRepository(session).list_after_id(
+                    checkpoint.last_raw_scrape_id,
+                    statuses=[int(JobRawScrapeStatus.SUCCESS)],
+                    limit=self._config.chunk_size,
+                )
+                settled = []
+                for scrape in scrapes:
+                    if scrape.loggedInTime is not None and scrape.loggedInTime >= cutoff:
+                        break
+                    settled.append(scrape)
+                if not settled:
+                    stats.last_raw_scrape_id = checkpoint.last_raw_scrape_id
+                    session.rollback()
+                    return False
+
+                jobs: List[Dict[str, Any]] = []
+                failed = 0
+                for scrape in settled:
+                    try:
+                        parsed = parse_job_payload(scrape.payload, scrape.job_url)
+                    except Exception:
+                        logger.exception("Skipping raw scrape %s: payload could not be parsed", scrape.id)
+                        failed += 1
+                        continue
+                    if not parsed:
+                        stats.scrapes_without_jobs += 1
+                    jobs.extend({**job, "source_id": scrape.source_id} for job in parsed)
+
+                upserted = JobMasterRepository(session).upsert_many(jobs)
+                last_id = settled[-1].id
+                checkpoint.last_raw_scrape_id = last_id
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        stats.chunks += 1
+        stats.scrapes_read += len(settled)
+        stats.scrapes_failed += failed
+        stats.jobs_upserted += upserted
+        stats.last_raw_scrape_id = last_id
+        # A short chunk means the rest is either absent or not settled yet.
+        return len(settled) == self._config.chunk_size
+
+
+__all__ = [
+    "JOB_MASTER_PIPELINE",
+    "JobNormalizer",
+    "JobNormalizerConfig",
+    "NormalizeRunStats",
+]
@@ -0,0 +1,147 @@
+"""Per-source token-bucket pacing for scrape requests."""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+_RATE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:/\s*(?:m|min|minute))?\s*$", re.IGNORECASE)
+
+
+def parse_rate_limit(value: Optional[str]) -> Optional[float]:
+    """Requests per minute from a ``job_source.rate_limit_per_min`` value.
+
+    Accepts a positive number, optionally written as ``"30/min"``. Empty
+    means no limit and returns None; anything else raises ``ValueError``.
+    """
+
+    if value is None or not str(value).strip():
+        return None
+    match = _RATE_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid rate_limit_per_min '{value}'; expected a number of requests per minute.")
+    rate = float(match.group(1))
+    if rate <= 0:
+        raise ValueError("rate_limit_per_min must be greater than zero.")
+    return rate
+
+
+class RateLimitBackend(ABC):
+    """Shared token-bucket state.
+
+    ``reserve`` takes one token from the bucket at ``key`` and returns how
+    long the caller must wait before using it. Tokens may go negative, so
+    callers that arrive together are spread out evenly instead of all
+    retrying at once.
+    """
+
+    @abstractmethod
+    async def reserve(self, key: str, rate_per_second: float, burst: float) -> float:
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Buckets shared by every worker in this process."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    async def reserve(self, key: str, rate_per_second: float, burst: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate_per_second) - 1
+            self._buckets[key] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / rate_per_second
+
+
+# Same reservation as InMemoryRateLimitBackend, done atomically in Redis with
+# the server clock so every process shares one bucket per key. The wait is
+# returned as a string because Redis truncates Lua numbers to integers.
+_REDIS_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - updated) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+if tokens >= 0 then
+  return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets kept in Redis so limits hold across scraper processes."""
+
+    def __init__(self, client, key_prefix: str = "scrapper:rate:"):
+        self._client = client
+        self._key_prefix = key_prefix
+        self._script = client.register_script(_REDIS_RESERVE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "scrapper:rate:") -> "RedisRateLimitBackend":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise RuntimeError("The redis package is required for the redis rate-limit backend.") from exc
+        return cls(redis_asyncio.from_url(url), key_prefix)
+
+    async def reserve(self, key: str, rate_per_second: float, burst: float) -> float:
+        wait = await self._script(keys=[self._key_prefix + key], args=[rate_per_second, burst])
+        return float(wait)
+
+
+class SourceRateLimiter:
+    """Paces requests per job source according to its requests-per-minute limit.
+
+    ``burst`` is how many requests may go out back to back after a quiet
+    period; the default of 1 spaces every request evenly.
+    """
+
+    def __init__(self, backend: Optional[RateLimitBackend] = None, burst: float = 1.0):
+        self._backend = backend or InMemoryRateLimitBackend()
+        self._burst = max(1.0, burst)
+
+    @classmethod
+    def from_env(cls) -> "SourceRateLimiter":
+        backend_name = (os.getenv("SCRAPPER_RATE_LIMIT_BACKEND") or "memory").strip().lower()
+        burst = float(os.getenv("SCRAPPER_RATE_LIMIT_BURST") or 1)
+        if backend_name == "memory":
+            return cls(InMemoryRateLimitBackend(), burst)
+        if backend_name == "redis":
+            url = os.getenv("SCRAPPER_RATE_LIMIT_REDIS_URL") or (
+                f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', '6379')}/0"
+            )
+            return cls(RedisRateLimitBackend.from_url(url), burst)
+        raise ValueError(
+            f"Unsupported SCRAPPER_RATE_LIMIT_BACKEND '{backend_name}'. Allowed values: memory, redis"
+        )
+
+    async def acquire(self, source_id: int, rate_per_minute: Optional[float]) -> float:
+        """Wait until a request to ``source_id`` is allowed; returns the seconds waited."""
+
+        if rate_per_minute is None:
+            return 0.0
+        wait = await self._backend.reserve(f"source:{source_id}", rate_per_minute / 60.0, self._burst)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+__all__ = [
+    "InMemoryRateLimitBackend",
+    "RateLimitBackend",
+    "RedisRateLimitBackend",
+    "SourceRateLimiter",
+    "parse_rate_limit",
+]
@@ -0,0 +1,48 @@
+"""Decide which job sources are due for a scrape."""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from core.entity.JobSourceEntity import JobSourceEntity
+from core.enums.scraping_schedule import ScrapingSchedule
+
+SCHEDULE_INTERVALS: Dict[ScrapingSchedule, timedelta] = {
+    ScrapingSchedule.DAILY: timedelta(days=1),
+    ScrapingSchedule.WEEKLY: timedelta(weeks=1),
+    ScrapingSchedule.MONTHLY: timedelta(days=30),
+}
+
+
+def schedule_interval(schedule_id: Optional[int]) -> Optional[timedelta]:
+    """How often a source with ``schedule_id`` is scraped, or None when it has no valid schedule."""
+
+    if schedule_id is None:
+        return None
+    try:
+        return SCHEDULE_INTERVALS[ScrapingSchedule(int(schedule_id))]
+    except (KeyError, ValueError):
+        return None
+
+
+def due_sources(
+    sources: Sequence[JobSourceEntity],
+    last_scraped: Mapping[int, datetime],
+    now: datetime,
+) -> List[JobSourceEntity]:
+    """Enabled sources whose schedule interval has passed since their last scrape.
+
+    A scheduled source that was never scraped is due at once; sources
+    without a schedule are never picked up automatically.
+    """
+
+    due = []
+    for source in sources:
+        if not source.enabled_for_scrapping:
+            continue
+        interval = schedule_interval(source.scraping_schedule)
+        if interval is None:
+            continue
+        previous = last_scraped.get(source.id)
+        if previous is None or previous + interval <= now:
+            due.append(source)
+    return due
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+ROW_INSERTED = "inserted"
+ROW_REJECTED = "rejected"
+ROW_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class RawScrapeRow:
+    """One validated row of a bulk ingest, tagged with its position in the request."""
+
+    index: int
+    source_id: int
+    job_url: str
+    raw_content: Optional[str]
+    status: int
+    error_message: Optional[str]
+
+
+@dataclass(frozen=True)
+class RawScrapeRowOutcome:
+    index: int
+    outcome: str
+    error: Optional[str] = None
+
+
+class JobRawScrapeService(ABC):
+    """Contract describing raw scrape ingestion."""
+
+    @abstractmethod
+    def ingest_chunk(self, rows: Sequence[RawScrapeRow]) -> List[RawScrapeRowOutcome]:
+        raise NotImplementedError
@@ -32,5 +32,6 @@ class JobSourceService(ABC):
         api_endpoint: Optional[str],
         api_key: Optional[str],
         company_name: Optional[str],
+        rate_limit_per_min: Optional[str] = None,
     ) -> JobSourceEntity:
         raise NotImplementedError
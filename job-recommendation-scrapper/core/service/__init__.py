@@ -1,3 +1,4 @@
+from .JobRawScrapeService import JobRawScrapeService
 from .JobSourceService import JobSourceService
 
-__all__ = ["JobSourceService"]
+__all__ = ["JobRawScrapeService", "JobSourceService"]
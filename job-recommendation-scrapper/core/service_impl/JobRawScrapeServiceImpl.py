@@ -0,0 +1,67 @@
+from typing import Dict, List, Sequence
+
+from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
+from core.repository.job_source_repository import JobSourceRepository
+from core.service.JobRawScrapeService import (
+    ROW_FAILED,
+    ROW_INSERTED,
+    ROW_REJECTED,
+    JobRawScrapeService,
+    RawScrapeRow,
+    RawScrapeRowOutcome,
+)
+
+
+class JobRawScrapeServiceImpl(JobRawScrapeService):
+    """Repository-backed bulk ingestion of raw scrapes.
+
+    One instance serves one bulk request: source ids are looked up once and
+    remembered for the following chunks, and each chunk is written with a
+    single multi-row INSERT in its own transaction, so a failing chunk does
+    not undo the chunks already stored.
+    """
+
+    def __init__(self, raw_repository: JobRawScrapeRepository, source_repository: JobSourceRepository):
+        self._raw_repo = raw_repository
+        self._source_repo = source_repository
+        self._source_exists: Dict[int, bool] = {}
+
+    def _check_sources(self, rows: Sequence[RawScrapeRow]) -> None:
+        unknown = {row.source_id for row in rows} - self._source_exists.keys()
+        if not unknown:
+            return
+        existing = self._source_repo.find_existing_ids(unknown)
+        for source_id in unknown:
+            self._source_exists[source_id] = source_id in existing
+
+    def ingest_chunk(self, rows: Sequence[RawScrapeRow]) -> List[RawScrapeRowOutcome]:
+        self._check_sources(rows)
+
+        outcomes: List[RawScrapeRowOutcome] = []
+        accepted: List[RawScrapeRow] = []
+        for row in rows:
+            if self._source_exists[row.source_id]:
+                accepted.append(row)
+            else:
+                outcomes.append(RawScrapeRowOutcome(row.index, ROW_REJECTED, "Source does not exist."))
+
+        try:
+            self._raw_repo.bulk_create(
+                [
+                    {
+                        "source_id": row.source_id,
+                        "job_url": row.job_url,
+                        "raw_content": row.raw_content,
+                        "status": row.status,
+                        "error_message": row.error_message,
+                    }
+                    for row in accepted
+                ]
+            )
+        except Exception:  # noqa: BLE001
+            outcomes.extend(RawScrapeRowOutcome(row.index, ROW_FAILED, "Chunk could not be stored.") for row in accepted)
+        else:
+            outcomes.extend(RawScrapeRowOutcome(row.index, ROW_INSERTED) for row in accepted)
+
+        outcomes.sort(key=lambda outcome: outcome.index)
+        return outcomes
@@ -32,6 +32,7 @@ class JobSourceServiceImpl(JobSourceService):
         api_endpoint: Optional[str],
         api_key: Optional[str],
         company_name: Optional[str],
+        rate_limit_per_min: Optional[str] = None,
     ) -> JobSourceEntity:
         entity = JobSourceEntity(
             source_name=int(source_name),
@@ -41,6 +42,7 @@ class JobSourceServiceImpl(JobSourceService):
             api_endpoint=api_endpoint,
             api_key=api_key,
             scraping_schedule=scraping_schedule_id,
+            rate_limit_per_min=rate_limit_per_min,
         )
         if company_name:
             entity.field1 = company_name
@@ -1,3 +1,4 @@
+from .JobRawScrapeServiceImpl import JobRawScrapeServiceImpl
 from .JobSourceServiceImpl import JobSourceServiceImpl
 
-__all__ = ["JobSourceServiceImpl"]
+__all__ = ["JobRawScrapeServiceImpl", "JobSourceServiceImpl"]
@@ -0,0 +1,11 @@
+from .raw_content import CODEC_NONE, CODEC_ZLIB, compress_payload, decompress_payload, payload_hash
+from .url_hash import job_url_hash
+
+__all__ = [
+    "CODEC_NONE",
+    "CODEC_ZLIB",
+    "compress_payload",
+    "decompress_payload",
+    "job_url_hash",
+    "payload_hash",
+]
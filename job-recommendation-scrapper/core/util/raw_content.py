@@ -0,0 +1,33 @@
+"""Compression and content addressing for raw scrape payloads."""
+
+import hashlib
+import zlib
+from typing import Tuple
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+ZLIB_LEVEL = 6
+
+
+def payload_hash(payload: str) -> str:
+    """SHA-256 hex digest of the UTF-8 payload; identical payloads share one stored copy."""
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compress_payload(payload: str) -> Tuple[str, bytes]:
+    """Return ``(codec, data)``; tiny payloads that zlib would grow are kept as-is."""
+
+    raw = payload.encode("utf-8")
+    compressed = zlib.compress(raw, ZLIB_LEVEL)
+    if len(compressed) >= len(raw):
+        return CODEC_NONE, raw
+    return CODEC_ZLIB, compressed
+
+
+def decompress_payload(data: bytes, codec: str = CODEC_ZLIB) -> str:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == CODEC_NONE:
+        return bytes(data).decode("utf-8")
+    raise ValueError(f"Unsupported raw content codec '{codec}'.")
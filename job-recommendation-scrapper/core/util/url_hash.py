@@ -0,0 +1,13 @@
+"""Fixed-width lookup key for job URLs."""
+
+import hashlib
+
+
+def job_url_hash(job_url: str) -> str:
+    """SHA-256 hex digest of ``job_url`` exactly as stored.
+
+    Matches MySQL's ``SHA2(job_url, 256)`` for utf8mb4 text, so rows can be
+    hashed in SQL or in Python interchangeably.
+    """
+
+    return hashlib.sha256(job_url.encode("utf-8")).hexdigest()
@@ -0,0 +1,6 @@
+-- Fixed-width lookup key for job_raw_scrape.job_url (TEXT cannot be indexed
+-- usefully). New rows get the hash on insert; existing rows stay NULL until
+-- `python -m web.backfill_job_url_hash` has filled them in batches.
+ALTER TABLE job_raw_scrape
+  ADD COLUMN job_url_hash CHAR(64) NULL COMMENT 'SHA-256 hex of job_url' AFTER job_url,
+  ADD INDEX idx_job_raw_scrape_url_hash_status_time (job_url_hash, status, loggedInTime);
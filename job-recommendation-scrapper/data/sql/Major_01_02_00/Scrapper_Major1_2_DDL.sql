@@ -0,0 +1,36 @@
+SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS;
+SET FOREIGN_KEY_CHECKS = 0;
+
+-- Scrape payloads, zlib-compressed (or kept as-is when that is smaller, codec
+-- "none") and stored once per distinct SHA-256.
+-- job_raw_scrape rows reference them by content_hash; raw_content on
+-- job_raw_scrape is kept only for rows written before this table existed.
+CREATE TABLE IF NOT EXISTS job_raw_content (
+  id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  content_hash  CHAR(64)        NOT NULL COMMENT 'SHA-256 hex of the uncompressed UTF-8 payload',
+  codec         VARCHAR(16)     NOT NULL DEFAULT 'zlib',
+  raw_size      BIGINT UNSIGNED NOT NULL,
+  stored_size   BIGINT UNSIGNED NOT NULL,
+  content       LONGBLOB        NOT NULL,
+  -- BaseEntity fields
+  rowstate        INT NOT NULL DEFAULT 1,
+  field1          VARCHAR(200) NULL,
+  field2          VARCHAR(200) NULL,
+  field3          BIGINT NULL,
+  field4          BIGINT NULL,
+  loggedBy        BIGINT NOT NULL DEFAULT 0,
+  lastUpdatedBy   BIGINT NOT NULL DEFAULT 0,
+  loggedInTime    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  lastUpdateTime  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_job_raw_content_hash (content_hash)
+) ENGINE=InnoDB
+  AUTO_INCREMENT=1000
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+ALTER TABLE job_raw_scrape
+  ADD COLUMN content_hash CHAR(64) NULL COMMENT 'job_raw_content.content_hash' AFTER raw_content,
+  ADD CONSTRAINT fk_job_raw_scrape_content
+    FOREIGN KEY (content_hash) REFERENCES job_raw_content (content_hash);
+
+SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;
@@ -0,0 +1,5 @@
+-- Keyset pagination over (loggedInTime, id) for the raw-scrape listing. InnoDB
+-- appends the primary key to secondary indexes, so id needs no extra column.
+ALTER TABLE job_raw_scrape
+  ADD INDEX idx_job_raw_scrape_time (loggedInTime),
+  ADD INDEX idx_job_raw_scrape_source_time (source_id, loggedInTime);
@@ -0,0 +1,34 @@
+SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS;
+SET FOREIGN_KEY_CHECKS = 0;
+
+-- Latest HTTP cache validators per job URL, so re-scrapes can be sent as
+-- conditional requests and a 304 (or an identical body) stores no new payload.
+CREATE TABLE IF NOT EXISTS job_url_validator (
+  id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  job_url_hash      CHAR(64)     NOT NULL COMMENT 'SHA-256 hex of job_url',
+  job_url           TEXT         NOT NULL,
+  source_id         BIGINT UNSIGNED NOT NULL,
+  etag              VARCHAR(512) NULL,
+  last_modified     VARCHAR(64)  NULL COMMENT 'Last-Modified header as sent by the server',
+  content_hash      CHAR(64)     NULL COMMENT 'SHA-256 of the last payload fetched',
+  last_status_code  INT          NULL,
+  last_checked_time DATETIME     NULL,
+  -- BaseEntity fields
+  rowstate        INT NOT NULL DEFAULT 1,
+  field1          VARCHAR(200) NULL,
+  field2          VARCHAR(200) NULL,
+  field3          BIGINT NULL,
+  field4          BIGINT NULL,
+  loggedBy        BIGINT NOT NULL DEFAULT 0,
+  lastUpdatedBy   BIGINT NOT NULL DEFAULT 0,
+  loggedInTime    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  lastUpdateTime  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_job_url_validator_url_hash (job_url_hash),
+  CONSTRAINT fk_job_url_validator_source
+    FOREIGN KEY (source_id) REFERENCES job_source (id)
+) ENGINE=InnoDB
+  AUTO_INCREMENT=1000
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;
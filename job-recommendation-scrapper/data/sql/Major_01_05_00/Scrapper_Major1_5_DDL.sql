@@ -0,0 +1,29 @@
+SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS;
+SET FOREIGN_KEY_CHECKS = 0;
+
+-- High-water mark per normalization pipeline: the last job_raw_scrape id it
+-- has turned into job_master rows, so each run only reads newer scrapes.
+CREATE TABLE IF NOT EXISTS job_normalization_checkpoint (
+  id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  pipeline_name       VARCHAR(64) NOT NULL,
+  last_raw_scrape_id  BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  -- BaseEntity fields
+  rowstate        INT NOT NULL DEFAULT 1,
+  field1          VARCHAR(200) NULL,
+  field2          VARCHAR(200) NULL,
+  field3          BIGINT NULL,
+  field4          BIGINT NULL,
+  loggedBy        BIGINT NOT NULL DEFAULT 0,
+  lastUpdatedBy   BIGINT NOT NULL DEFAULT 0,
+  loggedInTime    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  lastUpdateTime  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_job_normalization_checkpoint_pipeline (pipeline_name)
+) ENGINE=InnoDB
+  AUTO_INCREMENT=1000
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+INSERT IGNORE INTO job_normalization_checkpoint (pipeline_name, last_raw_scrape_id)
+VALUES ('job_master', 0);
+
+SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;
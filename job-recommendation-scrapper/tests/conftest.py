@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend_common.database import create_session_factory, register_soft_delete_filter  # noqa: E402
+from core.baseEntity import BaseEntity  # noqa: E402
+
+# Register every table on BaseEntity.metadata.
+import core.entity.JobSourceEntity  # noqa: E402,F401
+import core.entity.JobRawContentEntity  # noqa: E402,F401
+import core.entity.JobRawScrapeEntity  # noqa: E402,F401
+import core.entity.JobUrlValidatorEntity  # noqa: E402,F401
+import core.entity.JobMasterEntity  # noqa: E402,F401
+import core.entity.JobNormalizationCheckpointEntity  # noqa: E402,F401
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns.
+    return "INTEGER"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    BaseEntity.metadata.create_all(engine)
+    factory = create_session_factory(engine)
+    register_soft_delete_filter(factory, BaseEntity)
+    yield factory
+    engine.dispose()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.entity.JobSourceEntity import JobSourceEntity
+from web.database import get_db
+from web.RestController import JobRawScrapeController as controller
+
+NDJSON = {"content-type": "application/x-ndjson"}
+
+
+@pytest.fixture
+def client(session_factory):
+    with session_factory() as session:
+        session.add(JobSourceEntity(id=1, source_name="source-1", source_url="http://jobs/1"))
+        session.commit()
+
+    def override_get_db():
+        with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(controller.router)
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def _scrape(n):
+    return {"sourceId": 1, "jobUrl": f"http://jobs/1/{n}", "rawContent": f"<p>{n}</p>"}
+
+
+def test_json_array_over_the_row_cap_is_refused(client, monkeypatch):
+    monkeypatch.setattr(controller, "BULK_MAX_ROWS", 3)
+
+    response = client.post("/api/raw-scrapes/bulk", json=[_scrape(n) for n in range(4)])
+
+    assert response.status_code == 413
+    assert client.get("/api/raw-scrapes").json()["items"] == []
+
+
+def test_json_array_over_the_byte_cap_is_refused(client, monkeypatch):
+    monkeypatch.setattr(controller, "BULK_MAX_ARRAY_BYTES", 100)
+    body = json.dumps([_scrape(n) for n in range(4)]).encode()
+
+    declared = client.post("/api/raw-scrapes/bulk", content=body, headers={"content-type": "application/json"})
+    streamed = client.post("/api/raw-scrapes/bulk", content=iter([body[:80], body[80:]]))
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
+    assert client.get("/api/raw-scrapes").json()["items"] == []
+
+
+def test_ndjson_stops_reading_at_the_row_cap(client, monkeypatch):
+    monkeypatch.setattr(controller, "BULK_MAX_ROWS", 3)
+    body = "\n".join(json.dumps(_scrape(n)) for n in range(10))
+
+    response = client.post("/api/raw-scrapes/bulk", content=body, headers=NDJSON)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["received"], result["inserted"], result["rejected"]) == (3, 3, 1)
+    assert result["results"][-1]["index"] == 3
+    assert "not read" in result["results"][-1]["error"]
+    assert len(client.get("/api/raw-scrapes").json()["items"]) == 3
+
+
+def test_ndjson_rows_get_their_own_outcomes(client):
+    body = "\n".join([json.dumps(_scrape(0)), "{not json", "", json.dumps({"sourceId": 1}), json.dumps(_scrape(1))])
+
+    result = client.post("/api/raw-scrapes/bulk", content=body, headers=NDJSON).json()
+
+    assert [row["outcome"] for row in result["results"]] == ["inserted", "rejected", "rejected", "inserted"]
+
+
+class _StreamingRequest:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _read_ndjson(chunks):
+    async def collect():
+        return [item async for item in controller._iter_ndjson(_StreamingRequest(chunks))]
+
+    return asyncio.run(collect())
+
+
+def test_ndjson_lines_are_capped_while_buffering(monkeypatch):
+    monkeypatch.setattr(controller, "BULK_MAX_LINE_BYTES", 16)
+    long_line = [b'{"a": "' + b"x" * 10, b"x" * 10, b"x" * 10, b'"}\n{"b": 1}\n{"c":', b" 2}"]
+
+    items = _read_ndjson(long_line)
+
+    assert items == [(None, "Line exceeds 16 bytes."), ({"b": 1}, None), ({"c": 2}, None)]
+
+
+def test_ndjson_line_over_the_cap_in_one_chunk_is_rejected(monkeypatch):
+    monkeypatch.setattr(controller, "BULK_MAX_LINE_BYTES", 16)
+
+    items = _read_ndjson([b'{"a": "' + b"x" * 20 + b'"}\n{"b": 1}'])
+
+    assert items == [(None, "Line exceeds 16 bytes."), ({"b": 1}, None)]
@@ -0,0 +1,18 @@
+from sqlalchemy import func, select
+
+from core.entity.JobRawContentEntity import JobRawContentEntity
+from core.repository.job_raw_content_repository import JobRawContentRepository
+from core.util.raw_content import payload_hash
+
+
+def test_payloads_are_stored_once_per_hash(session_factory):
+    with session_factory() as session:
+        repo = JobRawContentRepository(session)
+        first = repo.store_payloads(["<p>a</p>", None, "<p>a</p>", "<p>b</p>"])
+        second = repo.store_payloads(["<p>b</p>", "<p>c</p>"])
+        session.commit()
+
+        assert first == [payload_hash("<p>a</p>"), None, payload_hash("<p>a</p>"), payload_hash("<p>b</p>")]
+        assert second == [payload_hash("<p>b</p>"), payload_hash("<p>c</p>")]
+        assert session.execute(select(func.count()).select_from(JobRawContentEntity)).scalar() == 3
+        assert repo.find_by_hash(payload_hash("<p>c</p>")).text == "<p>c</p>"
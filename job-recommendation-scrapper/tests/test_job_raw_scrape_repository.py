@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from core.entity.JobRawScrapeEntity import JobRawScrapeEntity
+from core.entity.JobSourceEntity import JobSourceEntity
+from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
+
+SUCCESS = int(JobRawScrapeStatus.SUCCESS)
+ERROR = int(JobRawScrapeStatus.ERROR)
+
+
+def _seed(session, rows):
+    session.add(JobSourceEntity(id=1, source_name="source-1", source_url="http://jobs/1"))
+    session.flush()
+    start = datetime(2026, 1, 1)
+    for offset, (url, status) in enumerate(rows):
+        session.add(JobRawScrapeEntity(source_id=1, job_url=url, status=status, loggedInTime=start + timedelta(hours=offset)))
+    session.commit()
+
+
+def _drop_hashes(session, *urls):
+    session.execute(update(JobRawScrapeEntity).where(JobRawScrapeEntity.job_url.in_(urls)).values(job_url_hash=None))
+    session.commit()
+
+
+def test_latest_by_url_uses_the_hash(session_factory):
+    with session_factory() as session:
+        _seed(session, [("http://jobs/a", SUCCESS), ("http://jobs/a", ERROR), ("http://jobs/b", SUCCESS)])
+        repo = JobRawScrapeRepository(session)
+
+        assert repo.fetch_latest_by_url("http://jobs/a").status == ERROR
+        assert repo.fetch_latest_successful_by_url("http://jobs/a").status == SUCCESS
+        assert repo.fetch_latest_by_url("http://jobs/missing") is None
+
+
+def test_latest_by_url_finds_rows_not_yet_backfilled(session_factory):
+    with session_factory() as session:
+        _seed(session, [("http://jobs/a", SUCCESS), ("http://jobs/a", ERROR), ("http://jobs/b", SUCCESS)])
+        _drop_hashes(session, "http://jobs/a", "http://jobs/b")
+        repo = JobRawScrapeRepository(session)
+
+        assert repo.fetch_latest_by_url("http://jobs/a").status == ERROR
+        assert repo.fetch_latest_successful_by_url("http://jobs/a").status == SUCCESS
+        assert repo.fetch_latest_by_url("http://jobs/b").job_url == "http://jobs/b"
+
+        while repo.backfill_url_hashes(batch_size=2):
+            pass
+        assert repo.fetch_latest_by_url("http://jobs/a").status == ERROR
+
+
+def test_hashed_rows_win_over_legacy_rows(session_factory):
+    with session_factory() as session:
+        _seed(session, [("http://jobs/a", ERROR), ("http://jobs/a", SUCCESS)])
+        first = session.query(JobRawScrapeEntity).order_by(JobRawScrapeEntity.id).first()
+        first.job_url_hash = None
+        session.commit()
+        repo = JobRawScrapeRepository(session)
+
+        assert repo.fetch_latest_by_url("http://jobs/a").status == SUCCESS
+
+
+def test_list_page_walks_every_row_once_across_equal_timestamps(session_factory):
+    with session_factory() as session:
+        session.add(JobSourceEntity(id=1, source_name="source-1", source_url="http://jobs/1"))
+        session.flush()
+        start = datetime(2026, 1, 1)
+        for n in range(7):
+            # Pairs of rows share a timestamp, so pages must break ties on id.
+            session.add(
+                JobRawScrapeEntity(
+                    source_id=1, job_url=f"http://jobs/{n}", status=SUCCESS, loggedInTime=start + timedelta(hours=n // 2)
+                )
+            )
+        session.commit()
+        repo = JobRawScrapeRepository(session)
+
+        seen, after = [], None
+        while True:
+            page = repo.list_page(after=after, limit=3)
+            if not page:
+                break
+            seen.extend(row.id for row in page)
+            after = (page[-1].loggedInTime, page[-1].id)
+
+        assert seen == [7, 6, 5, 4, 3, 2, 1]
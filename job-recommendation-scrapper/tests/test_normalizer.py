@@ -0,0 +1,89 @@
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from core.entity.JobMasterEntity import JobMasterEntity
+from core.entity.JobRawContentEntity import JobRawContentEntity
+from core.entity.JobRawScrapeEntity import JobRawScrapeEntity
+from core.entity.JobSourceEntity import JobSourceEntity
+from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.scraping import JobNormalizer, JobNormalizerConfig
+from core.scraping.job_parser import parse_job_payload
+from core.util.url_hash import job_url_hash
+
+LOGGED_AT = datetime(2026, 1, 1)
+
+
+def _seed(session_factory, payloads):
+    with session_factory() as session:
+        session.add(JobSourceEntity(id=1, source_name="source-1", source_url="http://jobs/1"))
+        session.flush()
+        for n, payload in enumerate(payloads):
+            scrape = JobRawScrapeEntity(
+                source_id=1,
+                job_url=f"http://jobs/1/page-{n}",
+                status=int(JobRawScrapeStatus.SUCCESS),
+                loggedInTime=LOGGED_AT,
+            )
+            if isinstance(payload, JobRawContentEntity):
+                session.add(payload)
+                session.flush()
+                scrape.content_hash = payload.content_hash
+            else:
+                scrape.raw_content = payload
+            session.add(scrape)
+        session.commit()
+
+
+def _titles(session_factory):
+    with session_factory() as session:
+        return sorted(session.execute(select(JobMasterEntity.title)).scalars())
+
+
+def _normalizer(session_factory, chunk_size=10):
+    return JobNormalizer(session_factory, JobNormalizerConfig(chunk_size=chunk_size, settle_seconds=0))
+
+
+def _posting(n):
+    return json.dumps({"id": f"job-{n}", "title": f"Engineer {n}"})
+
+
+def test_postings_are_upserted_and_the_mark_advances(session_factory):
+    _seed(session_factory, [_posting(n) for n in range(5)])
+
+    stats = _normalizer(session_factory, chunk_size=2).run(now=LOGGED_AT + timedelta(minutes=1))
+
+    assert (stats.chunks, stats.scrapes_read, stats.jobs_upserted, stats.last_raw_scrape_id) == (3, 5, 5, 5)
+    assert _titles(session_factory) == [f"Engineer {n}" for n in range(5)]
+    assert _normalizer(session_factory).run(now=LOGGED_AT + timedelta(minutes=1)).scrapes_read == 0
+
+
+def test_unreadable_scrapes_are_skipped_without_blocking_the_chunk(session_factory):
+    corrupt = JobRawContentEntity(content_hash="0" * 64, codec="zlib", raw_size=10, stored_size=4, content=b"oops")
+    unknown_codec = JobRawContentEntity(content_hash="1" * 64, codec="brotli", raw_size=1, stored_size=1, content=b"x")
+    _seed(session_factory, [_posting(0), corrupt, unknown_codec, _posting(3)])
+
+    stats = _normalizer(session_factory).run(now=LOGGED_AT + timedelta(minutes=1))
+
+    assert (stats.scrapes_read, stats.scrapes_failed, stats.jobs_upserted, stats.last_raw_scrape_id) == (4, 2, 2, 4)
+    assert _titles(session_factory) == ["Engineer 0", "Engineer 3"]
+
+
+def test_unsettled_scrapes_wait_for_the_next_run(session_factory):
+    _seed(session_factory, [_posting(0)])
+
+    stats = _normalizer(session_factory).run(now=LOGGED_AT)
+
+    assert (stats.chunks, stats.scrapes_read, stats.last_raw_scrape_id) == (0, 0, 0)
+
+
+def test_postings_without_their_own_id_or_url_are_dropped():
+    page = "http://jobs/1/listing"
+
+    assert parse_job_payload(json.dumps({"title": "Engineer"}), page) == []
+    [job] = parse_job_payload(json.dumps({"title": "Engineer", "url": "http://jobs/1/42"}), page)
+    assert job["external_job_id"] == job_url_hash("http://jobs/1/42")
+    assert job["job_url"] == "http://jobs/1/42"
+    [job] = parse_job_payload(json.dumps({"title": "Engineer", "id": 42}), page)
+    assert (job["external_job_id"], job["job_url"]) == ("42", page)
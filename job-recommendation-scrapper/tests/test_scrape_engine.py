@@ -0,0 +1,128 @@
+import asyncio
+
+import httpx
+from sqlalchemy import select
+
+from core.entity.JobRawScrapeEntity import JobRawScrapeEntity
+from core.entity.JobSourceEntity import JobSourceEntity
+from core.enums.job_raw_scrape_status import JobRawScrapeStatus
+from core.enums.scraping_schedule import ScrapingSchedule
+from core.scraping import FetchTask, ScrapeEngine, ScrapeEngineConfig
+
+
+def _stub_transport(calls):
+    """Local stand-in for the job sites: /boom answers 500, host ``down`` is unreachable."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        if request.url.host == "down":
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/boom":
+            return httpx.Response(500, text="server error")
+        return httpx.Response(200, text=f"<html>{request.url.path}</html>")
+
+    return httpx.MockTransport(handler)
+
+
+def _add_sources(session_factory, count):
+    with session_factory() as session:
+        session.add_all(
+            JobSourceEntity(
+                id=source_id,
+                source_name=f"source-{source_id}",
+                source_url=f"http://jobs/{source_id}",
+                scraping_schedule=int(ScrapingSchedule.DAILY),
+            )
+            for source_id in range(1, count + 1)
+        )
+        session.commit()
+
+
+def _stored_rows(session_factory):
+    with session_factory() as session:
+        rows = session.execute(select(JobRawScrapeEntity).order_by(JobRawScrapeEntity.id)).scalars().all()
+        return [(row.source_id, row.job_url, row.status, row.error_message, row.payload) for row in rows]
+
+
+def _engine(session_factory, calls, **config):
+    config.setdefault("flush_interval_seconds", 0.05)
+    return ScrapeEngine(session_factory, ScrapeEngineConfig(**config), transport=_stub_transport(calls))
+
+
+def test_rows_are_written_in_batches(session_factory):
+    _add_sources(session_factory, 25)
+    engine = _engine(session_factory, [], concurrency=4, queue_size=3, batch_size=10)
+    flushed = []
+    store_batch = engine._store_batch
+    engine._store_batch = lambda batch: (flushed.append(len(batch)), store_batch(batch))
+
+    tasks = [FetchTask(source_id=i, url=f"http://jobs/{i}") for i in range(1, 26)]
+    stats = asyncio.run(engine.run_tasks(tasks))
+
+    assert (stats.fetched, stats.succeeded, stats.failed, stats.written) == (25, 25, 0, 25)
+    assert sum(flushed) == 25
+    assert max(flushed) <= 10
+    rows = _stored_rows(session_factory)
+    assert len(rows) == 25
+    assert rows[0][2] == int(JobRawScrapeStatus.SUCCESS)
+    assert rows[0][4].startswith("<html>/")
+
+
+def test_http_errors_and_unreachable_hosts_are_recorded(session_factory):
+    _add_sources(session_factory, 3)
+    engine = _engine(session_factory, [])
+    tasks = [
+        FetchTask(source_id=1, url="http://jobs/ok"),
+        FetchTask(source_id=2, url="http://jobs/boom"),
+        FetchTask(source_id=3, url="http://down/listing"),
+    ]
+
+    stats = asyncio.run(engine.run_tasks(tasks))
+
+    assert (stats.succeeded, stats.failed, stats.written) == (1, 2, 3)
+    by_url = {url: (status, error) for _, url, status, error, _ in _stored_rows(session_factory)}
+    assert by_url["http://jobs/ok"] == (int(JobRawScrapeStatus.SUCCESS), None)
+    assert by_url["http://jobs/boom"] == (int(JobRawScrapeStatus.ERROR), "HTTP 500")
+    assert by_url["http://down/listing"][0] == int(JobRawScrapeStatus.ERROR)
+    assert "connection refused" in by_url["http://down/listing"][1]
+
+
+def test_malformed_url_does_not_abort_the_run(session_factory):
+    _add_sources(session_factory, 6)
+    calls = []
+    engine = _engine(session_factory, calls, concurrency=3)
+    tasks = [FetchTask(source_id=i, url=f"http://jobs/{i}") for i in range(1, 6)]
+    tasks.append(FetchTask(source_id=6, url="http://[::1"))
+
+    stats = asyncio.run(engine.run_tasks(tasks))
+
+    assert (stats.succeeded, stats.failed, stats.written, stats.write_failed) == (5, 1, 6, 0)
+    assert len(calls) == 5
+    statuses = {url: status for _, url, status, _, _ in _stored_rows(session_factory)}
+    assert statuses["http://[::1"] == int(JobRawScrapeStatus.ERROR)
+
+
+def test_run_once_scrapes_due_sources(session_factory):
+    _add_sources(session_factory, 2)
+    calls = []
+    stats = asyncio.run(_engine(session_factory, calls).run_once())
+
+    assert stats.sources_due == 2
+    assert sorted(calls) == ["http://jobs/1", "http://jobs/2"]
+
+
+def test_run_forever_survives_a_failing_run(session_factory):
+    engine = _engine(session_factory, [], poll_interval_seconds=0.01)
+    stop = asyncio.Event()
+    attempts = []
+
+    async def failing_run_once(now=None):
+        attempts.append(now)
+        if len(attempts) >= 3:
+            stop.set()
+        raise RuntimeError("database unavailable")
+
+    engine.run_once = failing_run_once
+    asyncio.run(asyncio.wait_for(engine.run_forever(stop), timeout=5))
+
+    assert len(attempts) == 3
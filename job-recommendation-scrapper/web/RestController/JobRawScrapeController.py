@@ -1,21 +1,35 @@
 """REST endpoints for raw job scrape payloads."""
 
+import base64
+import binascii
+import json
+import os
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from core.entity.JobRawScrapeEntity import JobRawScrapeEntity
 from core.entity.JobSourceEntity import JobSourceEntity
 from core.enums.job_raw_scrape_status import JobRawScrapeStatus
 from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
 from core.repository.job_source_repository import JobSourceRepository
+from core.service.JobRawScrapeService import ROW_REJECTED, RawScrapeRow, RawScrapeRowOutcome
+from core.service_impl import JobRawScrapeServiceImpl
 from ..database import get_db
 
 router = APIRouter(prefix="/api/raw-scrapes", tags=["job-raw-scrapes"])
 
+BULK_CHUNK_SIZE = max(1, int(os.getenv("SCRAPPER_BULK_CHUNK_SIZE", "1000")))
+BULK_MAX_ROWS = int(os.getenv("SCRAPPER_BULK_MAX_ROWS", "50000"))
+# Longest NDJSON line buffered while waiting for its newline.
+BULK_MAX_LINE_BYTES = int(os.getenv("SCRAPPER_BULK_MAX_LINE_BYTES", str(10 * 1024 * 1024)))
+# Largest JSON array body; unlike NDJSON it has to be held whole to be parsed.
+BULK_MAX_ARRAY_BYTES = int(os.getenv("SCRAPPER_BULK_MAX_ARRAY_BYTES", str(64 * 1024 * 1024)))
+
 
 class JobRawScrapeResponse(BaseModel):
     id: int
@@ -29,7 +43,7 @@ class JobRawScrapeResponse(BaseModel):
     lastUpdateTime: Optional[datetime]
 
     @classmethod
-    def from_entity(cls, entity: JobRawScrapeEntity) -> "JobRawScrapeResponse":
+    def from_entity(cls, entity: JobRawScrapeEntity, include_content: bool = True) -> "JobRawScrapeResponse":
         status_label: Optional[str] = None
         if entity.status is not None:
             try:
@@ -43,7 +57,7 @@ class JobRawScrapeResponse(BaseModel):
             jobUrl=entity.job_url,
             statusCode=entity.status,
             statusLabel=status_label,
-            rawContent=entity.raw_content,
+            rawContent=entity.payload if include_content else None,
             errorMessage=entity.error_message,
             loggedInTime=entity.loggedInTime,
             lastUpdateTime=entity.lastUpdateTime,
@@ -80,6 +94,53 @@ def create_job_raw_scrape(
     return JobRawScrapeResponse.from_entity(created)
 
 
+class JobRawScrapePageResponse(BaseModel):
+    items: List[JobRawScrapeResponse]
+    nextCursor: Optional[str]
+
+
+def _encode_cursor(entity: JobRawScrapeEntity) -> str:
+    raw = json.dumps([entity.loggedInTime.isoformat(), entity.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        logged_in_time, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(logged_in_time), int(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor.") from exc
+
+
+@router.get("", response_model=JobRawScrapePageResponse)
+def list_job_raw_scrapes(
+    sourceId: Optional[List[int]] = Query(default=None),
+    status_code: Optional[List[JobRawScrapeStatus]] = Query(default=None, alias="status"),
+    since: Optional[datetime] = Query(default=None, description="Inclusive lower bound on loggedInTime."),
+    until: Optional[datetime] = Query(default=None, description="Exclusive upper bound on loggedInTime."),
+    cursor: Optional[str] = Query(default=None, description="nextCursor from the previous page."),
+    limit: int = Query(default=100, ge=1, le=1000),
+    includeContent: bool = Query(default=False),
+    db: Session = Depends(get_db),
+):
+    raw_repo = JobRawScrapeRepository(db)
+    # One extra row tells whether another page follows.
+    rows = raw_repo.list_page(
+        source_ids=sourceId,
+        statuses=[int(value) for value in status_code] if status_code else None,
+        since=since,
+        until=until,
+        after=_decode_cursor(cursor) if cursor else None,
+        limit=limit + 1,
+        include_content=includeContent,
+    )
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return JobRawScrapePageResponse(
+        items=[JobRawScrapeResponse.from_entity(row, include_content=includeContent) for row in rows[:limit]],
+        nextCursor=next_cursor,
+    )
+
+
 @router.get("/latest", response_model=JobRawScrapeResponse)
 def fetch_latest_scrape(
     jobUrl: str = Query(..., min_length=5),
@@ -91,3 +152,191 @@ def fetch_latest_scrape(
     if not scrape:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "No scrape found for the provided URL.")
     return JobRawScrapeResponse.from_entity(scrape)
+
+
+class BulkRowOutcomeResponse(BaseModel):
+    index: int
+    outcome: str
+    error: Optional[str] = None
+
+    @classmethod
+    def from_outcome(cls, outcome: RawScrapeRowOutcome) -> "BulkRowOutcomeResponse":
+        return cls(index=outcome.index, outcome=outcome.outcome, error=outcome.error)
+
+
+class BulkJobRawScrapeResponse(BaseModel):
+    received: int
+    inserted: int
+    rejected: int
+    failed: int
+    results: List[BulkRowOutcomeResponse]
+
+
+def _is_ndjson(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[Tuple[Any, Optional[str]]]:
+    """Yield ``(item, error)`` per non-blank line as the body streams in.
+
+    At most ``BULK_MAX_LINE_BYTES`` of a line are held at once; a longer
+    line is reported once and the rest of it is skipped up to its newline.
+    """
+
+    head: List[bytes] = []
+    head_size = 0
+    skipping = False
+    async for chunk in request.stream():
+        *lines, tail = chunk.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+            else:
+                if head:
+                    line = b"".join(head) + line
+                if line.strip():
+                    yield _decode_line(line)
+            head, head_size = [], 0
+        if skipping:
+            continue
+        head.append(tail)
+        head_size += len(tail)
+        if head_size > BULK_MAX_LINE_BYTES:
+            yield None, _line_too_long()
+            head, head_size, skipping = [], 0, True
+    line = b"".join(head)
+    if not skipping and line.strip():
+        yield _decode_line(line)
+
+
+def _line_too_long() -> str:
+    return f"Line exceeds {BULK_MAX_LINE_BYTES} bytes."
+
+
+def _decode_line(line: bytes) -> Tuple[Any, Optional[str]]:
+    if len(line) > BULK_MAX_LINE_BYTES:
+        return None, _line_too_long()
+    try:
+        return json.loads(line), None
+    except ValueError:
+        return None, "Line is not valid JSON."
+
+
+def _array_too_large() -> HTTPException:
+    return HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        f"JSON array bodies are limited to {BULK_MAX_ARRAY_BYTES} bytes; send larger batches as NDJSON.",
+    )
+
+
+async def _read_array_body(request: Request) -> bytes:
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_MAX_ARRAY_BYTES:
+        raise _array_too_large()
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > BULK_MAX_ARRAY_BYTES:
+            raise _array_too_large()
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _iter_json_array(request: Request) -> AsyncIterator[Tuple[Any, Optional[str]]]:
+    body = await _read_array_body(request)
+    try:
+        items = json.loads(body)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Body is not valid JSON.") from exc
+    if not isinstance(items, list):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Body must be a JSON array of scrapes.")
+    if len(items) > BULK_MAX_ROWS:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            f"Bulk requests are limited to {BULK_MAX_ROWS} rows.",
+        )
+    for item in items:
+        yield item, None
+
+
+def _to_row(index: int, item: Any) -> Tuple[Optional[RawScrapeRow], Optional[str]]:
+    try:
+        body = CreateJobRawScrapeBody.model_validate(item)
+    except ValidationError as exc:
+        first = exc.errors()[0]
+        location = ".".join(str(part) for part in first["loc"]) or "row"
+        return None, f"{location}: {first['msg']}"
+    return (
+        RawScrapeRow(
+            index=index,
+            source_id=body.sourceId,
+            job_url=body.jobUrl.strip(),
+            raw_content=body.rawContent,
+            status=int(body.status),
+            error_message=body.errorMessage,
+        ),
+        None,
+    )
+
+
+@router.post("/bulk", response_model=BulkJobRawScrapeResponse)
+async def bulk_create_job_raw_scrapes(request: Request, db: Session = Depends(get_db)):
+    """Ingest many scrapes from a JSON array or an NDJSON stream.
+
+    Rows are validated one by one and written in chunks of
+    ``SCRAPPER_BULK_CHUNK_SIZE`` with one multi-row INSERT and one commit per
+    chunk. NDJSON bodies are consumed as they stream in, so a chunk is
+    written before the rest of the body has arrived. Every row gets an
+    outcome; a bad row never fails the rest of the request.
+
+    A JSON array larger than ``SCRAPPER_BULK_MAX_ARRAY_BYTES`` or longer
+    than ``SCRAPPER_BULK_MAX_ROWS`` is refused with 413 before anything is
+    written. An NDJSON stream stops being read at that
+    row: the rows before it are kept and one rejected outcome at the cap
+    says the rest of the body was ignored.
+    """
+
+    service = JobRawScrapeServiceImpl(JobRawScrapeRepository(db), JobSourceRepository(db))
+    items = _iter_ndjson(request) if _is_ndjson(request) else _iter_json_array(request)
+
+    outcomes: List[RawScrapeRowOutcome] = []
+    pending: List[RawScrapeRow] = []
+    index = -1
+    received = 0
+    async for item, error in items:
+        index += 1
+        if index >= BULK_MAX_ROWS:
+            outcomes.append(
+                RawScrapeRowOutcome(
+                    index,
+                    ROW_REJECTED,
+                    f"Bulk requests are limited to {BULK_MAX_ROWS} rows; the rest of the body was not read.",
+                )
+            )
+            await items.aclose()
+            break
+        received = index + 1
+        row = None
+        if error is None:
+            row, error = _to_row(index, item)
+        if row is None:
+            outcomes.append(RawScrapeRowOutcome(index, ROW_REJECTED, error))
+            continue
+        pending.append(row)
+        if len(pending) >= BULK_CHUNK_SIZE:
+            outcomes.extend(await run_in_threadpool(service.ingest_chunk, pending))
+            pending = []
+    if pending:
+        outcomes.extend(await run_in_threadpool(service.ingest_chunk, pending))
+
+    outcomes.sort(key=lambda outcome: outcome.index)
+    counts = {"inserted": 0, "rejected": 0, "failed": 0}
+    for outcome in outcomes:
+        counts[outcome.outcome] += 1
+    return BulkJobRawScrapeResponse(
+        received=received,
+        results=[BulkRowOutcomeResponse.from_outcome(outcome) for outcome in outcomes],
+        **counts,
+    )
@@ -3,7 +3,7 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import Session
 
 from core.entity.JobSourceEntity import JobSourceEntity
@@ -11,6 +11,7 @@ from core.enums.job_source_name import JobSourceName
 from core.enums.scrape_type import ScrapeType
 from core.enums.scraping_schedule import ScrapingSchedule
 from core.repository.job_source_repository import JobSourceRepository
+from core.scraping.rate_limit import parse_rate_limit
 from core.service import JobSourceService
 from core.service_impl import JobSourceServiceImpl
 from ..database import get_db
@@ -31,6 +32,7 @@ class JobSourceResponse(BaseModel):
     apiEndpoint: Optional[str]
     apiKey: Optional[str]
     companyName: Optional[str]
+    rateLimitPerMin: Optional[str] = None
 
     @classmethod
     def from_entity(cls, entity: JobSourceEntity) -> "JobSourceResponse":
@@ -72,6 +74,7 @@ class JobSourceResponse(BaseModel):
             apiEndpoint=entity.api_endpoint,
             apiKey=entity.api_key,
             companyName=getattr(entity, "field1", None),
+            rateLimitPerMin=entity.rate_limit_per_min,
         )
 
 
@@ -84,6 +87,13 @@ class CreateJobSourceBody(BaseModel):
     apiEndpoint: Optional[str] = Field(default=None, max_length=500)
     apiKey: Optional[str] = Field(default=None, max_length=500)
     companyName: Optional[str] = Field(default=None, max_length=255)
+    rateLimitPerMin: Optional[str] = Field(default=None, max_length=50, description="Requests per minute, e.g. 30 or 30/min.")
+
+    @field_validator("rateLimitPerMin")
+    @classmethod
+    def _check_rate_limit(cls, value: Optional[str]) -> Optional[str]:
+        parse_rate_limit(value)
+        return value.strip() if value else None
 
 
 def get_service(db: Session = Depends(get_db)) -> JobSourceService:
@@ -123,5 +133,6 @@ def register_job_source(body: CreateJobSourceBody, service: JobSourceService = D
         api_endpoint=body.apiEndpoint,
         api_key=body.apiKey,
         company_name=body.companyName,
+        rate_limit_per_min=body.rateLimitPerMin,
     )
     return JobSourceResponse.from_entity(created)
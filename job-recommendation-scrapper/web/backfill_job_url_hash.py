@@ -0,0 +1,36 @@
+"""Fill job_raw_scrape.job_url_hash for rows written before the column existed.
+
+    python -m web.backfill_job_url_hash --batch-size 5000
+
+Safe to stop and rerun: only rows whose hash is still NULL are touched.
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from core.repository.job_raw_scrape_repository import JobRawScrapeRepository
+
+from .database import SessionLocal
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    total = 0
+    with SessionLocal() as session:
+        repo = JobRawScrapeRepository(session)
+        while True:
+            updated = repo.backfill_url_hashes(args.batch_size)
+            if not updated:
+                break
+            total += updated
+            print(f"Backfilled {total} rows", flush=True)
+    print(f"Done: {total} rows updated.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
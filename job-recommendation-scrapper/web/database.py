@@ -7,7 +7,11 @@ db_bundle = build_database_bundle(
     base_entity=BaseEntity,
     model_modules=[
         "core.entity.JobSourceEntity",
+        "core.entity.JobRawContentEntity",
         "core.entity.JobRawScrapeEntity",
+        "core.entity.JobUrlValidatorEntity",
+        "core.entity.JobMasterEntity",
+        "core.entity.JobNormalizationCheckpointEntity",
     ],
     env_vars=("SCRAPPER_DATABASE_URL", "DATABASE_URL"),
 )
@@ -0,0 +1,34 @@
+"""Parse new successful raw scrapes into job_master.
+
+    python -m web.normalize_jobs
+    python -m web.normalize_jobs --max-chunks 10
+
+Each run resumes from the stored high-water mark, so it is safe to stop
+and rerun or to schedule periodically.
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from core.scraping import JobNormalizer, JobNormalizerConfig
+
+from .database import SessionLocal
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-chunks", type=int, default=None, help="Stop after this many chunks.")
+    args = parser.parse_args(argv)
+
+    stats = JobNormalizer(SessionLocal, JobNormalizerConfig.from_env()).run(max_chunks=args.max_chunks)
+    print(
+        f"Chunks: {stats.chunks}, scrapes read: {stats.scrapes_read} "
+        f"({stats.scrapes_without_jobs} without jobs, {stats.scrapes_failed} unreadable), jobs upserted: {stats.jobs_upserted}, "
+        f"high-water mark: {stats.last_raw_scrape_id}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
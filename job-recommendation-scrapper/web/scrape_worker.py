@@ -0,0 +1,40 @@
+"""Run the scrape engine against the configured database.
+
+    python -m web.scrape_worker          # poll for due sources until stopped
+    python -m web.scrape_worker --once   # scrape what is due now and exit
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional, Sequence
+
+from core.scraping import ScrapeEngine, ScrapeEngineConfig, SourceRateLimiter
+
+from .database import SessionLocal
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="Run a single pass instead of polling.")
+    args = parser.parse_args(argv)
+
+    engine = ScrapeEngine(SessionLocal, ScrapeEngineConfig.from_env(), rate_limiter=SourceRateLimiter.from_env())
+    if args.once:
+        stats = asyncio.run(engine.run_once())
+        print(
+            f"Sources due: {stats.sources_due} ({stats.skipped} skipped), fetched: {stats.fetched} "
+            f"({stats.succeeded} ok, {stats.unchanged} unchanged, {stats.failed} failed), written: {stats.written}, "
+            f"write failures: {stats.write_failed}"
+        )
+        return 0
+
+    try:
+        asyncio.run(engine.run_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
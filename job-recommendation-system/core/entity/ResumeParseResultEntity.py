@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, Column, ForeignKey
+
+from backend_common.orm.resume_parse import ResumeParseResultColumns
+from core.baseEntity.baseEntity import BaseEntity
+
+
+class ResumeParseResultEntity(ResumeParseResultColumns, BaseEntity):
+    """Structured resume-reader output for one uploaded file of one user."""
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id"),
+        nullable=False,
+    )
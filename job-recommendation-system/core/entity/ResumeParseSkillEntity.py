@@ -0,0 +1,6 @@
+from backend_common.orm.resume_parse import ResumeParseSkillColumns
+from core.baseEntity.baseEntity import BaseEntity
+
+
+class ResumeParseSkillEntity(ResumeParseSkillColumns, BaseEntity):
+    """One canonical skill found in a parse result, denormalized by user for lookups."""
@@ -1,5 +1,11 @@
 from .userRepo import UserRepository
 from .userResumeRepository import UserResumeRepository
 from .userResumeVersionRepository import UserResumeVersionRepository
+from .resumeParseResultRepository import ResumeParseResultRepository
 
-__all__ = ["UserRepository", "UserResumeRepository", "UserResumeVersionRepository"]
+__all__ = [
+    "ResumeParseResultRepository",
+    "UserRepository",
+    "UserResumeRepository",
+    "UserResumeVersionRepository",
+]
@@ -0,0 +1,75 @@
+from typing import List, Mapping, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend_common.skills import canonicalize_skill, skill_aliases_from_env
+
+from core.entity.ResumeParseResultEntity import ResumeParseResultEntity
+from core.entity.ResumeParseSkillEntity import ResumeParseSkillEntity
+
+
+class ResumeParseResultRepository:
+    """Read access to the parse results resume-reader persists."""
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def get_latest_for_user(self, user_id: int) -> Optional[ResumeParseResultEntity]:
+        return (
+            self.db_session.query(ResumeParseResultEntity)
+            .filter(ResumeParseResultEntity.user_id == user_id)
+            .order_by(ResumeParseResultEntity.loggedInTime.desc(), ResumeParseResultEntity.id.desc())
+            .first()
+        )
+
+    def get_by_user_and_hash(self, user_id: int, content_hash: str) -> Optional[ResumeParseResultEntity]:
+        return (
+            self.db_session.query(ResumeParseResultEntity)
+            .filter(
+                ResumeParseResultEntity.user_id == user_id,
+                ResumeParseResultEntity.content_hash == content_hash,
+            )
+            .first()
+        )
+
+    def get_skills_for_user(self, user_id: int) -> List[str]:
+        rows = (
+            self.db_session.query(ResumeParseSkillEntity.skill)
+            .filter(ResumeParseSkillEntity.user_id == user_id)
+            .distinct()
+            .order_by(ResumeParseSkillEntity.skill)
+            .all()
+        )
+        return [row.skill for row in rows]
+
+    def find_user_ids_with_skills(
+        self,
+        skills: Sequence[str],
+        match_all: bool = True,
+        limit: int = 100,
+        aliases: Optional[Mapping[str, str]] = None,
+    ) -> List[int]:
+        """Users whose parsed resumes mention ``skills`` (all of them, or any with ``match_all=False``).
+
+        Served from the (skill, user_id) index. resume-reader stores canonical
+        names, so each term is first mapped through ``aliases``, by default
+        the taxonomy resume-reader is configured with ("k8s" finds
+        "kubernetes"); terms the taxonomy does not know are matched as typed.
+        """
+
+        if aliases is None:
+            aliases = skill_aliases_from_env()
+        wanted = sorted({canonicalize_skill(skill, aliases) for skill in skills if skill and skill.strip()})
+        if not wanted:
+            return []
+
+        query = (
+            self.db_session.query(ResumeParseSkillEntity.user_id)
+            .filter(ResumeParseSkillEntity.skill.in_(wanted))
+            .group_by(ResumeParseSkillEntity.user_id)
+        )
+        if match_all and len(wanted) > 1:
+            query = query.having(func.count(func.distinct(ResumeParseSkillEntity.skill)) == len(wanted))
+        rows = query.order_by(ResumeParseSkillEntity.user_id).limit(limit).all()
+        return [row.user_id for row in rows]
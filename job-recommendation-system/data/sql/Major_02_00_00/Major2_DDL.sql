@@ -0,0 +1,63 @@
+SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS;
+SET FOREIGN_KEY_CHECKS = 0;
+
+-- Structured output of resume-reader, one row per (user, uploaded file).
+-- Matching and search read these instead of re-parsing resumes.
+CREATE TABLE IF NOT EXISTS resume_parse_result (
+  id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  user_id           BIGINT UNSIGNED NOT NULL,
+  content_hash      CHAR(64)     NOT NULL COMMENT 'SHA-256 of the uploaded file',
+  filename          VARCHAR(255) NULL,
+  analyzer_version  VARCHAR(32)  NOT NULL COMMENT 'resume-reader ANALYZER_VERSION that produced the row',
+  taxonomy_version  VARCHAR(64)  NOT NULL COMMENT 'Skill taxonomy version used for resume_parse_skill',
+  probable_name     VARCHAR(255) NULL,
+  emails_json          JSON NULL,
+  phone_numbers_json   JSON NULL,
+  urls_json            JSON NULL,
+  sections_json        JSON NULL,
+  section_headers_json JSON NULL,
+  page_count        INT NULL,
+  -- BaseEntity fields
+  rowstate        INT NOT NULL DEFAULT 1,
+  field1          VARCHAR(200) NULL,
+  field2          VARCHAR(200) NULL,
+  field3          BIGINT NULL,
+  field4          BIGINT NULL,
+  loggedBy        BIGINT NOT NULL DEFAULT 0,
+  lastUpdatedBy   BIGINT NOT NULL DEFAULT 0,
+  loggedInTime    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  lastUpdateTime  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_resume_parse_result_user_hash (user_id, content_hash),
+  KEY idx_resume_parse_result_user_time (user_id, loggedInTime),
+  CONSTRAINT fk_resume_parse_result_user FOREIGN KEY (user_id) REFERENCES users (id)
+) ENGINE=InnoDB
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+-- One row per canonical skill found in a parse result. user_id is repeated
+-- here so "who has skill X" is answered from the (skill, user_id) index alone.
+CREATE TABLE IF NOT EXISTS resume_parse_skill (
+  id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  parse_result_id BIGINT UNSIGNED NOT NULL,
+  user_id         BIGINT UNSIGNED NOT NULL,
+  skill           VARCHAR(128) NOT NULL,
+  -- BaseEntity fields
+  rowstate        INT NOT NULL DEFAULT 1,
+  field1          VARCHAR(200) NULL,
+  field2          VARCHAR(200) NULL,
+  field3          BIGINT NULL,
+  field4          BIGINT NULL,
+  loggedBy        BIGINT NOT NULL DEFAULT 0,
+  lastUpdatedBy   BIGINT NOT NULL DEFAULT 0,
+  loggedInTime    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  lastUpdateTime  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_resume_parse_skill_result_skill (parse_result_id, skill),
+  KEY idx_resume_parse_skill_skill_user (skill, user_id),
+  KEY idx_resume_parse_skill_user (user_id),
+  CONSTRAINT fk_resume_parse_skill_result FOREIGN KEY (parse_result_id)
+    REFERENCES resume_parse_result (id) ON DELETE CASCADE
+) ENGINE=InnoDB
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;
@@ -7,6 +7,8 @@ db_bundle = build_database_bundle(
         "core.entity.UserEntity",
         "core.entity.UserResumeEntity",
         "core.entity.UserResumeVersionEntity",
+        "core.entity.ResumeParseResultEntity",
+        "core.entity.ResumeParseSkillEntity",
     ],
     env_vars=("DATABASE_URL",),
 )
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Numeric, String, Text, UniqueConstraint
 
 from core.baseEntity.baseEntity import BaseEntity
 from core.constants import TableConstant
@@ -8,6 +8,9 @@ class JobMasterEntity(BaseEntity):
     """ORM mapping for job_master table."""
 
     __tablename__ = TableConstant.JOB_MASTER
+    __table_args__ = (
+        UniqueConstraint("source_id", "external_job_id", name="uq_job_master_source_external"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     external_job_id = Column(String(255), nullable=True)
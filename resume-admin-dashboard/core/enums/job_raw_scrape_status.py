@@ -17,3 +17,5 @@ class JobRawScrapeStatus(IntEnum):
 
     SUCCESS = (1000, "SUCCESS")
     ERROR = (1001, "ERROR")
+    # Re-fetch answered 304 or with an identical payload; nothing new was stored.
+    UNCHANGED = (1002, "UNCHANGED")
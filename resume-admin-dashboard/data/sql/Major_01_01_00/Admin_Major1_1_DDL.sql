@@ -0,0 +1,4 @@
+-- One row per posting per source: the scrapper's normalizer upserts job_master
+-- on this key with INSERT ... ON DUPLICATE KEY UPDATE.
+ALTER TABLE job_master
+  ADD UNIQUE KEY uq_job_master_source_external (source_id, external_job_id);
@@ -0,0 +1,77 @@
+"""Microbenchmark for contact extraction on long resumes.
+
+Run from the resume-reader directory::
+
+    python -m benchmarks.contacts
+
+Compares ``extract_contacts`` (one scan for URLs and emails, one for
+phones) against the previous implementation, which made one ``finditer``
+pass per pattern, on synthetic resumes of increasing length. Each document also carries the
+``CONTACT_EDGE_CASES`` lines, and the run fails if the two implementations
+disagree on the phones found there.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks.corpus import CorpusSpec, generate_lines  # noqa: E402
+from core.analyzer import EMAIL_REGEX, PHONE_REGEX, URL_REGEX, AnalysisContext, extract_contacts  # noqa: E402
+
+SIZES = (12, 60, 240, 960)
+
+# Phones glued to labels or punctuation, which a shared email boundary once dropped.
+CONTACT_EDGE_CASES = (
+    "Mob.9876543210",
+    "Tel.+44 20 7946 0958",
+    "Phone-+1 415 555 0134",
+    "WhatsApp_919812345678",
+    "Call (020) 7946 0958 or mail jane.doe@example.org",
+)
+
+
+def extract_contacts_three_pass(text: str) -> Dict[str, List[str]]:
+    """The pre-single-scan implementation, kept as the reference point."""
+
+    emails = sorted({match.group(0) for match in EMAIL_REGEX.finditer(text)})
+    phones = sorted({re.sub(r"\s+", " ", match.group(0)).strip() for match in PHONE_REGEX.finditer(text)})
+    urls = sorted({match.group(0).rstrip(".,") for match in URL_REGEX.finditer(text)})
+    return {"emails": emails, "phones": phones, "urls": urls}
+
+
+def check_edge_cases() -> bool:
+    text = "\n".join(CONTACT_EDGE_CASES)
+    expected = extract_contacts_three_pass(text)["phones"]
+    found = extract_contacts(AnalysisContext(text))["phones"]
+    if found != expected:
+        print(f"Phone mismatch on edge cases: expected {expected}, got {found}")
+        return False
+    return True
+
+
+def main() -> int:
+    if not check_edge_cases():
+        return 1
+    print(f"{'lines':>8}{'KiB':>8}{'three-pass ms':>16}{'current ms':>16}{'speedup':>10}")
+    for lines_per_section in SIZES:
+        lines = generate_lines(CorpusSpec(sections=7, lines_per_section=lines_per_section, seed=1))
+        text = "\n".join([*lines[:3], *CONTACT_EDGE_CASES, *lines[3:]])
+        context = AnalysisContext(text)
+        number = max(1, 2000 // lines_per_section)
+        before = min(timeit.repeat(lambda: extract_contacts_three_pass(text), number=number, repeat=5)) / number
+        after = min(timeit.repeat(lambda: extract_contacts(context), number=number, repeat=5)) / number
+        print(
+            f"{text.count(chr(10)) + 1:>8}{len(text) / 1024:>8.1f}"
+            f"{before * 1000:>16.3f}{after * 1000:>16.3f}{before / after:>9.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
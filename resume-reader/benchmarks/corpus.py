@@ -0,0 +1,231 @@
+import io
+import random
+import zipfile
+from dataclasses import dataclass
+from typing import List, Sequence
+from xml.sax.saxutils import escape
+
+FORMAT_TXT = "txt"
+FORMAT_DOCX = "docx"
+FORMAT_PDF = "pdf"
+FORMATS = (FORMAT_TXT, FORMAT_DOCX, FORMAT_PDF)
+
+_FIRST_NAMES = ["Asha", "Ben", "Carla", "Dev", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jon"]
+_LAST_NAMES = ["Kumar", "Lopez", "Miller", "Nakamura", "Okafor", "Patel", "Quinn", "Rossi", "Singh", "Tan"]
+_SECTION_TITLES = [
+    "Professional Summary",
+    "Work Experience",
+    "Education",
+    "Technical Skills",
+    "Projects",
+    "Certifications",
+    "Achievements",
+]
+_FILLER_WORDS = (
+    "designed built maintained scaled migrated reviewed mentored delivered services pipelines "
+    "platform customers latency throughput reliability team features release quality data "
+    "reporting integration workflow internal external stakeholders roadmap improved reduced"
+).split()
+_SKILL_WORDS = [
+    "Python", "Java", "TypeScript", "React", "Node.js", "C++", "C#", "SQL", "PostgreSQL",
+    "MongoDB", "AWS", "Azure", "Docker", "Kubernetes", "Git", "Linux", "Django", "FastAPI",
+    "Spring", "Go", "Kotlin", "Machine Learning", "Data Analysis", "Pandas", "PyTorch", "Scrum",
+]
+
+# Helvetica at 11pt with 14pt leading fits about 50 lines on a US Letter page.
+PDF_LINES_PER_PAGE = 50
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of one synthetic resume.
+
+    ``lines_per_section`` drives document size, ``skill_density`` is the
+    chance that a body line mentions a known skill, and ``seed`` makes the
+    output reproducible byte for byte.
+    """
+
+    fmt: str = FORMAT_TXT
+    sections: int = 5
+    lines_per_section: int = 12
+    skill_density: float = 0.3
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class CorpusDocument:
+    filename: str
+    content: bytes
+    spec: CorpusSpec
+
+
+def generate_lines(spec: CorpusSpec) -> List[str]:
+    rng = random.Random(spec.seed)
+    first = rng.choice(_FIRST_NAMES)
+    last = rng.choice(_LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        f"https://github.com/{first.lower()}{last.lower()}",
+        "",
+    ]
+
+    for index in range(spec.sections):
+        lines.append(_SECTION_TITLES[index % len(_SECTION_TITLES)])
+        for _ in range(spec.lines_per_section):
+            words = rng.choices(_FILLER_WORDS, k=rng.randint(6, 14))
+            if rng.random() < spec.skill_density:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(_SKILL_WORDS) + ",")
+            lines.append(" ".join(words).capitalize() + ".")
+        lines.append("")
+    return lines
+
+
+def render_txt(lines: Sequence[str]) -> bytes:
+    return "\n".join(lines).encode("utf-8")
+
+
+def render_docx(lines: Sequence[str]) -> bytes:
+    """Build a minimal WordprocessingML package without python-docx."""
+
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t xml:space=\"preserve\">{escape(line)}</w:t></w:r></w:p>" for line in lines
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{paragraphs}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    relationships = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/>'
+        "</Relationships>"
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        # Fixed timestamps keep the archive bytes identical across runs.
+        for name, body in (
+            ("[Content_Types].xml", content_types),
+            ("_rels/.rels", relationships),
+            ("word/document.xml", document),
+        ):
+            archive.writestr(zipfile.ZipInfo(name, date_time=(2000, 1, 1, 0, 0, 0)), body)
+    return buffer.getvalue()
+
+
+def _pdf_escape(line: str) -> bytes:
+    escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return escaped.encode("latin-1", errors="replace")
+
+
+def render_pdf(lines: Sequence[str]) -> bytes:
+    """Build an uncompressed single-font PDF with ``PDF_LINES_PER_PAGE`` lines per page."""
+
+    pages = [lines[start:start + PDF_LINES_PER_PAGE] for start in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+    objects: List[bytes] = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    font_id = 1
+    # Objects are numbered from 1: the font, a (content, page) pair per page,
+    # then the page tree and the catalog.
+    pages_id = 2 * len(pages) + 2
+    page_ids: List[int] = []
+
+    for page_lines in pages:
+        stream = b"\n".join(
+            [b"BT /F1 11 Tf 14 TL 50 760 Td"]
+            + [b"(" + _pdf_escape(line) + b") Tj T*" for line in page_lines]
+            + [b"ET"]
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content_id, font_id)
+        )
+        page_ids.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects.append(b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    catalog_id = len(objects)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog_id,
+        xref_offset,
+    )
+    return bytes(output)
+
+
+_RENDERERS = {FORMAT_TXT: render_txt, FORMAT_DOCX: render_docx, FORMAT_PDF: render_pdf}
+
+
+def generate_document(spec: CorpusSpec) -> CorpusDocument:
+    if spec.fmt not in _RENDERERS:
+        raise ValueError(f"Unsupported corpus format '{spec.fmt}'. Allowed values: {', '.join(FORMATS)}")
+    content = _RENDERERS[spec.fmt](generate_lines(spec))
+    filename = f"resume-{spec.seed:04d}-s{spec.sections}x{spec.lines_per_section}.{spec.fmt}"
+    return CorpusDocument(filename=filename, content=content, spec=spec)
+
+
+def generate_corpus(
+    count: int,
+    *,
+    formats: Sequence[str] = FORMATS,
+    sections: int = 5,
+    lines_per_section: int = 12,
+    skill_density: float = 0.3,
+    seed: int = 0,
+) -> List[CorpusDocument]:
+    """Return ``count`` resumes per format, seeded from ``seed`` onwards."""
+
+    return [
+        generate_document(
+            CorpusSpec(
+                fmt=fmt,
+                sections=sections,
+                lines_per_section=lines_per_section,
+                skill_density=skill_density,
+                seed=seed + index,
+            )
+        )
+        for fmt in formats
+        for index in range(count)
+    ]
+
+
+__all__ = [
+    "FORMATS",
+    "FORMAT_DOCX",
+    "FORMAT_PDF",
+    "FORMAT_TXT",
+    "CorpusDocument",
+    "CorpusSpec",
+    "generate_corpus",
+    "generate_document",
+    "generate_lines",
+    "render_docx",
+    "render_pdf",
+    "render_txt",
+]
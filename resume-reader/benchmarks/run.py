@@ -0,0 +1,211 @@
+"""Stage-by-stage resume-reader benchmark.
+
+Run from the resume-reader directory::
+
+    python -m benchmarks.run --count 20 --iterations 5
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.25
+
+Every document in a deterministic synthetic corpus is pushed through each
+stage separately, and then through the full ``read_resume`` path. The
+report gives throughput and p50/p99 latency per format and stage. When a
+baseline is given, a stage whose p50 or p99 is slower than the baseline by
+more than ``--tolerance`` is flagged and the exit status is 1.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks.corpus import FORMATS, CorpusDocument, generate_corpus  # noqa: E402
+from core import ResumeReaderRequestVO, ResumeReaderServiceImpl  # noqa: E402
+from core.analyzer import (  # noqa: E402
+    AnalysisContext,
+    detect_sections,
+    detect_skills,
+    extract_contacts,
+    infer_probable_name,
+)
+from core.parser import ExtractionLimits, extract_text  # noqa: E402
+
+STAGES = (
+    "extract_text",
+    "analysis_context",
+    "extract_contacts",
+    "detect_sections",
+    "detect_skills",
+    "infer_probable_name",
+    "read_resume",
+)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _timed(samples: List[float], call: Callable[[], object]) -> object:
+    started = time.perf_counter()
+    result = call()
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def run_document(
+    document: CorpusDocument,
+    service: ResumeReaderServiceImpl,
+    limits: ExtractionLimits,
+    timings: Dict[str, List[float]],
+) -> None:
+    text = _timed(timings["extract_text"], lambda: extract_text(document.filename, document.content, limits))
+    # The context splits lines lazily; time that pass on its own so the
+    # analyzers below are measured against a ready context.
+    context = AnalysisContext(text)
+    _timed(timings["analysis_context"], lambda: context.compact_text)
+    contacts = _timed(timings["extract_contacts"], lambda: extract_contacts(context))
+    _timed(timings["detect_sections"], lambda: detect_sections(context))
+    _timed(timings["detect_skills"], lambda: detect_skills(context))
+    _timed(timings["infer_probable_name"], lambda: infer_probable_name(context, contacts["emails"]))
+
+    request = ResumeReaderRequestVO(filename=document.filename, file_bytes=document.content)
+    _timed(timings["read_resume"], lambda: service.read_resume(request))
+
+
+def run_benchmark(corpus: Sequence[CorpusDocument], iterations: int) -> Dict[str, Dict[str, float]]:
+    limits = ExtractionLimits.from_env()
+    service = ResumeReaderServiceImpl(limits)
+
+    # One untimed document per format warms imports and regex caches.
+    warmup = {document.spec.fmt: document for document in reversed(corpus)}
+    for document in warmup.values():
+        run_document(document, service, limits, defaultdict(list))
+
+    timings: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    volume: Dict[str, int] = defaultdict(int)
+    for _ in range(iterations):
+        for document in corpus:
+            run_document(document, service, limits, timings[document.spec.fmt])
+            volume[document.spec.fmt] += len(document.content)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for fmt, stage_timings in sorted(timings.items()):
+        for stage in STAGES:
+            samples = stage_timings[stage]
+            total = sum(samples)
+            results[f"{fmt}/{stage}"] = {
+                "samples": len(samples),
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+                "docs_per_s": len(samples) / total if total else 0.0,
+                "mb_per_s": volume[fmt] / total / 1_000_000 if total else 0.0,
+            }
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            before = previous.get(metric)
+            if before and current[metric] > before * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {before:.3f} -> {current[metric]:.3f} "
+                    f"(+{(current[metric] / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def print_report(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]]) -> None:
+    header = f"{'stage':<32}{'p50 ms':>10}{'p99 ms':>10}{'docs/s':>12}{'MB/s':>10}"
+    if baseline is not None:
+        header += f"{'base p50':>10}"
+    print(header)
+    for name, current in results.items():
+        row = (
+            f"{name:<32}{current['p50_ms']:>10.3f}{current['p99_ms']:>10.3f}"
+            f"{current['docs_per_s']:>12.1f}{current['mb_per_s']:>10.2f}"
+        )
+        if baseline is not None:
+            previous = baseline.get(name, {}).get("p50_ms")
+            row += f"{previous:>10.3f}" if previous is not None else f"{'-':>10}"
+        print(row)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Comma-separated formats to generate.")
+    parser.add_argument("--count", type=int, default=20, help="Documents per format.")
+    parser.add_argument("--sections", type=int, default=5)
+    parser.add_argument("--lines-per-section", type=int, default=12)
+    parser.add_argument("--skill-density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=5, help="Passes over the corpus.")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before flagging, e.g. 0.2 = 20%%.")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results as a new baseline.")
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    corpus = generate_corpus(
+        args.count,
+        formats=formats,
+        sections=args.sections,
+        lines_per_section=args.lines_per_section,
+        skill_density=args.skill_density,
+        seed=args.seed,
+    )
+    results = run_benchmark(corpus, args.iterations)
+
+    baseline = None
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    print_report(results, baseline)
+
+    if args.save_baseline is not None:
+        settings = {
+            "formats": formats,
+            "count": args.count,
+            "sections": args.sections,
+            "lines_per_section": args.lines_per_section,
+            "skill_density": args.skill_density,
+            "seed": args.seed,
+            "iterations": args.iterations,
+        }
+        args.save_baseline.write_text(
+            json.dumps({"corpus": settings, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline written to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
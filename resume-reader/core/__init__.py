@@ -1,9 +1,14 @@
+from .cache import ResumeParseCache
+from .executor import ResumeExecutorConfig, ResumeExtractionExecutor
 from .requestVO import ResumeReaderRequestVO
 from .responseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
 from .service import ResumeReaderService
 from .serviceImpl import ResumeReaderServiceImpl
 
 __all__ = [
+    "ResumeParseCache",
+    "ResumeExecutorConfig",
+    "ResumeExtractionExecutor",
     "ResumeReaderService",
     "ResumeReaderServiceImpl",
     "ResumeReaderRequestVO",
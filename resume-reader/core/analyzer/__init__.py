@@ -1,25 +1,56 @@
 from .analyzer import (
-    COMMON_SKILLS,
+    ANALYZER_VERSION,
+    CONTACT_REGEX,
     EMAIL_REGEX,
     PHONE_REGEX,
-    SECTION_HEADERS,
+    PHONE_SCAN_REGEX,
     URL_REGEX,
     detect_sections,
+    detect_sections_with_headers,
     detect_skills,
     extract_contacts,
     infer_probable_name,
     summarize,
 )
+from .context import AnalysisContext
+from .sections import SECTION_HEADERS, HeaderMatch, SectionClassifier, default_section_classifier
+from .skill_matcher import SkillMatcher
+from .taxonomy import (
+    COMMON_SKILL_ALIASES,
+    COMMON_SKILLS,
+    SkillTaxonomy,
+    TaxonomyStore,
+    builtin_taxonomy,
+    default_taxonomy_store,
+    load_taxonomy_file,
+    load_taxonomy_from_env,
+)
 
 __all__ = [
+    "ANALYZER_VERSION",
+    "AnalysisContext",
     "COMMON_SKILLS",
+    "COMMON_SKILL_ALIASES",
+    "CONTACT_REGEX",
     "EMAIL_REGEX",
+    "HeaderMatch",
     "PHONE_REGEX",
+    "PHONE_SCAN_REGEX",
     "SECTION_HEADERS",
+    "SectionClassifier",
+    "SkillMatcher",
+    "SkillTaxonomy",
+    "TaxonomyStore",
     "URL_REGEX",
+    "builtin_taxonomy",
+    "default_section_classifier",
+    "default_taxonomy_store",
     "detect_sections",
+    "detect_sections_with_headers",
     "detect_skills",
     "extract_contacts",
     "infer_probable_name",
+    "load_taxonomy_file",
+    "load_taxonomy_from_env",
     "summarize",
 ]
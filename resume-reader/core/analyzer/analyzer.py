@@ -1,125 +1,140 @@
 import re
-from typing import Dict, List, Optional
-
-EMAIL_REGEX = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
-PHONE_REGEX = re.compile(r"\+?\d[\d \-\(\)]{7,}\d")
-URL_REGEX = re.compile(r"https?://\S+")
-
-SECTION_HEADERS: Dict[str, List[str]] = {
-    "experience": [
-        "experience",
-        "work experience",
-        "professional experience",
-        "employment history",
-    ],
-    "education": ["education", "academic background", "academics"],
-    "skills": ["skills", "technical skills", "core skills"],
-    "projects": ["projects", "project experience"],
-    "certifications": ["certifications", "licenses", "certificates"],
-    "achievements": ["achievements", "awards", "honors"],
-    "summary": ["summary", "professional summary", "profile"],
-}
-
-COMMON_SKILLS = {
-    "python",
-    "java",
-    "javascript",
-    "typescript",
-    "react",
-    "angular",
-    "node.js",
-    "c++",
-    "c#",
-    "sql",
-    "mysql",
-    "postgresql",
-    "mongodb",
-    "aws",
-    "azure",
-    "gcp",
-    "docker",
-    "kubernetes",
-    "git",
-    "linux",
-    "html",
-    "css",
-    "sass",
-    "django",
-    "flask",
-    "fastapi",
-    "spring",
-    "hibernate",
-    "go",
-    "ruby",
-    "php",
-    "swift",
-    "kotlin",
-    "machine learning",
-    "data analysis",
-    "pandas",
-    "numpy",
-    "tensorflow",
-    "pytorch",
-    "scikit-learn",
-    "jira",
-    "agile",
-    "scrum",
-}
-
-
-def _normalize_line(line: str) -> str:
-    return line.strip()
-
-
-def _lower_compact(line: str) -> str:
-    return re.sub(r"\s+", " ", line.lower()).strip()
-
-
-def extract_contacts(text: str) -> Dict[str, List[str]]:
-    emails = sorted({match.group(0) for match in EMAIL_REGEX.finditer(text)})
-    phones = sorted({re.sub(r"\s+", " ", match.group(0)).strip() for match in PHONE_REGEX.finditer(text)})
-    urls = sorted({match.group(0).rstrip(".,") for match in URL_REGEX.finditer(text)})
-    return {"emails": emails, "phones": phones, "urls": urls}
-
-
-def detect_sections(lines: List[str]) -> Dict[str, List[str]]:
-    sections: Dict[str, List[str]] = {key: [] for key in SECTION_HEADERS}
+from typing import Dict, List, Optional, Tuple
+
+from .context import AnalysisContext
+from .sections import SectionClassifier, default_section_classifier
+from .taxonomy import SkillTaxonomy, default_taxonomy_store
+
+# Bump whenever analyzer output changes so cached parse results are invalidated.
+ANALYZER_VERSION = "6"
+
+EMAIL_PATTERN = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
+PHONE_PATTERN = r"\+?\d[\d \-\(\)]{7,}\d"
+URL_PATTERN = r"https?://\S+"
+
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+PHONE_REGEX = re.compile(PHONE_PATTERN)
+URL_REGEX = re.compile(URL_PATTERN)
+
+# One scanner for URLs and emails. A match may only start where the previous
+# character cannot be part of an email, which lets the engine reject most
+# positions with a single lookbehind instead of trying every alternative at
+# every character of every word.
+CONTACT_REGEX = re.compile(
+    r"(?<![a-zA-Z0-9_.+-])(?=[a-zA-Z0-9_.+-])"
+    rf"(?:(?P<url>{URL_PATTERN})|(?P<email>{EMAIL_PATTERN}))"
+)
+# Phones need a different boundary: they often follow a label with no space
+# ("Mob.9876543210", "Tel.+44 ..."), which the email boundary would reject.
+# Same matches as PHONE_PATTERN, but starting with a character class lets
+# the engine skip ahead to the next digit or "+" instead of trying every
+# position; a combined alternation loses that and runs about twice as slow.
+PHONE_SCAN_REGEX = re.compile(r"[\d+](?<![\d+][\d+])(?:(?<=\+)\d|(?<=\d))[\d \-\(\)]{7,}\d")
+
+_URL_TRAILING_PUNCTUATION = ".,;:!?'\""
+_URL_CLOSING_BRACKETS = {")": "(", "]": "[", "}": "{", ">": "<"}
+
+
+def _normalize_url(url: str) -> str:
+    """Drop sentence punctuation and unbalanced closing brackets from the end of ``url``."""
+
+    while url:
+        last = url[-1]
+        if last in _URL_TRAILING_PUNCTUATION:
+            url = url[:-1]
+        elif last in _URL_CLOSING_BRACKETS and url.count(last) > url.count(_URL_CLOSING_BRACKETS[last]):
+            url = url[:-1]
+        else:
+            break
+    return url
+
+
+def _normalize_email(email: str) -> str:
+    local, _, domain = email.partition("@")
+    return f"{local}@{domain.rstrip('.-').lower()}"
+
+
+def extract_contacts(context: AnalysisContext) -> Dict[str, List[str]]:
+    text = context.text
+    emails = set()
+    phones = set()
+    urls = set()
+    taken: List[Tuple[int, int]] = []
+    for match in CONTACT_REGEX.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        taken.append(match.span())
+        if kind == "email":
+            emails.add(_normalize_email(value))
+        else:
+            url = _normalize_url(value)
+            if url:
+                urls.add(url)
+
+    # Contacts do not overlap: skip digits that sit inside an email or URL.
+    span_index = 0
+    for match in PHONE_SCAN_REGEX.finditer(text):
+        start, end = match.span()
+        while span_index < len(taken) and taken[span_index][1] <= start:
+            span_index += 1
+        if span_index < len(taken) and taken[span_index][0] < end:
+            continue
+        phones.add(" ".join(match.group(0).split()))
+    return {"emails": sorted(emails), "phones": sorted(phones), "urls": sorted(urls)}
+
+
+def detect_sections_with_headers(
+    context: AnalysisContext,
+    classifier: Optional[SectionClassifier] = None,
+) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """Group lines under the section headers above them.
+
+    Returns the sections and, for each section found, the vocabulary variant
+    its first header matched.
+    """
+
+    classifier = classifier or default_section_classifier
+    sections: Dict[str, List[str]] = {key: [] for key in classifier.sections}
+    headers: Dict[str, str] = {}
     current_key: Optional[str] = None
 
-    for raw_line in lines:
-        line = _normalize_line(raw_line)
+    for line, normalized in zip(context.stripped_lines, context.normalized_lines):
         if not line:
             continue
-        normalized = _lower_compact(line)
-        matched_section = None
-        for key, headers in SECTION_HEADERS.items():
-            if any(normalized.startswith(header) for header in headers):
-                matched_section = key
-                break
-
-        if matched_section:
-            current_key = matched_section
+        match = classifier.classify(normalized)
+        if match is not None:
+            current_key = match.section
+            headers.setdefault(match.section, match.variant)
             continue
 
         if current_key:
             sections[current_key].append(line)
 
-    return {key: value for key, value in sections.items() if value}
+    return {key: value for key, value in sections.items() if value}, headers
+
+
+def detect_sections(
+    context: AnalysisContext,
+    classifier: Optional[SectionClassifier] = None,
+) -> Dict[str, List[str]]:
+    return detect_sections_with_headers(context, classifier)[0]
+
+
+def detect_skills(context: AnalysisContext, taxonomy: Optional[SkillTaxonomy] = None) -> List[str]:
+    """Canonical names of the skills mentioned in the text.
 
+    Pass the ``taxonomy`` snapshot the caller is working with so one request
+    never mixes two taxonomy versions; by default the current one is used.
+    """
 
-def detect_skills(text: str, section_map: Dict[str, List[str]]) -> List[str]:
-    tokens = text.lower()
-    found = {skill for skill in COMMON_SKILLS if skill in tokens}
-    skill_section = section_map.get("skills", [])
-    for entry in skill_section:
-        normalized = entry.lower()
-        for skill in COMMON_SKILLS:
-            if skill in normalized:
-                found.add(skill)
-    return sorted(found)
+    # Skills-section entries are lines of the text, so a single automaton pass
+    # over the compact text already covers them.
+    taxonomy = taxonomy or default_taxonomy_store.current
+    return sorted(taxonomy.matcher.find_all_normalized(context.compact_text))
 
 
-def infer_probable_name(lines: List[str], emails: List[str]) -> Optional[str]:
+def infer_probable_name(context: AnalysisContext, emails: List[str]) -> Optional[str]:
+    lines = context.lines
     if not lines:
         return None
 
@@ -135,12 +150,11 @@ def infer_probable_name(lines: List[str], emails: List[str]) -> Optional[str]:
     return first_candidates[0] if first_candidates else None
 
 
-def summarize(lines: List[str], limit: int = 5) -> List[str]:
+def summarize(context: AnalysisContext, limit: int = 5) -> List[str]:
     summary = []
-    for line in lines:
-        stripped = _normalize_line(line)
-        if stripped:
-            summary.append(stripped)
+    for line in context.stripped_lines:
+        if line:
+            summary.append(line)
         if len(summary) >= limit:
             break
     return summary
@@ -0,0 +1,97 @@
+import re
+from functools import cached_property
+from typing import List, Tuple
+
+_TOKEN_REGEX = re.compile(r"\S+")
+
+
+class AnalysisContext:
+    """Per-resume views of the extracted text, built once and shared by all analyzers.
+
+    The text is split into lines in a single pass; each line is kept as-is,
+    stripped, and lowercased with whitespace runs collapsed. ``compact_text``
+    is the normalized lines joined by single spaces (the form the skill
+    matcher scans), and ``line_offsets`` gives where each line starts in it so
+    a match position can be mapped back to its line. Analyzers should read
+    from these fields rather than re-normalizing the text themselves.
+
+    The line pass runs on first access, so analyzers that only need ``text``
+    (such as contact extraction) do not pay for it.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lines: List[str] = []
+        self._stripped_lines: List[str] = []
+        self._normalized_lines: List[str] = []
+        self._line_offsets: List[int] = []
+        self._compact_text = ""
+        self._split = False
+
+    def _split_lines(self) -> None:
+        if self._split:
+            return
+        self._split = True
+
+        lines = self.text.splitlines()
+        stripped_lines: List[str] = []
+        normalized_lines: List[str] = []
+        line_offsets: List[int] = []
+        compact_parts: List[str] = []
+        offset = 0
+
+        for line in lines:
+            stripped = line.strip()
+            stripped_lines.append(stripped)
+            if not stripped:
+                normalized_lines.append("")
+                line_offsets.append(offset)
+                continue
+
+            normalized = " ".join(stripped.lower().split())
+            normalized_lines.append(normalized)
+            if compact_parts:
+                offset += 1
+            line_offsets.append(offset)
+            compact_parts.append(normalized)
+            offset += len(normalized)
+
+        self._lines = lines
+        self._stripped_lines = stripped_lines
+        self._normalized_lines = normalized_lines
+        self._compact_text = " ".join(compact_parts)
+        self._line_offsets = line_offsets
+
+    @property
+    def lines(self) -> List[str]:
+        self._split_lines()
+        return self._lines
+
+    @property
+    def stripped_lines(self) -> List[str]:
+        self._split_lines()
+        return self._stripped_lines
+
+    @property
+    def normalized_lines(self) -> List[str]:
+        self._split_lines()
+        return self._normalized_lines
+
+    @property
+    def compact_text(self) -> str:
+        self._split_lines()
+        return self._compact_text
+
+    @property
+    def line_offsets(self) -> List[int]:
+        self._split_lines()
+        return self._line_offsets
+
+    @cached_property
+    def token_offsets(self) -> List[Tuple[int, int]]:
+        """``(start, end)`` spans of the whitespace-separated tokens in ``compact_text``."""
+
+        return [match.span() for match in _TOKEN_REGEX.finditer(self.compact_text)]
+
+
+__all__ = ["AnalysisContext"]
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
+
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "experience": [
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment history",
+    ],
+    "education": ["education", "academic background", "academics"],
+    "skills": ["skills", "technical skills", "core skills"],
+    "projects": ["projects", "project experience"],
+    "certifications": ["certifications", "licenses", "certificates"],
+    "achievements": ["achievements", "awards", "honors"],
+    "summary": ["summary", "professional summary", "profile"],
+}
+
+
+@dataclass(frozen=True)
+class HeaderMatch:
+    section: str
+    # The vocabulary entry that matched, normalized.
+    variant: str
+
+
+class _Node:
+    __slots__ = ("children", "match", "priority")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.match: Optional[HeaderMatch] = None
+        self.priority = 0
+
+
+class SectionClassifier:
+    """Classifies lines as section headers with a prefix trie over the vocabulary.
+
+    A line is a header when it starts with a vocabulary variant followed by
+    the end of the line or a non-alphanumeric character ("Skills:" matches,
+    "Skillset" does not). Classifying a line walks the trie once, so the cost
+    depends on the line length rather than on the vocabulary size. When
+    variants of several sections match, the section listed first in the
+    vocabulary wins, then the longest variant.
+    """
+
+    def __init__(self, vocabulary: Mapping[str, Sequence[str]]):
+        self._root = _Node()
+        self._sections = list(vocabulary)
+        entries = []
+        for priority, (section, variants) in enumerate(vocabulary.items()):
+            for variant in variants:
+                normalized = " ".join(variant.lower().split())
+                if normalized:
+                    self._add(normalized, section, priority)
+                    entries.append(f"{priority}\t{section}\t{normalized}")
+        self._fingerprint = hashlib.sha256("\n".join(sorted(entries)).encode("utf-8")).hexdigest()[:16]
+
+    def _add(self, variant: str, section: str, priority: int) -> None:
+        node = self._root
+        for char in variant:
+            node = node.children.setdefault(char, _Node())
+        if node.match is None or priority < node.priority:
+            node.match = HeaderMatch(section=section, variant=variant)
+            node.priority = priority
+
+    @classmethod
+    def from_file(cls, path: str) -> "SectionClassifier":
+        """Load ``{"section": ["variant", ...], ...}``; key order sets priority."""
+
+        with open(path, "r", encoding="utf-8") as handle:
+            vocabulary = json.load(handle)
+        if not isinstance(vocabulary, dict) or not all(isinstance(value, list) for value in vocabulary.values()):
+            raise ValueError(f"{path} must map section names to lists of header variants.")
+        return cls(vocabulary)
+
+    @classmethod
+    def from_env(cls) -> "SectionClassifier":
+        path = os.getenv("RESUME_READER_SECTION_HEADERS_PATH")
+        return cls.from_file(path) if path else cls(SECTION_HEADERS)
+
+    @property
+    def sections(self) -> List[str]:
+        return list(self._sections)
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def classify(self, normalized_line: str) -> Optional[HeaderMatch]:
+        """Match a lowercased, whitespace-collapsed line against the vocabulary."""
+
+        best: Optional[_Node] = None
+        node = self._root
+        last_index = len(normalized_line) - 1
+        for index, char in enumerate(normalized_line):
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.match is None:
+                continue
+            if index < last_index and normalized_line[index + 1].isalnum():
+                continue
+            if best is None or node.priority <= best.priority:
+                best = node
+        return best.match if best is not None else None
+
+
+default_section_classifier = SectionClassifier.from_env()
+
+
+__all__ = ["HeaderMatch", "SECTION_HEADERS", "SectionClassifier", "default_section_classifier"]
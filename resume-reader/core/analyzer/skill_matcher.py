@@ -0,0 +1,116 @@
+import hashlib
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+# Characters that make up a skill token. A match is only accepted when the
+# characters on either side of it are outside this set, which keeps "go" from
+# matching inside "good" and "java" from matching inside "javascript" while
+# still allowing skills such as "c++", "c#" and "node.js".
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_+#")
+# A match also may not start right after a dot, so an alias such as "js" is
+# not found inside "node.js".
+_LEADING_TOKEN_CHARS = _TOKEN_CHARS | {"."}
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every skill in a text in one pass.
+
+    Patterns are matched case-insensitively against token boundaries. Each
+    pattern maps to a label (its canonical skill name), so aliases can share a
+    label; plain iterables map every pattern to itself.
+    """
+
+    def __init__(self, patterns: Union[Mapping[str, str], Iterable[str]]):
+        if isinstance(patterns, Mapping):
+            items = patterns.items()
+        else:
+            items = ((pattern, pattern) for pattern in patterns)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[Tuple[int, str], ...]] = [()]
+        self._size = 0
+
+        entries = set()
+        for pattern, label in items:
+            normalized = " ".join(pattern.lower().split())
+            if normalized:
+                self._add(normalized, label)
+                entries.add(f"{normalized}\t{label}")
+
+        self._build_failure_links()
+        self._fingerprint = hashlib.sha256("\n".join(sorted(entries)).encode("utf-8")).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of the compiled patterns, usable as a taxonomy version."""
+        return self._fingerprint
+
+    def _add(self, pattern: str, label: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+
+        if not self._output[state]:
+            self._size += 1
+        self._output[state] = ((len(pattern), label),)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the labels of every pattern that occurs as a whole token in ``text``."""
+
+        return self.find_all_normalized(" ".join(text.lower().split()))
+
+    def find_all_normalized(self, haystack: str) -> Set[str]:
+        """Like :meth:`find_all` for text that is already lowercased with single spaces."""
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        root = goto[0]
+        last_index = len(haystack) - 1
+
+        found: Set[str] = set()
+        state = 0
+        for index, char in enumerate(haystack):
+            if state == 0 and char not in root:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, label in output[state]:
+                if label in found:
+                    continue
+                start = index - length + 1
+                if start > 0 and haystack[start - 1] in _LEADING_TOKEN_CHARS:
+                    continue
+                if index < last_index and haystack[index + 1] in _TOKEN_CHARS:
+                    continue
+                found.add(label)
+
+        return found
+
+
+__all__ = ["SkillMatcher"]
@@ -0,0 +1,153 @@
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from backend_common.skills import (
+    COMMON_SKILL_ALIASES,
+    COMMON_SKILLS,
+    SKILL_TAXONOMY_PATH_ENV,
+    builtin_skills,
+    compile_skill_aliases,
+    normalize_skill,
+    read_skill_taxonomy_file,
+)
+
+from .skill_matcher import SkillMatcher
+
+
+@dataclass(frozen=True)
+class SkillTaxonomy:
+    """Immutable, compiled skill taxonomy.
+
+    ``aliases`` maps every normalized spelling, canonical names included, to
+    its canonical skill, so :meth:`canonicalize` is a single dict lookup.
+    ``matcher`` finds all spellings in free text and reports canonical names.
+    Snapshots are never mutated; a new taxonomy means a new snapshot, and
+    ``aliases`` is a read-only view so a caller cannot edit one in place.
+    """
+
+    version: str
+    skills: FrozenSet[str]
+    aliases: Mapping[str, str] = field(repr=False)
+    matcher: SkillMatcher = field(repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.aliases, MappingProxyType):
+            object.__setattr__(self, "aliases", MappingProxyType(dict(self.aliases)))
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled, and process workers receive the
+        # taxonomy through pickling; send a plain copy and re-wrap it.
+        return (self.__class__, (self.version, self.skills, dict(self.aliases), self.matcher))
+
+    @classmethod
+    def build(
+        cls,
+        skills: Mapping[str, Iterable[str]],
+        version: Optional[str] = None,
+    ) -> "SkillTaxonomy":
+        """Compile ``{canonical: [alias, ...]}``.
+
+        Raises ``ValueError`` when one alias points at two different skills.
+        Without an explicit ``version`` the content digest is used.
+        """
+
+        aliases = compile_skill_aliases(skills)
+        matcher = SkillMatcher(aliases)
+        return cls(
+            version=version or f"sha-{matcher.fingerprint}",
+            skills=frozenset(aliases.values()),
+            aliases=aliases,
+            matcher=matcher,
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Optional[str]]], version: Optional[str] = None) -> "SkillTaxonomy":
+        """Compile ``(canonical, alias)`` rows, as read from a table; ``alias`` may be ``None``."""
+
+        skills: Dict[str, List[str]] = {}
+        for canonical, alias in rows:
+            skills.setdefault(canonical, [])
+            if alias:
+                skills[canonical].append(alias)
+        return cls.build(skills, version)
+
+    def canonicalize(self, term: str) -> Optional[str]:
+        return self.aliases.get(normalize_skill(term))
+
+
+def builtin_taxonomy() -> SkillTaxonomy:
+    taxonomy = SkillTaxonomy.build(builtin_skills())
+    return replace(taxonomy, version=f"builtin-{taxonomy.matcher.fingerprint}")
+
+
+def load_taxonomy_file(path: str) -> SkillTaxonomy:
+    """Load a JSON taxonomy file in the format :func:`read_skill_taxonomy_file` reads."""
+
+    version, skills = read_skill_taxonomy_file(path)
+    return SkillTaxonomy.build(skills, version=version)
+
+
+def load_taxonomy_from_env() -> SkillTaxonomy:
+    path = os.getenv(SKILL_TAXONOMY_PATH_ENV)
+    return load_taxonomy_file(path) if path else builtin_taxonomy()
+
+
+class TaxonomyStore:
+    """Holds the current :class:`SkillTaxonomy` and swaps it atomically.
+
+    Readers take ``current`` without locking: replacing the reference is a
+    single assignment, so a reader sees either the old snapshot or the new
+    one, never a mix. Callers that use the taxonomy more than once per
+    request should read ``current`` once and keep that snapshot. Swaps are
+    serialised and listeners run after each one (for example to recycle
+    worker processes that hold their own copy).
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy):
+        self._current = taxonomy
+        self._swap_lock = threading.Lock()
+        self._listeners: List[Callable[[SkillTaxonomy], None]] = []
+
+    @property
+    def current(self) -> SkillTaxonomy:
+        return self._current
+
+    def swap(self, taxonomy: SkillTaxonomy) -> SkillTaxonomy:
+        """Install ``taxonomy`` and return the snapshot it replaced."""
+
+        with self._swap_lock:
+            previous = self._current
+            self._current = taxonomy
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(taxonomy)
+        return previous
+
+    def reload(self) -> SkillTaxonomy:
+        """Swap in the taxonomy configured by RESUME_READER_SKILL_TAXONOMY_PATH."""
+
+        taxonomy = load_taxonomy_from_env()
+        self.swap(taxonomy)
+        return taxonomy
+
+    def add_listener(self, listener: Callable[[SkillTaxonomy], None]) -> None:
+        with self._swap_lock:
+            self._listeners.append(listener)
+
+
+default_taxonomy_store = TaxonomyStore(load_taxonomy_from_env())
+
+
+__all__ = [
+    "COMMON_SKILLS",
+    "COMMON_SKILL_ALIASES",
+    "SkillTaxonomy",
+    "TaxonomyStore",
+    "builtin_taxonomy",
+    "default_taxonomy_store",
+    "load_taxonomy_file",
+    "load_taxonomy_from_env",
+]
@@ -0,0 +1,3 @@
+from .batch import BatchItemResult, expand_archive, is_archive, iter_batch_results
+
+__all__ = ["BatchItemResult", "expand_archive", "is_archive", "iter_batch_results"]
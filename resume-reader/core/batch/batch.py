@@ -0,0 +1,143 @@
+import asyncio
+import zipfile
+import zlib
+from dataclasses import dataclass, replace
+from pathlib import PurePosixPath
+from typing import AsyncIterator, BinaryIO, List, Optional, Sequence
+
+from ..exceptions import ResumeExtractionError, ResumeTooLargeError
+from ..executor import ResumeExtractionExecutor
+from ..requestVO.ResumeReaderRequestVO import ResumeReaderRequestVO
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO
+from ..upload import SpoolConfig, SpooledUpload
+
+ARCHIVE_EXTENSIONS = {".zip"}
+_ENTRY_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Outcome of one file in a batch; exactly one of response/error is set."""
+
+    index: int
+    filename: str
+    response: Optional[ResumeReaderResponseVO] = None
+    error: Optional[Exception] = None
+
+
+def is_archive(filename: str) -> bool:
+    return PurePosixPath(filename or "").suffix.lower() in ARCHIVE_EXTENSIONS
+
+
+def expand_archive(
+    filename: str,
+    stream: BinaryIO,
+    config: SpoolConfig,
+    *,
+    max_entries: int,
+    max_entry_bytes: int,
+    max_total_bytes: int,
+) -> List[SpooledUpload]:
+    """Turn a zip archive into one spooled upload per contained file.
+
+    Directories and macOS resource-fork entries are skipped. Each entry is
+    streamed into a :class:`SpooledUpload`, so large entries spill to disk
+    like direct uploads. The entry count, the size of each entry and the
+    uncompressed total are checked against the archive's headers first and
+    enforced again on the bytes actually decompressed, since headers can lie.
+    The caller owns the returned uploads and must close them. This reads and
+    decompresses synchronously; call it off the event loop.
+    """
+
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile as exc:
+        raise ResumeExtractionError(f"{filename} is not a valid zip archive.") from exc
+
+    with archive:
+        entries = [
+            info
+            for info in archive.infolist()
+            if not info.is_dir() and not info.filename.startswith("__MACOSX/")
+        ]
+        if len(entries) > max_entries:
+            raise ResumeTooLargeError(
+                f"{filename} contains {len(entries)} files; the limit is {max_entries}."
+            )
+        for info in entries:
+            if info.file_size > max_entry_bytes:
+                raise ResumeTooLargeError(
+                    f"{info.filename} in {filename} exceeds the {max_entry_bytes} byte limit."
+                )
+        if sum(info.file_size for info in entries) > max_total_bytes:
+            raise ResumeTooLargeError(f"{filename} expands beyond the {max_total_bytes} byte batch limit.")
+
+        entry_config = replace(config, max_bytes=max_entry_bytes)
+        uploads: List[SpooledUpload] = []
+        remaining = max_total_bytes
+        try:
+            for info in entries:
+                upload = SpooledUpload(PurePosixPath(info.filename).name, entry_config)
+                uploads.append(upload)
+                with archive.open(info) as entry:
+                    for chunk in iter(lambda: entry.read(_ENTRY_CHUNK_BYTES), b""):
+                        remaining -= len(chunk)
+                        if remaining < 0:
+                            raise ResumeTooLargeError(
+                                f"{filename} expands beyond the {max_total_bytes} byte batch limit."
+                            )
+                        upload.write(chunk)
+                upload.finish()
+        except (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError, RuntimeError) as exc:
+            for upload in uploads:
+                upload.close()
+            raise ResumeExtractionError(f"{filename} could not be decompressed.") from exc
+        except BaseException:
+            for upload in uploads:
+                upload.close()
+            raise
+        return uploads
+
+
+async def iter_batch_results(
+    executor: ResumeExtractionExecutor,
+    requests: Sequence[ResumeReaderRequestVO],
+    *,
+    concurrency: int,
+) -> AsyncIterator[BatchItemResult]:
+    """Run ``requests`` through ``executor`` and yield results as they complete.
+
+    At most ``concurrency`` jobs (never more than the executor's capacity) are
+    in flight. When other traffic fills the pool a job waits for a free slot
+    for up to the executor's job timeout before it is reported as busy.
+    Failures are yielded as results rather than raised so one bad file never
+    aborts the rest of the batch. Closing the iterator early cancels the
+    outstanding jobs.
+    """
+
+    if not requests:
+        return
+
+    results: "asyncio.Queue[BatchItemResult]" = asyncio.Queue()
+    pending = iter(enumerate(requests))
+
+    async def _worker() -> None:
+        for index, request in pending:
+            try:
+                response = await executor.run_when_available(request)
+                result = BatchItemResult(index=index, filename=request.filename, response=response)
+            except Exception as exc:  # noqa: BLE001
+                result = BatchItemResult(index=index, filename=request.filename, error=exc)
+            await results.put(result)
+
+    worker_count = max(1, min(concurrency, executor.config.capacity, len(requests)))
+    workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+    try:
+        for _ in range(len(requests)):
+            yield await results.get()
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+__all__ = ["BatchItemResult", "expand_archive", "is_archive", "iter_batch_results"]
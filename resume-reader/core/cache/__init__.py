@@ -0,0 +1,3 @@
+from .cache import ResumeParseCache, build_cache_key
+
+__all__ = ["ResumeParseCache", "build_cache_key"]
@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..analyzer import ANALYZER_VERSION
+from ..requestVO.ResumeReaderRequestVO import ResumeReaderRequestVO
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVOData
+
+
+def build_cache_key(request: ResumeReaderRequestVO, namespace: str = "") -> str:
+    """Content address for a parse result.
+
+    The file extension is part of the key because it selects the parser, and
+    the analyzer version is included so a release that changes analysis
+    output never serves stale entries. ``namespace`` carries service settings
+    (such as extraction limits, the skill taxonomy version and the installed
+    extractor backends) that also affect the result.
+    """
+
+    digest = request.content_hash
+    if digest is None and request.file_path is not None:
+        hasher = hashlib.sha256()
+        with open(request.file_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(64 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+    elif digest is None:
+        digest = hashlib.sha256(request.file_bytes).hexdigest()
+    extension = Path(request.filename or "").suffix.lower()
+    return f"{digest}:{extension}:{ANALYZER_VERSION}:{namespace}"
+
+
+class ResumeParseCache:
+    """Two-tier cache of parse results keyed by :func:`build_cache_key`.
+
+    The memory tier is a bounded LRU. The optional disk tier stores one JSON
+    document per key under ``disk_dir`` so results survive restarts; disk
+    hits are promoted into memory. The disk tier is bounded too: entries
+    older than ``disk_max_age_seconds`` are dropped, and once the directory
+    grows past ``disk_max_bytes`` the least recently used files are removed
+    (0 disables either bound). Async callers should use :meth:`get_async`
+    and :meth:`put_async`, which keep disk access off the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_dir: Optional[str] = None,
+        *,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+        disk_max_age_seconds: float = 7 * 24 * 3600,
+    ):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, ResumeReaderResponseVOData]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk_max_bytes = disk_max_bytes
+        self._disk_max_age_seconds = disk_max_age_seconds
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        if self._disk_dir:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResumeParseCache"]:
+        """Build a cache from RESUME_READER_CACHE_* settings, or None when disabled."""
+
+        max_entries = int(os.getenv("RESUME_READER_CACHE_SIZE") or 256)
+        disk_dir = os.getenv("RESUME_READER_CACHE_DIR") or None
+        if max_entries <= 0 and not disk_dir:
+            return None
+        return cls(
+            max_entries=max(max_entries, 0),
+            disk_dir=disk_dir,
+            disk_max_bytes=int(os.getenv("RESUME_READER_CACHE_DISK_MAX_BYTES") or 256 * 1024 * 1024),
+            disk_max_age_seconds=float(os.getenv("RESUME_READER_CACHE_DISK_MAX_AGE_SECONDS") or 7 * 24 * 3600),
+        )
+
+    def get(self, key: str) -> Optional[ResumeReaderResponseVOData]:
+        data = self._get_memory(key)
+        if data is not None:
+            return data
+        return self._record_disk_lookup(key, self._read_disk(key))
+
+    async def get_async(self, key: str) -> Optional[ResumeReaderResponseVOData]:
+        """Like :meth:`get`, but reads the disk tier in a worker thread."""
+
+        data = self._get_memory(key)
+        if data is not None:
+            return data
+        disk_data = await asyncio.to_thread(self._read_disk, key) if self._disk_dir else None
+        return self._record_disk_lookup(key, disk_data)
+
+    def put(self, key: str, data: ResumeReaderResponseVOData) -> None:
+        with self._lock:
+            self._remember(key, data)
+        self._write_disk(key, data)
+
+    async def put_async(self, key: str, data: ResumeReaderResponseVOData) -> None:
+        """Like :meth:`put`, but writes the disk tier in a worker thread."""
+
+        with self._lock:
+            self._remember(key, data)
+        if self._disk_dir:
+            await asyncio.to_thread(self._write_disk, key, data)
+
+    def _get_memory(self, key: str) -> Optional[ResumeReaderResponseVOData]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+            return data
+
+    def _record_disk_lookup(
+        self, key: str, data: Optional[ResumeReaderResponseVOData]
+    ) -> Optional[ResumeReaderResponseVOData]:
+        with self._lock:
+            if data is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, data)
+        return data
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memoryHits": self._memory_hits,
+                "diskHits": self._disk_hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "maxEntries": self._max_entries,
+                "diskBytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, data: ResumeReaderResponseVOData) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        file_name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._disk_dir / file_name[:2] / f"{file_name}.json"
+
+    def _read_disk(self, key: str) -> Optional[ResumeReaderResponseVOData]:
+        if not self._disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            if self._disk_max_age_seconds and time.time() - path.stat().st_mtime > self._disk_max_age_seconds:
+                path.unlink()
+                return None
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            data = ResumeReaderResponseVOData(**payload)
+            # The modification time doubles as the last use for eviction.
+            os.utime(path)
+            return data
+        except (OSError, ValueError, TypeError):
+            # Missing, partially written or outdated entries are treated as misses.
+            return None
+
+    def _write_disk(self, key: str, data: ResumeReaderResponseVOData) -> None:
+        if not self._disk_dir:
+            return
+        path = self._disk_path(key)
+        temp_name: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temp_name = handle.name
+                json.dump(asdict(data), handle)
+            os.replace(temp_name, path)
+            size = path.stat().st_size
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the result.
+            if temp_name:
+                with suppress(OSError):
+                    os.unlink(temp_name)
+            return
+
+        with self._disk_lock:
+            self._disk_bytes += size
+            over_limit = self._disk_max_bytes and self._disk_bytes > self._disk_max_bytes
+        if over_limit:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Drop expired entries, then least recently used ones until under the size bound.
+
+        Pruning goes down to 90% of the bound so a full tier is not rescanned
+        on every write.
+        """
+
+        with self._disk_lock:
+            now = time.time()
+            files = []
+            for path in self._disk_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                    if self._disk_max_age_seconds and now - stat.st_mtime > self._disk_max_age_seconds:
+                        path.unlink()
+                        continue
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            if self._disk_max_bytes and total > self._disk_max_bytes:
+                target = self._disk_max_bytes * 9 // 10
+                for _, size, path in sorted(files, key=lambda item: item[0]):
+                    if total <= target:
+                        break
+                    with suppress(OSError):
+                        path.unlink()
+                        total -= size
+            self._disk_bytes = total
+
+
+__all__ = ["ResumeParseCache", "build_cache_key"]
@@ -8,3 +8,27 @@ class UnsupportedResumeFormatError(ResumeReaderError):
 
 class ResumeExtractionError(ResumeReaderError):
     """Raised when text extraction or analysis fails."""
+
+
+class ResumeReaderBusyError(ResumeReaderError):
+    """Raised when the extraction pool has no free slot for another job."""
+
+
+class ResumeExtractionTimeoutError(ResumeReaderError):
+    """Raised when an extraction job exceeds its time budget."""
+
+
+class ResumeTooLargeError(ResumeReaderError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+class InvalidResumeFieldError(ResumeReaderError):
+    """Raised when a field selector names a field the response does not have."""
+
+
+class ResumeParseStoreError(ResumeReaderError):
+    """Raised when a parse result could not be written to the structured store."""
+
+
+class InvalidUploadError(ResumeReaderError):
+    """Raised when the request body is not a well-formed multipart upload."""
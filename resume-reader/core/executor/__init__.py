@@ -0,0 +1,13 @@
+from .executor import (
+    EXECUTION_MODE_PROCESS,
+    EXECUTION_MODE_THREAD,
+    ResumeExecutorConfig,
+    ResumeExtractionExecutor,
+)
+
+__all__ = [
+    "EXECUTION_MODE_PROCESS",
+    "EXECUTION_MODE_THREAD",
+    "ResumeExecutorConfig",
+    "ResumeExtractionExecutor",
+]
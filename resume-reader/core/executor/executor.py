@@ -0,0 +1,290 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from ..analyzer import SkillTaxonomy, TaxonomyStore, default_taxonomy_store
+from ..cache import ResumeParseCache, build_cache_key
+from ..exceptions import ResumeExtractionTimeoutError, ResumeReaderBusyError
+from ..metrics import (
+    OUTCOME_FAILED,
+    OUTCOME_REJECTED,
+    OUTCOME_SUCCESS,
+    OUTCOME_TIMEOUT,
+    ResumeReaderMetrics,
+)
+from ..parser import disable_page_parallelism
+from ..requestVO.ResumeReaderRequestVO import ResumeReaderRequestVO
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO
+from ..service.ResumeReaderService import ResumeReaderService
+from ..serviceImpl.ResumeReaderServiceImpl import ResumeReaderServiceImpl
+
+EXECUTION_MODE_THREAD = "thread"
+EXECUTION_MODE_PROCESS = "process"
+EXECUTION_MODES = (EXECUTION_MODE_THREAD, EXECUTION_MODE_PROCESS)
+BUSY_RETRY_DELAY_SECONDS = 0.05
+
+_worker_service: Optional[ResumeReaderService] = None
+
+
+def _init_worker(taxonomy: SkillTaxonomy) -> None:
+    global _worker_service
+    # Workers use the API process's taxonomy snapshot rather than reloading it.
+    # A private store keeps swap listeners inherited through fork from firing.
+    _worker_service = ResumeReaderServiceImpl(taxonomy_store=TaxonomyStore(taxonomy))
+    # The worker pool already spreads documents across cores; a page pool per
+    # worker would multiply the process count and nest pools.
+    disable_page_parallelism()
+
+
+def _read_resume_in_worker(request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+    return _worker_service.read_resume(request)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    value = int(raw)
+    if value < 0:
+        raise ValueError(f"{name} must be zero or a positive integer.")
+    return value
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    value = float(raw)
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive number.")
+    return value
+
+
+@dataclass(frozen=True)
+class ResumeExecutorConfig:
+    """Settings for how resume extraction jobs are scheduled."""
+
+    mode: str = EXECUTION_MODE_THREAD
+    max_workers: int = os.cpu_count() or 1
+    queue_size: int = 0
+    job_timeout_seconds: float = 30.0
+
+    @property
+    def capacity(self) -> int:
+        """Jobs allowed in flight (running plus queued) before new ones are rejected."""
+        return self.max_workers + self.queue_size
+
+    @classmethod
+    def from_env(cls) -> "ResumeExecutorConfig":
+        mode = (os.getenv("RESUME_READER_EXECUTION_MODE") or EXECUTION_MODE_THREAD).strip().lower()
+        if mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Unsupported RESUME_READER_EXECUTION_MODE '{mode}'. "
+                f"Allowed values: {', '.join(EXECUTION_MODES)}"
+            )
+
+        max_workers = _env_int("RESUME_READER_MAX_WORKERS", os.cpu_count() or 1) or 1
+        return cls(
+            mode=mode,
+            max_workers=max_workers,
+            queue_size=_env_int("RESUME_READER_QUEUE_SIZE", max_workers * 2),
+            job_timeout_seconds=_env_float("RESUME_READER_JOB_TIMEOUT_SECONDS", 30.0),
+        )
+
+
+class ResumeExtractionExecutor:
+    """Runs ``read_resume`` off the event loop with bounded admission.
+
+    In ``thread`` mode jobs share the API process; in ``process`` mode each job
+    runs in a worker process so CPU-bound parsing can use every core. Either
+    way, at most ``config.capacity`` jobs are admitted at once and anything
+    beyond that is rejected immediately with ``ResumeReaderBusyError``.
+    Cache hits are answered before admission and never touch the pool.
+
+    A job that exceeds ``config.job_timeout_seconds`` is answered with
+    ``ResumeExtractionTimeoutError`` straight away, but a parse that has
+    already started cannot be stopped: a process worker keeps running it to
+    the end. Its admission slot is therefore released only when the
+    underlying future finishes, not at the timeout, so timed-out parses
+    still count against capacity and the pool is never oversubscribed.
+    Workers are not recycled on timeout, since shutting a process pool down
+    does not stop its running workers and a replacement pool would run next
+    to them.
+    """
+
+    def __init__(
+        self,
+        service: ResumeReaderService,
+        config: Optional[ResumeExecutorConfig] = None,
+        *,
+        cache: Optional[ResumeParseCache] = None,
+        metrics: Optional[ResumeReaderMetrics] = None,
+    ):
+        self._service = service
+        self._config = config or ResumeExecutorConfig()
+        self._cache = cache
+        self._metrics = metrics
+        self._slots = threading.BoundedSemaphore(self._config.capacity)
+        self._pool: Executor = self._create_pool()
+
+    @property
+    def config(self) -> ResumeExecutorConfig:
+        return self._config
+
+    @property
+    def cache(self) -> Optional[ResumeParseCache]:
+        return self._cache
+
+    @property
+    def metrics(self) -> Optional[ResumeReaderMetrics]:
+        return self._metrics
+
+    def _create_pool(self) -> Executor:
+        if self._config.mode == EXECUTION_MODE_PROCESS:
+            return ProcessPoolExecutor(
+                max_workers=self._config.max_workers,
+                initializer=_init_worker,
+                initargs=(default_taxonomy_store.current,),
+            )
+        return ThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            thread_name_prefix="resume-reader",
+        )
+
+    def recycle_workers(self, _taxonomy: Optional[SkillTaxonomy] = None) -> None:
+        """Replace the worker processes so they pick up a newly swapped taxonomy.
+
+        Jobs already handed to the old pool still finish there. Thread mode
+        shares the API process's taxonomy store, so nothing is recycled.
+        """
+
+        if self._config.mode != EXECUTION_MODE_PROCESS:
+            return
+        previous, self._pool = self._pool, self._create_pool()
+        previous.shutdown(wait=False)
+
+    def _submit(self, request: ResumeReaderRequestVO) -> Future:
+        if self._config.mode == EXECUTION_MODE_PROCESS:
+            return self._pool.submit(_read_resume_in_worker, request)
+        return self._pool.submit(self._service.read_resume, request)
+
+    def _release_slot(self, _future: Future) -> None:
+        self._slots.release()
+
+    async def run(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+        return await self._measured(self._run, request)
+
+    async def run_when_available(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+        """Like :meth:`run`, but wait up to the job timeout for a free slot instead of failing fast."""
+
+        return await self._measured(self._run_when_available, request)
+
+    async def _measured(
+        self,
+        run: Callable[[ResumeReaderRequestVO], Awaitable[ResumeReaderResponseVO]],
+        request: ResumeReaderRequestVO,
+    ) -> ResumeReaderResponseVO:
+        """Run ``run`` and record its outcome, so failures show up next to successes."""
+
+        if self._metrics is None:
+            return await run(request)
+        started = time.perf_counter()
+        outcome = OUTCOME_FAILED
+        try:
+            response = await run(request)
+            if response.success:
+                outcome = OUTCOME_SUCCESS
+            return response
+        except ResumeReaderBusyError:
+            outcome = OUTCOME_REJECTED
+            raise
+        except ResumeExtractionTimeoutError:
+            outcome = OUTCOME_TIMEOUT
+            raise
+        finally:
+            self._metrics.observe_outcome(outcome, time.perf_counter() - started)
+
+    async def _run(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+        cache_key: Optional[str] = None
+        namespace = self._service.cache_namespace
+        if self._cache is not None and (request.file_bytes or request.file_path):
+            # Without a precomputed digest the key hashes the whole file, so
+            # that and the disk tier stay off the event loop.
+            if request.content_hash is None:
+                cache_key = await asyncio.to_thread(build_cache_key, request, namespace)
+            else:
+                cache_key = build_cache_key(request, namespace)
+            cached = await self._cache.get_async(cache_key)
+            if cached is not None:
+                return ResumeReaderResponseVO(success=True, data=cached)
+
+        response = await self._dispatch(request)
+        if self._metrics is not None and response.profile is not None:
+            self._metrics.observe(response.profile)
+        # Projected results are partial, so only full results are cached;
+        # projected requests are still answered from a cached full result.
+        # A namespace change mid-job (such as a taxonomy swap) means the
+        # result may not match the key it was looked up under, and a result
+        # cut short by the time budget would hide the full one for good.
+        if (
+            cache_key is not None
+            and response.success
+            and not response.data.cut_short_by_time_budget
+            and request.fields is None
+            and self._service.cache_namespace == namespace
+        ):
+            await self._cache.put_async(cache_key, response.data)
+        return response
+
+    async def _run_when_available(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.job_timeout_seconds
+        while True:
+            try:
+                return await self._run(request)
+            except ResumeReaderBusyError:
+                if loop.time() >= deadline:
+                    raise
+                await asyncio.sleep(BUSY_RETRY_DELAY_SECONDS)
+
+    async def _dispatch(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
+        if not self._slots.acquire(blocking=False):
+            raise ResumeReaderBusyError("Resume reader is at capacity. Retry shortly.")
+
+        try:
+            future = self._submit(request)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # The slot is held until the job really finishes, so a job that is
+        # still running after a timeout keeps counting against capacity.
+        future.add_done_callback(self._release_slot)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=self._config.job_timeout_seconds,
+            )
+        except asyncio.TimeoutError as exc:
+            # Only stops a job that is still queued; a running one finishes
+            # in the background and releases its slot then.
+            future.cancel()
+            raise ResumeExtractionTimeoutError(
+                f"Resume extraction exceeded {self._config.job_timeout_seconds:g}s."
+            ) from exc
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "EXECUTION_MODE_PROCESS",
+    "EXECUTION_MODE_THREAD",
+    "ResumeExecutorConfig",
+    "ResumeExtractionExecutor",
+]
@@ -0,0 +1,19 @@
+from .jobs import (
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_SUCCEEDED,
+    ResumeJob,
+    ResumeJobConfig,
+    ResumeJobManager,
+)
+
+__all__ = [
+    "JOB_STATUS_FAILED",
+    "JOB_STATUS_QUEUED",
+    "JOB_STATUS_RUNNING",
+    "JOB_STATUS_SUCCEEDED",
+    "ResumeJob",
+    "ResumeJobConfig",
+    "ResumeJobManager",
+]
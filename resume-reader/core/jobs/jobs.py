@@ -0,0 +1,307 @@
+import asyncio
+import ipaddress
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from ..exceptions import ResumeReaderBusyError, ResumeReaderError
+from ..executor import ResumeExtractionExecutor
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO
+from ..store import ResumeParseStore
+from ..upload import SpooledUpload
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ResumeJobConfig:
+    """Settings for asynchronous extraction jobs."""
+
+    queue_size: int = 100
+    workers: int = 2
+    result_ttl_seconds: float = 3600.0
+    # Finished jobs kept at most; the oldest are dropped first even within the TTL.
+    max_retained_jobs: int = 1000
+    webhook_timeout_seconds: float = 5.0
+    # Hosts callbacks may target. Empty allows any host that resolves only to
+    # public addresses; loopback, private and link-local targets are refused.
+    webhook_allowed_hosts: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_env(cls, default_workers: int = 2) -> "ResumeJobConfig":
+        allowed_hosts = os.getenv("RESUME_READER_WEBHOOK_ALLOWED_HOSTS", "")
+        return cls(
+            queue_size=int(os.getenv("RESUME_READER_JOB_QUEUE_SIZE") or 100),
+            workers=int(os.getenv("RESUME_READER_JOB_WORKERS") or default_workers),
+            result_ttl_seconds=float(os.getenv("RESUME_READER_JOB_RESULT_TTL_SECONDS") or 3600),
+            max_retained_jobs=int(os.getenv("RESUME_READER_JOB_MAX_RETAINED") or 1000),
+            webhook_timeout_seconds=float(os.getenv("RESUME_READER_WEBHOOK_TIMEOUT_SECONDS") or 5),
+            webhook_allowed_hosts=frozenset(
+                host.strip().lower() for host in allowed_hosts.split(",") if host.strip()
+            ),
+        )
+
+
+@dataclass
+class ResumeJob:
+    id: str
+    filename: str
+    fields: Optional[FrozenSet[str]] = None
+    callback_url: Optional[str] = None
+    # Set when the result should be saved to the parse store for this user.
+    user_id: Optional[int] = None
+    content_hash: Optional[str] = None
+    parse_result_id: Optional[int] = None
+    status: str = JOB_STATUS_QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    response: Optional[ResumeReaderResponseVO] = None
+    error: Optional[Exception] = None
+    callback_status: Optional[int] = None
+    upload: Optional[SpooledUpload] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "submittedAt": self.submitted_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "callbackStatus": self.callback_status,
+            "parseResultId": self.parse_result_id,
+        }
+
+
+def _resolves_to_public_addresses(hostname: str, port: int) -> bool:
+    """True when every address ``hostname`` resolves to is globally routable."""
+
+    try:
+        infos = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError):
+        return False
+    addresses = {info[4][0] for info in infos}
+    if not addresses:
+        return False
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+            ip = ip.ipv4_mapped
+        if not ip.is_global or ip.is_multicast:
+            return False
+    return True
+
+
+class ResumeJobManager:
+    """Runs extraction jobs from a bounded in-process queue.
+
+    ``submit`` takes ownership of a spooled upload and returns at once; a
+    fixed set of asyncio workers feeds queued jobs to the shared
+    :class:`ResumeExtractionExecutor`, so jobs go through the same service,
+    cache and admission limits as synchronous requests. Finished jobs are kept
+    for ``result_ttl_seconds`` and then forgotten, and at most
+    ``max_retained_jobs`` of them are kept at all. When a job has a callback
+    URL, its outcome is POSTed there once it finishes.
+
+    ``serialize`` turns a finished job into the callback body; the controller
+    supplies it so callbacks match the result endpoint. With a ``store``,
+    jobs submitted with a ``user_id`` have their result saved there before
+    the job counts as succeeded.
+    """
+
+    def __init__(
+        self,
+        executor: ResumeExtractionExecutor,
+        config: Optional[ResumeJobConfig] = None,
+        *,
+        serialize: Callable[[ResumeJob], Dict[str, Any]],
+        store: Optional[ResumeParseStore] = None,
+    ):
+        self._executor = executor
+        self._config = config or ResumeJobConfig()
+        self._serialize = serialize
+        self._store = store
+        self._jobs: Dict[str, ResumeJob] = {}
+        self._queue: Optional["asyncio.Queue[ResumeJob]"] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def config(self) -> ResumeJobConfig:
+        return self._config
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._config.queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self._config.workers))]
+
+    async def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in self._jobs.values():
+            if job.upload is not None:
+                job.upload.close()
+                job.upload = None
+
+    def validate_callback_url(self, url: str) -> None:
+        """Raise ``ValueError`` unless ``url`` is a callback target this service may call.
+
+        With an allowlist only its hosts pass. Without one, the host must
+        resolve to public addresses only, so a caller cannot aim callbacks at
+        loopback, cloud metadata or other internal services. This resolves
+        DNS and blocks; off the event loop, call it through a thread.
+        """
+
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError("callback_url must be an absolute http(s) URL.")
+        try:
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        except ValueError as exc:
+            raise ValueError("callback_url has an invalid port.") from exc
+        hostname = parsed.hostname.lower()
+        allowed = self._config.webhook_allowed_hosts
+        if allowed:
+            if hostname not in allowed:
+                raise ValueError(f"callback_url host '{parsed.hostname}' is not allowed.")
+        elif not _resolves_to_public_addresses(hostname, port):
+            raise ValueError(f"callback_url host '{parsed.hostname}' does not resolve to a public address.")
+
+    def submit(
+        self,
+        upload: SpooledUpload,
+        *,
+        fields: Optional[FrozenSet[str]] = None,
+        callback_url: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> ResumeJob:
+        """Queue ``upload`` for extraction. The job owns and eventually closes the upload."""
+
+        if self._queue is None:
+            raise RuntimeError("ResumeJobManager.start() must be called before submitting jobs.")
+        self._purge_expired()
+
+        job = ResumeJob(
+            id=uuid.uuid4().hex,
+            filename=upload.filename,
+            fields=fields,
+            callback_url=callback_url,
+            user_id=user_id,
+            content_hash=upload.content_hash,
+            upload=upload,
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as exc:
+            raise ResumeReaderBusyError("Resume job queue is full. Retry shortly.") from exc
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ResumeJob]:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def _purge_expired(self) -> None:
+        cutoff = time.time() - self._config.result_ttl_seconds
+        finished = sorted((job for job in self._jobs.values() if job.done), key=lambda job: job.finished_at)
+        overflow = max(0, len(finished) - self._config.max_retained_jobs)
+        for position, job in enumerate(finished):
+            if position < overflow or job.finished_at < cutoff:
+                del self._jobs[job.id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception:  # noqa: BLE001
+                # One broken job must not take the worker down with it.
+                logger.exception("Resume job %s failed unexpectedly", job.id)
+            finally:
+                self._queue.task_done()
+                self._purge_expired()
+
+    async def _run(self, job: ResumeJob) -> None:
+        job.status = JOB_STATUS_RUNNING
+        job.started_at = time.time()
+        try:
+            request = replace(job.upload.to_request(), fields=job.fields)
+            job.response = await self._executor.run_when_available(request)
+            if (
+                job.user_id is not None
+                and self._store is not None
+                and job.response.success
+                and not job.response.data.cut_short_by_time_budget
+            ):
+                job.parse_result_id = await asyncio.to_thread(
+                    self._store.save,
+                    job.user_id,
+                    job.content_hash,
+                    job.filename,
+                    job.response.data,
+                )
+            job.status = JOB_STATUS_SUCCEEDED
+        except Exception as exc:  # noqa: BLE001
+            if not isinstance(exc, ResumeReaderError):
+                logger.exception("Resume job %s failed", job.id)
+            job.error = exc if isinstance(exc, ResumeReaderError) else ResumeReaderError("Resume extraction failed.")
+            job.status = JOB_STATUS_FAILED
+        finally:
+            job.finished_at = time.time()
+            job.upload.close()
+            job.upload = None
+
+        if job.callback_url:
+            await self._notify(job)
+
+    async def _notify(self, job: ResumeJob) -> None:
+        try:
+            # Checked again at delivery: DNS may point somewhere else by now.
+            await asyncio.to_thread(self.validate_callback_url, job.callback_url)
+            # requests is blocking, so the callback runs on a worker thread.
+            # Redirects are not followed, since they could lead to any host.
+            response = await asyncio.to_thread(
+                requests.post,
+                job.callback_url,
+                json=self._serialize(job),
+                timeout=self._config.webhook_timeout_seconds,
+                allow_redirects=False,
+            )
+            job.callback_status = response.status_code
+        except (requests.RequestException, ValueError):
+            # The result stays available for polling; 0 marks a callback that
+            # could not be delivered.
+            job.callback_status = 0
+        except Exception:  # noqa: BLE001
+            logger.exception("Callback for resume job %s could not be built or sent", job.id)
+            job.callback_status = 0
+
+
+__all__ = [
+    "JOB_STATUS_FAILED",
+    "JOB_STATUS_QUEUED",
+    "JOB_STATUS_RUNNING",
+    "JOB_STATUS_SUCCEEDED",
+    "ResumeJob",
+    "ResumeJobConfig",
+    "ResumeJobManager",
+]
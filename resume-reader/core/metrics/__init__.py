@@ -0,0 +1,22 @@
+from .histogram import (
+    OUTCOME_FAILED,
+    OUTCOME_REJECTED,
+    OUTCOME_SUCCESS,
+    OUTCOME_TIMEOUT,
+    SIZE_BUCKETS,
+    ResumeReaderMetrics,
+    size_bucket,
+)
+from .timing import StageTimer, format_server_timing
+
+__all__ = [
+    "OUTCOME_FAILED",
+    "OUTCOME_REJECTED",
+    "OUTCOME_SUCCESS",
+    "OUTCOME_TIMEOUT",
+    "ResumeReaderMetrics",
+    "SIZE_BUCKETS",
+    "StageTimer",
+    "format_server_timing",
+    "size_bucket",
+]
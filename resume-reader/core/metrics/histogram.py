@@ -0,0 +1,157 @@
+import os
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderProfile
+
+# Upper bounds in seconds, spanning a plain-text parse to a slow scanned PDF.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# (label, inclusive upper bound in bytes) for the document size dimension.
+SIZE_BUCKETS: Tuple[Tuple[str, float], ...] = (
+    ("64KiB", 64 * 1024),
+    ("256KiB", 256 * 1024),
+    ("1MiB", 1024 * 1024),
+    ("4MiB", 4 * 1024 * 1024),
+    ("+Inf", float("inf")),
+)
+
+
+# Values of the ``outcome`` label on resume_reader_request_seconds.
+OUTCOME_SUCCESS = "success"
+OUTCOME_FAILED = "failed"
+OUTCOME_REJECTED = "rejected"
+OUTCOME_TIMEOUT = "timeout"
+
+
+def size_bucket(size_bytes: int) -> str:
+    for label, upper in SIZE_BUCKETS:
+        if size_bytes <= upper:
+            return label
+    return SIZE_BUCKETS[-1][0]
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, bucket_count: int):
+        self.counts = [0] * bucket_count
+        self.total = 0.0
+        self.count = 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ResumeReaderMetrics:
+    """In-process latency histograms per stage, content type and size bucket.
+
+    Values are cumulative since startup and rendered in the Prometheus text
+    exposition format. In ``process`` execution mode timings are measured in
+    the workers and recorded here when the response returns to the API
+    process, so the histograms cover every worker. End-to-end request time is
+    kept per outcome as well, so failed, rejected and timed-out requests are
+    visible even though they carry no stage timings.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # (metric, stage, content type, size bucket) -> histogram
+        self._series: Dict[Tuple[str, str, str, str], _Histogram] = {}
+        # outcome -> histogram of end-to-end request seconds
+        self._outcomes: Dict[str, _Histogram] = {}
+
+    @classmethod
+    def from_env(cls) -> "ResumeReaderMetrics":
+        raw = os.getenv("RESUME_READER_METRICS_BUCKETS")
+        if not raw:
+            return cls()
+        return cls([float(value) for value in raw.split(",") if value.strip()])
+
+    def _observe(self, key: Tuple[str, str, str, str], value: float) -> None:
+        self._observe_into(self._series, key, value)
+
+    def _observe_into(self, series_map: Dict[Any, _Histogram], key: Any, value: float) -> None:
+        series = series_map.get(key)
+        if series is None:
+            series = series_map[key] = _Histogram(len(self._buckets))
+        index = bisect_left(self._buckets, value)
+        if index < len(self._buckets):
+            series.counts[index] += 1
+        series.total += value
+        series.count += 1
+
+    def observe(self, profile: ResumeReaderProfile) -> None:
+        content_type = profile.content_type or "unknown"
+        bucket = size_bucket(profile.size_bytes)
+        with self._lock:
+            for timing in profile.stages:
+                self._observe(("wall", timing.name, content_type, bucket), timing.wall_seconds)
+                self._observe(("cpu", timing.name, content_type, bucket), timing.cpu_seconds)
+
+    def observe_outcome(self, outcome: str, seconds: float) -> None:
+        """Record one request's end-to-end time under ``outcome`` (see the OUTCOME_* labels)."""
+
+        with self._lock:
+            self._observe_into(self._outcomes, outcome, seconds)
+
+    def render_prometheus(self) -> str:
+        metric_names = {
+            "wall": ("resume_reader_stage_seconds", "Wall-clock time per extraction stage."),
+            "cpu": ("resume_reader_stage_cpu_seconds", "CPU time per extraction stage."),
+        }
+        with self._lock:
+            snapshot = sorted(
+                (key, list(series.counts), series.total, series.count) for key, series in self._series.items()
+            )
+            outcomes = sorted(
+                (outcome, list(series.counts), series.total, series.count)
+                for outcome, series in self._outcomes.items()
+            )
+
+        lines: List[str] = []
+        for kind, (name, description) in metric_names.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} histogram")
+            for (series_kind, stage, content_type, bucket), counts, total, count in snapshot:
+                if series_kind != kind:
+                    continue
+                labels = (
+                    f'stage="{_escape_label(stage)}",content_type="{_escape_label(content_type)}",'
+                    f'size="{bucket}"'
+                )
+                self._render_series(lines, name, labels, counts, total, count)
+
+        name = "resume_reader_request_seconds"
+        lines.append(f"# HELP {name} End-to-end extraction time per request outcome.")
+        lines.append(f"# TYPE {name} histogram")
+        for outcome, counts, total, count in outcomes:
+            self._render_series(lines, name, f'outcome="{_escape_label(outcome)}"', counts, total, count)
+        return "\n".join(lines) + "\n"
+
+    def _render_series(
+        self, lines: List[str], name: str, labels: str, counts: List[int], total: float, count: int
+    ) -> None:
+        cumulative = 0
+        for upper, bucket_count in zip(self._buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{labels},le="{upper:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {count}")
+
+
+__all__ = [
+    "OUTCOME_FAILED",
+    "OUTCOME_REJECTED",
+    "OUTCOME_SUCCESS",
+    "OUTCOME_TIMEOUT",
+    "ResumeReaderMetrics",
+    "SIZE_BUCKETS",
+    "size_bucket",
+]
@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple, TypeVar
+
+from ..responseVO.ResumeReaderResponseVO import StageTiming
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """Records wall-clock and CPU time for named stages of one job.
+
+    CPU time is measured per thread, so it stays accurate when several jobs
+    share a thread pool.
+    """
+
+    def __init__(self):
+        self._stages: List[StageTiming] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            self._stages.append(
+                StageTiming(
+                    name=name,
+                    wall_seconds=time.perf_counter() - wall_started,
+                    cpu_seconds=time.thread_time() - cpu_started,
+                )
+            )
+
+    def call(self, name: str, func: Callable[..., T], *args) -> T:
+        with self.stage(name):
+            return func(*args)
+
+    @property
+    def stages(self) -> Tuple[StageTiming, ...]:
+        return tuple(self._stages)
+
+
+def format_server_timing(stages: Tuple[StageTiming, ...]) -> str:
+    """Render stages as a ``Server-Timing`` header value (durations in milliseconds)."""
+
+    metrics = []
+    for timing in stages:
+        metrics.append(f"{timing.name};dur={timing.wall_seconds * 1000:.3f}")
+        metrics.append(f"{timing.name}-cpu;dur={timing.cpu_seconds * 1000:.3f}")
+    return ", ".join(metrics)
+
+
+__all__ = ["StageTimer", "format_server_timing"]
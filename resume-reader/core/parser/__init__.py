@@ -1,3 +1,48 @@
-from .parser import extract_text
+from .backends import (
+    ExtractorBackend,
+    ExtractorCapabilities,
+    PlainTextBackend,
+    PyMuPdfBackend,
+    PyPdf2Backend,
+    PythonDocxBackend,
+)
+from .content_type import detect_content_type
+from .document import (
+    STOP_LINE_LIMIT,
+    STOP_PAGE_CAP,
+    STOP_TIME_BUDGET,
+    ExtractedDocument,
+    ExtractionLimits,
+    PdfPageStream,
+    ResumeSource,
+    open_resume_source,
+)
+from .parallel import PageParallelConfig, configure_page_parallelism, disable_page_parallelism, shutdown_page_pool
+from .parser import extract_document, extract_text
+from .registry import ExtractorRegistry, default_registry
 
-__all__ = ["extract_text"]
+__all__ = [
+    "STOP_LINE_LIMIT",
+    "STOP_PAGE_CAP",
+    "STOP_TIME_BUDGET",
+    "ExtractedDocument",
+    "ExtractionLimits",
+    "ExtractorBackend",
+    "ExtractorCapabilities",
+    "ExtractorRegistry",
+    "PageParallelConfig",
+    "PdfPageStream",
+    "PlainTextBackend",
+    "PyMuPdfBackend",
+    "PyPdf2Backend",
+    "PythonDocxBackend",
+    "ResumeSource",
+    "configure_page_parallelism",
+    "disable_page_parallelism",
+    "default_registry",
+    "detect_content_type",
+    "extract_document",
+    "extract_text",
+    "open_resume_source",
+    "shutdown_page_pool",
+]
@@ -0,0 +1,192 @@
+import importlib
+import io
+import mmap
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import FrozenSet, Iterator, List, Optional
+
+from ..exceptions import ResumeExtractionError
+from .content_type import CONTENT_TYPE_DOCX, CONTENT_TYPE_PDF, CONTENT_TYPE_TEXT
+from .document import ExtractedDocument, ExtractionLimits, ResumeSource, as_stream, collect_pages
+from .parallel import parallel_page_texts
+
+
+@dataclass(frozen=True)
+class ExtractorCapabilities:
+    """What a backend can do beyond returning text."""
+
+    # Reports page counts and honours page caps, time budgets and early stops.
+    paged: bool = False
+    # Can parse page ranges independently, so long documents can be split
+    # across worker processes (see read_page_range).
+    page_parallel: bool = False
+
+
+class ExtractorBackend(ABC):
+    """One way of turning a document into text.
+
+    ``speed_rank`` orders backends for the same content type: the registry
+    tries installed backends from the lowest rank up. Third-party modules are
+    imported once by :meth:`load` when the backend is registered, so requests
+    never pay the import cost.
+    """
+
+    name: str = ""
+    content_types: FrozenSet[str] = frozenset()
+    speed_rank: int = 100
+    capabilities: ExtractorCapabilities = ExtractorCapabilities()
+    module_name: Optional[str] = None
+
+    def __init__(self):
+        self._module = None
+        self._loaded = False
+
+    def load(self) -> bool:
+        if not self._loaded:
+            self._loaded = True
+            if self.module_name:
+                try:
+                    self._module = importlib.import_module(self.module_name)
+                except ImportError:
+                    self._module = None
+        return self.available
+
+    @property
+    def available(self) -> bool:
+        return self.module_name is None or self._module is not None
+
+    @property
+    def version(self) -> str:
+        """Version of the third-party module, or an empty string when there is none."""
+
+        return str(getattr(self._module, "__version__", "")) if self._module is not None else ""
+
+    @abstractmethod
+    def extract(self, source: ResumeSource, limits: ExtractionLimits) -> ExtractedDocument:
+        raise NotImplementedError
+
+    def read_page_range(self, source: ResumeSource, start: int, stop: int) -> List[str]:
+        """Texts of pages ``start`` to ``stop - 1``; required for ``page_parallel`` backends."""
+        raise NotImplementedError
+
+
+class PyMuPdfBackend(ExtractorBackend):
+    """PDF extraction through PyMuPDF (``fitz``), several times faster than PyPDF2."""
+
+    name = "pymupdf"
+    content_types = frozenset({CONTENT_TYPE_PDF})
+    speed_rank = 10
+    capabilities = ExtractorCapabilities(paged=True, page_parallel=True)
+    module_name = "fitz"
+
+    def _open(self, source: ResumeSource):
+        path = getattr(source, "name", None)
+        if isinstance(path, str):
+            return self._module.open(path)
+        return self._module.open(stream=as_stream(source).read(), filetype="pdf")
+
+    def extract(self, source: ResumeSource, limits: ExtractionLimits) -> ExtractedDocument:
+        try:
+            document = self._open(source)
+        except Exception as exc:  # noqa: BLE001
+            raise ResumeExtractionError("Failed to extract text from PDF resume.") from exc
+
+        def _page_texts() -> Iterator[str]:
+            for index in range(document.page_count):
+                yield document.load_page(index).get_text() or ""
+
+        try:
+            page_texts = parallel_page_texts(self.name, source, document.page_count, limits)
+            return collect_pages(document.page_count, page_texts or _page_texts(), limits)
+        except Exception as exc:  # noqa: BLE001
+            raise ResumeExtractionError("Failed to extract text from PDF resume.") from exc
+        finally:
+            document.close()
+
+    def read_page_range(self, source: ResumeSource, start: int, stop: int) -> List[str]:
+        document = self._open(source)
+        try:
+            return [document.load_page(index).get_text() or "" for index in range(start, stop)]
+        finally:
+            document.close()
+
+
+class PyPdf2Backend(ExtractorBackend):
+    """Pure-Python PDF extraction through PyPDF2."""
+
+    name = "pypdf2"
+    content_types = frozenset({CONTENT_TYPE_PDF})
+    speed_rank = 50
+    capabilities = ExtractorCapabilities(paged=True, page_parallel=True)
+    module_name = "PyPDF2"
+
+    def extract(self, source: ResumeSource, limits: ExtractionLimits) -> ExtractedDocument:
+        try:
+            reader = self._module.PdfReader(as_stream(source))
+            page_count = len(reader.pages)
+            page_texts = parallel_page_texts(self.name, source, page_count, limits) or (
+                page.extract_text() or "" for page in reader.pages
+            )
+            return collect_pages(page_count, page_texts, limits)
+        except Exception as exc:  # noqa: BLE001
+            raise ResumeExtractionError("Failed to extract text from PDF resume.") from exc
+
+    def read_page_range(self, source: ResumeSource, start: int, stop: int) -> List[str]:
+        reader = self._module.PdfReader(as_stream(source))
+        return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+class PythonDocxBackend(ExtractorBackend):
+    """DOCX extraction through python-docx."""
+
+    name = "python-docx"
+    content_types = frozenset({CONTENT_TYPE_DOCX})
+    speed_rank = 50
+    module_name = "docx"
+
+    def extract(self, source: ResumeSource, limits: ExtractionLimits) -> ExtractedDocument:
+        try:
+            document = self._module.Document(as_stream(source))
+            paragraphs = [paragraph.text.strip() for paragraph in document.paragraphs if paragraph.text.strip()]
+            return ExtractedDocument(text="\n".join(paragraphs))
+        except Exception as exc:  # noqa: BLE001
+            raise ResumeExtractionError("Failed to extract text from DOCX resume.") from exc
+
+
+def _decode_plain_text(buffer) -> str:
+    for encoding in ("utf-8", "latin-1"):
+        try:
+            return str(buffer, encoding)
+        except UnicodeDecodeError:
+            continue
+    return str(buffer, "utf-8", errors="ignore")
+
+
+class PlainTextBackend(ExtractorBackend):
+    """Decodes text files, straight from a read-only mmap when they live on disk."""
+
+    name = "plain-text"
+    content_types = frozenset({CONTENT_TYPE_TEXT})
+    speed_rank = 0
+
+    def extract(self, source: ResumeSource, limits: ExtractionLimits) -> ExtractedDocument:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return ExtractedDocument(text=_decode_plain_text(source))
+
+        # Decoding from the mapping avoids an intermediate bytes copy.
+        try:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return ExtractedDocument(text=_decode_plain_text(mapped))
+        except (ValueError, OSError, io.UnsupportedOperation):
+            # Empty files cannot be mapped and in-memory streams have no fileno.
+            return ExtractedDocument(text=_decode_plain_text(as_stream(source).read()))
+
+
+__all__ = [
+    "ExtractorBackend",
+    "ExtractorCapabilities",
+    "PlainTextBackend",
+    "PyMuPdfBackend",
+    "PyPdf2Backend",
+    "PythonDocxBackend",
+]
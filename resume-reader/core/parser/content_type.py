@@ -0,0 +1,74 @@
+import zipfile
+from pathlib import Path
+
+from .document import ResumeSource, as_stream
+
+CONTENT_TYPE_PDF = "application/pdf"
+CONTENT_TYPE_DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+CONTENT_TYPE_DOC = "application/msword"
+CONTENT_TYPE_RTF = "application/rtf"
+CONTENT_TYPE_ZIP = "application/zip"
+CONTENT_TYPE_TEXT = "text/plain"
+CONTENT_TYPE_UNKNOWN = "application/octet-stream"
+
+SNIFF_BYTES = 4096
+
+_EXTENSION_TYPES = {
+    ".pdf": CONTENT_TYPE_PDF,
+    ".docx": CONTENT_TYPE_DOCX,
+    ".doc": CONTENT_TYPE_DOC,
+    ".rtf": CONTENT_TYPE_RTF,
+    ".txt": CONTENT_TYPE_TEXT,
+    ".md": CONTENT_TYPE_TEXT,
+}
+
+
+def _sniff_zip(source: ResumeSource) -> str:
+    try:
+        with zipfile.ZipFile(as_stream(source)) as archive:
+            names = set(archive.namelist())
+    except zipfile.BadZipFile:
+        return CONTENT_TYPE_UNKNOWN
+    return CONTENT_TYPE_DOCX if "word/document.xml" in names else CONTENT_TYPE_ZIP
+
+
+def detect_content_type(filename: str, source: ResumeSource) -> str:
+    """Identify the resume format from its leading bytes.
+
+    Magic numbers decide whenever they are present, so a mislabelled upload is
+    still routed to the right extractor. Text has no signature; it is taken
+    from the file extension, or assumed for extension-less files without NUL
+    bytes. Anything else is ``application/octet-stream``.
+    """
+
+    stream = as_stream(source)
+    head = stream.read(SNIFF_BYTES)
+    stream.seek(0)
+
+    if head.startswith(b"%PDF-"):
+        return CONTENT_TYPE_PDF
+    if head.startswith(b"PK\x03\x04"):
+        return _sniff_zip(source)
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return CONTENT_TYPE_DOC
+    if head.startswith(b"{\\rtf"):
+        return CONTENT_TYPE_RTF
+
+    extension = Path(filename or "").suffix.lower()
+    if extension:
+        return _EXTENSION_TYPES.get(extension, CONTENT_TYPE_UNKNOWN)
+    if head and b"\x00" not in head:
+        return CONTENT_TYPE_TEXT
+    return CONTENT_TYPE_UNKNOWN
+
+
+__all__ = [
+    "CONTENT_TYPE_DOC",
+    "CONTENT_TYPE_DOCX",
+    "CONTENT_TYPE_PDF",
+    "CONTENT_TYPE_RTF",
+    "CONTENT_TYPE_TEXT",
+    "CONTENT_TYPE_UNKNOWN",
+    "CONTENT_TYPE_ZIP",
+    "detect_content_type",
+]
@@ -0,0 +1,170 @@
+import io
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+# Why a paged document was not read to its last page (``ExtractedDocument.stop_reason``).
+STOP_PAGE_CAP = "page_cap"
+STOP_TIME_BUDGET = "time_budget"
+STOP_LINE_LIMIT = "stop_after_lines"
+
+# Resume content is either held in memory or read from an open binary file
+# (uploads above the spool threshold live in a temporary file).
+ResumeSource = Union[bytes, BinaryIO]
+
+
+def _env_optional_number(name: str, default: Optional[float]) -> Optional[float]:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    value = float(raw)
+    return value if value > 0 else None
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Bounds on how much of a paged document is read.
+
+    ``max_pages`` and ``time_budget_seconds`` cap the work spent on a single
+    document; ``stop_after_lines`` ends extraction early once that many
+    non-empty lines are available, for callers that only need the top of the
+    resume. ``None`` disables a limit.
+    """
+
+    max_pages: Optional[int] = None
+    time_budget_seconds: Optional[float] = None
+    stop_after_lines: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "ExtractionLimits":
+        max_pages = _env_optional_number("RESUME_READER_MAX_PDF_PAGES", 50)
+        return cls(
+            max_pages=int(max_pages) if max_pages else None,
+            time_budget_seconds=_env_optional_number("RESUME_READER_PDF_TIME_BUDGET_SECONDS", 10.0),
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        return f"p{self.max_pages or 0}-t{self.time_budget_seconds or 0:g}-l{self.stop_after_lines or 0}"
+
+
+@dataclass(frozen=True)
+class ExtractedDocument:
+    """Extracted text plus how much of the document it covers.
+
+    ``page_count`` is ``None`` for formats without pages. ``stop_reason`` is
+    one of the ``STOP_*`` values when reading ended before the last page.
+    Only ``STOP_TIME_BUDGET`` depends on how fast this run happened to be.
+    """
+
+    text: str
+    page_count: Optional[int] = None
+    pages_read: int = 0
+    content_type: Optional[str] = None
+    stop_reason: Optional[str] = None
+
+    @property
+    def pages_skipped(self) -> int:
+        if self.page_count is None:
+            return 0
+        return self.page_count - self.pages_read
+
+
+def as_stream(source: ResumeSource) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+@contextmanager
+def open_resume_source(file_bytes: bytes, file_path: Optional[str] = None) -> Iterator[ResumeSource]:
+    """Yield the resume content, opening ``file_path`` when the upload was spooled to disk."""
+
+    if file_path is None:
+        yield file_bytes
+        return
+    with open(file_path, "rb") as handle:
+        yield handle
+
+
+class PdfPageStream:
+    """Yields page texts from a lazy iterator within the given limits.
+
+    ``page_texts`` should only parse a page when it is advanced, so a
+    consumer that stops iterating never pays for the remaining pages.
+    ``pages_read`` tells how far it got and ``stop_reason`` which limit
+    ended it, if any.
+    """
+
+    def __init__(self, page_count: int, page_texts: Iterable[str], limits: ExtractionLimits):
+        self.page_count = page_count
+        self.pages_read = 0
+        self.stop_reason: Optional[str] = None
+        self._page_texts = page_texts
+        self._limits = limits
+
+    def __iter__(self) -> Iterator[str]:
+        deadline = None
+        if self._limits.time_budget_seconds:
+            deadline = time.monotonic() + self._limits.time_budget_seconds
+
+        pages = iter(self._page_texts)
+        while self.pages_read < self.page_count:
+            if self._limits.max_pages is not None and self.pages_read >= self._limits.max_pages:
+                self.stop_reason = STOP_PAGE_CAP
+                return
+            # The first page is always read so a slow document still yields something.
+            if deadline is not None and self.pages_read and time.monotonic() >= deadline:
+                self.stop_reason = STOP_TIME_BUDGET
+                return
+            extracted = next(pages, None)
+            if extracted is None:
+                # Parallel page readers end early only when the budget runs out.
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.stop_reason = STOP_TIME_BUDGET
+                return
+            self.pages_read += 1
+            yield extracted
+
+
+def collect_pages(page_count: int, page_texts: Iterable[str], limits: ExtractionLimits) -> ExtractedDocument:
+    """Join page texts into a document, honouring ``limits``."""
+
+    pages = PdfPageStream(page_count, page_texts, limits)
+    text_chunks: List[str] = []
+    line_count = 0
+    stop_reason: Optional[str] = None
+    for extracted in pages:
+        if not extracted:
+            continue
+        chunk = extracted.strip()
+        text_chunks.append(chunk)
+        if limits.stop_after_lines is not None:
+            line_count += sum(1 for line in chunk.splitlines() if line.strip())
+            if line_count >= limits.stop_after_lines:
+                if pages.pages_read < pages.page_count:
+                    stop_reason = STOP_LINE_LIMIT
+                break
+    return ExtractedDocument(
+        text="\n".join(text_chunks),
+        page_count=pages.page_count,
+        pages_read=pages.pages_read,
+        stop_reason=stop_reason or pages.stop_reason,
+    )
+
+
+__all__ = [
+    "STOP_LINE_LIMIT",
+    "STOP_PAGE_CAP",
+    "STOP_TIME_BUDGET",
+    "ExtractedDocument",
+    "ExtractionLimits",
+    "PdfPageStream",
+    "ResumeSource",
+    "as_stream",
+    "collect_pages",
+    "open_resume_source",
+]
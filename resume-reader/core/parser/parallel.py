@@ -0,0 +1,166 @@
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union
+
+from .document import ExtractionLimits, ResumeSource, as_stream
+
+# What a worker process receives: a path when the upload is on disk, otherwise the bytes.
+PageSourceRef = Union[str, bytes]
+
+
+@dataclass(frozen=True)
+class PageParallelConfig:
+    """When and how widely to split a PDF's pages across worker processes.
+
+    ``workers`` of 0 or 1 disables page-parallel extraction. Documents with
+    fewer than ``min_pages`` pages to read stay sequential, and the worker
+    count grows by one for every ``pages_per_worker`` pages, up to
+    ``workers`` and never past the CPU count.
+    """
+
+    workers: int = 0
+    min_pages: int = 16
+    pages_per_worker: int = 8
+
+    @classmethod
+    def from_env(cls) -> "PageParallelConfig":
+        return cls(
+            workers=int(os.getenv("RESUME_READER_PDF_PAGE_WORKERS") or 0),
+            min_pages=int(os.getenv("RESUME_READER_PDF_PARALLEL_MIN_PAGES") or 16),
+            pages_per_worker=max(1, int(os.getenv("RESUME_READER_PDF_PAGES_PER_WORKER") or 8)),
+        )
+
+    def workers_for(self, pages: int) -> int:
+        if self.workers <= 1 or pages < self.min_pages:
+            return 1
+        return max(1, min(self.workers, os.cpu_count() or 1, math.ceil(pages / self.pages_per_worker)))
+
+
+_config = PageParallelConfig.from_env()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def configure_page_parallelism(config: PageParallelConfig) -> None:
+    """Replace the page-parallel settings; the pool is rebuilt on next use."""
+
+    global _config
+    shutdown_page_pool()
+    _config = config
+
+
+def disable_page_parallelism() -> None:
+    """Read every document sequentially in this process.
+
+    Meant for executor worker processes. A pool inherited through fork
+    belongs to the parent, so it is dropped rather than shut down.
+    """
+
+    global _config, _pool
+    _config = PageParallelConfig(workers=0)
+    _pool = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned rather than forked: the API process runs threads (the
+            # event loop, the executor's pool), and a fork copies their locks
+            # in whatever state they are in.
+            _pool = ProcessPoolExecutor(max_workers=_config.workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_page_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _read_page_range(backend_name: str, source: PageSourceRef, start: int, stop: int) -> List[str]:
+    # Imported here: the registry imports the backends, which import this module.
+    from .registry import default_registry
+
+    backend = default_registry.get(backend_name)
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            return backend.read_page_range(handle, start, stop)
+    return backend.read_page_range(source, start, stop)
+
+
+def _source_ref(source: ResumeSource) -> PageSourceRef:
+    path = getattr(source, "name", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        return path
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    return as_stream(source).read()
+
+
+def parallel_page_texts(
+    backend_name: str,
+    source: ResumeSource,
+    page_count: int,
+    limits: ExtractionLimits,
+) -> Optional[Iterator[str]]:
+    """Page texts parsed across worker processes, in page order.
+
+    Returns ``None`` when the document should be read sequentially: the
+    feature is off, too few pages would be read, or the caller asked to stop
+    after a few lines (parsing pages ahead would be wasted work). The pages
+    themselves are parsed exactly as in the sequential path, so the joined
+    text is identical. With a time budget, pages are released chunk by chunk
+    until the budget runs out; the first chunk is always waited for.
+    """
+
+    pages_to_read = page_count if limits.max_pages is None else min(page_count, limits.max_pages)
+    if limits.stop_after_lines is not None:
+        return None
+    workers = _config.workers_for(pages_to_read)
+    if workers <= 1:
+        return None
+
+    source_ref = _source_ref(source)
+    chunk_size = math.ceil(pages_to_read / workers)
+    pool = _get_pool()
+    futures: List[Future] = [
+        pool.submit(_read_page_range, backend_name, source_ref, start, min(start + chunk_size, pages_to_read))
+        for start in range(0, pages_to_read, chunk_size)
+    ]
+    return _ordered_pages(futures, limits)
+
+
+def _ordered_pages(futures: List[Future], limits: ExtractionLimits) -> Iterator[str]:
+    deadline = None
+    if limits.time_budget_seconds:
+        deadline = time.monotonic() + limits.time_budget_seconds
+    try:
+        for index, future in enumerate(futures):
+            timeout = None
+            if deadline is not None and index:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                pages = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                return
+            yield from pages
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+__all__ = [
+    "PageParallelConfig",
+    "configure_page_parallelism",
+    "disable_page_parallelism",
+    "parallel_page_texts",
+    "shutdown_page_pool",
+]
@@ -0,0 +1,112 @@
+import hashlib
+from typing import Dict, List, Optional, Sequence
+
+from ..exceptions import ResumeExtractionError, UnsupportedResumeFormatError
+from .backends import (
+    ExtractorBackend,
+    PlainTextBackend,
+    PyMuPdfBackend,
+    PyPdf2Backend,
+    PythonDocxBackend,
+)
+from .document import ExtractedDocument, ExtractionLimits, ResumeSource
+
+
+class ExtractorRegistry:
+    """Maps content types to extractor backends ordered by speed.
+
+    ``extract`` tries every installed backend for the content type, fastest
+    first, and falls back to the next one when a backend fails.
+    """
+
+    def __init__(self, backends: Sequence[ExtractorBackend] = ()):
+        self._backends: List[ExtractorBackend] = []
+        for backend in backends:
+            self.register(backend)
+
+    def register(self, backend: ExtractorBackend) -> None:
+        backend.load()
+        self._backends.append(backend)
+        self._backends.sort(key=lambda item: item.speed_rank)
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the installed backends and their versions.
+
+        Which backend reads a document, and so the exact text, depends on
+        what is installed; parse caches key on this so a result from PyPDF2
+        is not served once PyMuPDF is available, or after an upgrade.
+        """
+
+        entries = sorted(f"{backend.name}={backend.version}" for backend in self._backends if backend.available)
+        return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()[:16]
+
+    def get(self, name: str) -> ExtractorBackend:
+        for backend in self._backends:
+            if backend.name == name:
+                return backend
+        raise KeyError(name)
+
+    def supports(self, content_type: str) -> bool:
+        return any(content_type in backend.content_types for backend in self._backends)
+
+    def backends_for(self, content_type: str) -> List[ExtractorBackend]:
+        return [
+            backend
+            for backend in self._backends
+            if content_type in backend.content_types and backend.available
+        ]
+
+    def extract(
+        self,
+        content_type: str,
+        source: ResumeSource,
+        limits: ExtractionLimits,
+    ) -> ExtractedDocument:
+        if not self.supports(content_type):
+            raise UnsupportedResumeFormatError(f"Unsupported resume format: {content_type}")
+
+        candidates = self.backends_for(content_type)
+        if not candidates:
+            missing = ", ".join(
+                backend.module_name
+                for backend in self._backends
+                if content_type in backend.content_types and backend.module_name
+            )
+            raise ResumeExtractionError(
+                f"No extractor installed for {content_type}. Install one of: {missing}."
+            )
+
+        last_error: Optional[ResumeExtractionError] = None
+        for backend in candidates:
+            try:
+                return backend.extract(source, limits)
+            except ResumeExtractionError as exc:
+                last_error = exc
+        raise last_error
+
+    def describe(self) -> List[Dict[str, object]]:
+        return [
+            {
+                "name": backend.name,
+                "contentTypes": sorted(backend.content_types),
+                "speedRank": backend.speed_rank,
+                "available": backend.available,
+                "paged": backend.capabilities.paged,
+                "pageParallel": backend.capabilities.page_parallel,
+            }
+            for backend in self._backends
+        ]
+
+
+default_registry = ExtractorRegistry(
+    [
+        PlainTextBackend(),
+        PyMuPdfBackend(),
+        PyPdf2Backend(),
+        PythonDocxBackend(),
+    ]
+)
+
+
+__all__ = ["ExtractorRegistry", "default_registry"]
@@ -0,0 +1,17 @@
+from .projection import (
+    ALL_STAGES,
+    FIELD_STAGES,
+    RESPONSE_FIELDS,
+    parse_fields,
+    project_response,
+    stages_for,
+)
+
+__all__ = [
+    "ALL_STAGES",
+    "FIELD_STAGES",
+    "RESPONSE_FIELDS",
+    "parse_fields",
+    "project_response",
+    "stages_for",
+]
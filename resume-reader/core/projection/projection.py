@@ -0,0 +1,69 @@
+from dataclasses import asdict, fields as dataclass_fields
+from typing import Any, Dict, FrozenSet, Optional
+
+from ..exceptions import InvalidResumeFieldError
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
+
+RESPONSE_FIELDS: FrozenSet[str] = frozenset(item.name for item in dataclass_fields(ResumeReaderResponseVOData))
+
+# Analyzer stages each response field depends on. Fields without an entry come
+# straight from the extracted document.
+FIELD_STAGES: Dict[str, FrozenSet[str]] = {
+    "emails": frozenset({"contacts"}),
+    "phone_numbers": frozenset({"contacts"}),
+    "urls": frozenset({"contacts"}),
+    "skills": frozenset({"skills"}),
+    "taxonomy_version": frozenset({"skills"}),
+    "sections": frozenset({"sections"}),
+    "section_headers": frozenset({"sections"}),
+    "probable_name": frozenset({"contacts", "probable_name"}),
+    "summary": frozenset({"summary"}),
+}
+
+ALL_STAGES: FrozenSet[str] = frozenset().union(*FIELD_STAGES.values())
+
+
+def parse_fields(raw: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated ``fields`` selector; ``None`` or blank selects everything."""
+
+    if raw is None or not raw.strip():
+        return None
+    selected = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    unknown = selected - RESPONSE_FIELDS
+    if unknown:
+        raise InvalidResumeFieldError(
+            f"Unknown resume field(s): {', '.join(sorted(unknown))}. "
+            f"Allowed values: {', '.join(sorted(RESPONSE_FIELDS))}"
+        )
+    return selected
+
+
+def stages_for(selected: Optional[FrozenSet[str]]) -> FrozenSet[str]:
+    if selected is None:
+        return ALL_STAGES
+    return frozenset().union(*(FIELD_STAGES.get(name, frozenset()) for name in selected))
+
+
+def project_response(
+    response: ResumeReaderResponseVO,
+    selected: Optional[FrozenSet[str]],
+) -> Dict[str, Any]:
+    """Serialise ``response``, keeping only the ``selected`` data fields.
+
+    The diagnostic ``profile`` is never serialised.
+    """
+
+    data = asdict(response.data)
+    if selected is not None:
+        data = {name: value for name, value in data.items() if name in selected}
+    return {"success": response.success, "data": data}
+
+
+__all__ = [
+    "ALL_STAGES",
+    "FIELD_STAGES",
+    "RESPONSE_FIELDS",
+    "parse_fields",
+    "project_response",
+    "stages_for",
+]
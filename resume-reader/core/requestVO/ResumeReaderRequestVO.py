@@ -1,7 +1,14 @@
 from dataclasses import dataclass
+from typing import FrozenSet, Optional
 
 
 @dataclass(frozen=True)
 class ResumeReaderRequestVO:
     filename: str
-    file_bytes: bytes
+    file_bytes: bytes = b""
+    # Set instead of file_bytes when the upload was spooled to a temporary file.
+    file_path: Optional[str] = None
+    # SHA-256 hex digest of the content, when already computed while receiving it.
+    content_hash: Optional[str] = None
+    # Response fields the caller wants; None runs every analyzer.
+    fields: Optional[FrozenSet[str]] = None
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from ..parser.document import STOP_TIME_BUDGET
 
 
 @dataclass(frozen=True)
@@ -10,11 +12,50 @@ class ResumeReaderResponseVOData:
     urls: List[str] = field(default_factory=list)
     skills: List[str] = field(default_factory=list)
     sections: Dict[str, List[str]] = field(default_factory=dict)
+    # Section key -> header variant that opened it, e.g. {"experience": "work experience"}.
+    section_headers: Dict[str, str] = field(default_factory=dict)
     probable_name: Optional[str] = None
     summary: List[str] = field(default_factory=list)
+    # Paged formats only: total pages and how many were left unread because of
+    # the page cap, the time budget or an early stop.
+    page_count: Optional[int] = None
+    pages_skipped: int = 0
+    # Which limit ended reading early ("page_cap", "time_budget" or
+    # "stop_after_lines"); None when every page was read.
+    stop_reason: Optional[str] = None
+    # Version of the skill taxonomy that produced ``skills``; None when the
+    # skills stage did not run.
+    taxonomy_version: Optional[str] = None
+
+    @property
+    def cut_short_by_time_budget(self) -> bool:
+        """True when a slow run, not the document, decided how much was read.
+
+        Such a result must not be cached or stored, or one slow run would be
+        served in place of the full result from then on.
+        """
+
+        return self.stop_reason == STOP_TIME_BUDGET
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+
+
+@dataclass(frozen=True)
+class ResumeReaderProfile:
+    """How a response was produced. Diagnostic only, never part of the JSON body."""
+
+    content_type: Optional[str]
+    size_bytes: int
+    stages: Tuple[StageTiming, ...] = ()
 
 
 @dataclass(frozen=True)
 class ResumeReaderResponseVO:
     success: bool
     data: ResumeReaderResponseVOData
+    profile: Optional[ResumeReaderProfile] = field(default=None, compare=False)
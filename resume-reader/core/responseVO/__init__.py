@@ -1,3 +1,8 @@
-from .ResumeReaderResponseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
+from .ResumeReaderResponseVO import (
+    ResumeReaderProfile,
+    ResumeReaderResponseVO,
+    ResumeReaderResponseVOData,
+    StageTiming,
+)
 
-__all__ = ["ResumeReaderResponseVO", "ResumeReaderResponseVOData"]
+__all__ = ["ResumeReaderProfile", "ResumeReaderResponseVO", "ResumeReaderResponseVOData", "StageTiming"]
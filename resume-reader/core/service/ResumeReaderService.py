@@ -9,6 +9,11 @@ if TYPE_CHECKING:
 class ResumeReaderService(ABC):
     """Contract for services that can parse resumes and return structured data."""
 
+    @property
+    def cache_namespace(self) -> str:
+        """Settings that change the output for identical input, folded into cache keys."""
+        return ""
+
     @abstractmethod
     def read_resume(self, request: "ResumeReaderRequestVO") -> "ResumeReaderResponseVO":
         """Process the uploaded resume and return structured metadata."""
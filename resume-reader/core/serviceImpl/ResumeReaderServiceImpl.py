@@ -1,45 +1,117 @@
+import os
+from dataclasses import replace
+from typing import Optional, Tuple
+
 from ..analyzer import (
-    detect_sections,
+    AnalysisContext,
+    TaxonomyStore,
+    default_section_classifier,
+    default_taxonomy_store,
+    detect_sections_with_headers,
     detect_skills,
     extract_contacts,
     infer_probable_name,
     summarize,
 )
 from ..exceptions import ResumeExtractionError
-from ..parser import extract_text
+from ..metrics import StageTimer
+from ..parser import ExtractedDocument, ExtractionLimits, default_registry, extract_document, open_resume_source
+from ..projection import stages_for
 from ..requestVO.ResumeReaderRequestVO import ResumeReaderRequestVO
-from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderProfile, ResumeReaderResponseVO
 from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVOData
 from ..service.ResumeReaderService import ResumeReaderService
 
+SUMMARY_LINE_LIMIT = 5
+
 
 class ResumeReaderServiceImpl(ResumeReaderService):
     """Default implementation that parses PDF/DOCX/TXT resumes."""
 
+    def __init__(
+        self,
+        limits: Optional[ExtractionLimits] = None,
+        taxonomy_store: Optional[TaxonomyStore] = None,
+    ):
+        self._limits = limits or ExtractionLimits.from_env()
+        self._taxonomy_store = taxonomy_store or default_taxonomy_store
+
+    @property
+    def cache_namespace(self) -> str:
+        return (
+            f"{self._limits.cache_tag}:{self._taxonomy_store.current.version}:"
+            f"{default_section_classifier.fingerprint}:{default_registry.fingerprint}"
+        )
+
     def read_resume(self, request: ResumeReaderRequestVO) -> ResumeReaderResponseVO:
-        if not request.file_bytes:
+        if not request.file_bytes and not request.file_path:
             raise ResumeExtractionError("Empty resume file submitted.")
 
-        text = extract_text(request.filename, request.file_bytes)
+        timer = StageTimer()
+        with timer.stage("total"):
+            document, payload = self._read(request, timer)
+
+        size_bytes = os.path.getsize(request.file_path) if request.file_path else len(request.file_bytes)
+        profile = ResumeReaderProfile(
+            content_type=document.content_type,
+            size_bytes=size_bytes,
+            stages=timer.stages,
+        )
+        return ResumeReaderResponseVO(success=True, data=payload, profile=profile)
+
+    def _read(
+        self,
+        request: ResumeReaderRequestVO,
+        timer: StageTimer,
+    ) -> Tuple[ExtractedDocument, ResumeReaderResponseVOData]:
+        stages = stages_for(request.fields)
+        limits = self._limits
+        if request.fields is not None and request.fields <= {"summary"}:
+            # The summary only covers the first lines, so stop reading there.
+            limits = replace(limits, stop_after_lines=SUMMARY_LINE_LIMIT)
+
+        with timer.stage("extract"), open_resume_source(request.file_bytes, request.file_path) as source:
+            document = extract_document(request.filename, source, limits)
+        text = document.text
         if not text.strip():
             raise ResumeExtractionError("Unable to extract readable text from resume.")
 
-        lines = text.splitlines()
-        contacts = extract_contacts(text)
-        sections = detect_sections(lines)
-        skills = detect_skills(text, sections)
-        probable_name = infer_probable_name(lines, contacts["emails"])
-        summary_lines = summarize(lines)
+        context = AnalysisContext(text)
+        contacts = {"emails": [], "phones": [], "urls": []}
+        sections = {}
+        section_headers = {}
+        skills = []
+        taxonomy_version = None
+        probable_name = None
+        summary_lines = []
+        if "contacts" in stages:
+            contacts = timer.call("contacts", extract_contacts, context)
+        if "sections" in stages:
+            sections, section_headers = timer.call("sections", detect_sections_with_headers, context)
+        if "skills" in stages:
+            # Read the store once, so the recorded version is the one the skills came from.
+            taxonomy = self._taxonomy_store.current
+            skills = timer.call("skills", detect_skills, context, taxonomy)
+            taxonomy_version = taxonomy.version
+        if "probable_name" in stages:
+            probable_name = timer.call("name", infer_probable_name, context, contacts["emails"])
+        if "summary" in stages:
+            summary_lines = timer.call("summary", summarize, context, SUMMARY_LINE_LIMIT)
+        include_text = request.fields is None or "raw_text" in request.fields
 
         payload = ResumeReaderResponseVOData(
-            raw_text=text.strip(),
+            raw_text=text.strip() if include_text else "",
             emails=contacts["emails"],
             phone_numbers=contacts["phones"],
             urls=contacts["urls"],
             skills=skills,
             sections=sections,
+            section_headers=section_headers,
             probable_name=probable_name,
             summary=summary_lines,
+            page_count=document.page_count,
+            pages_skipped=document.pages_skipped,
+            stop_reason=document.stop_reason,
+            taxonomy_version=taxonomy_version,
         )
-
-        return ResumeReaderResponseVO(success=True, data=payload)
+        return document, payload
@@ -0,0 +1,9 @@
+from .entity import BaseEntity, ResumeParseResultEntity, ResumeParseSkillEntity
+from .store import ResumeParseStore
+
+__all__ = [
+    "BaseEntity",
+    "ResumeParseResultEntity",
+    "ResumeParseSkillEntity",
+    "ResumeParseStore",
+]
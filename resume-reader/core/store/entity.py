@@ -0,0 +1,17 @@
+from sqlalchemy.orm import declarative_base
+
+from backend_common.orm.common import BaseEntityMixin
+from backend_common.orm.resume_parse import ResumeParseResultColumns, ResumeParseSkillColumns
+
+# resume-reader owns no other tables, so it keeps its own metadata. The
+# columns come from backend_common, which job-recommendation-system maps the
+# same tables from; the DDL is in job-recommendation-system/data/sql/Major_02_00_00.
+BaseEntity = declarative_base(cls=BaseEntityMixin)
+
+
+class ResumeParseResultEntity(ResumeParseResultColumns, BaseEntity):
+    pass
+
+
+class ResumeParseSkillEntity(ResumeParseSkillColumns, BaseEntity):
+    pass
@@ -0,0 +1,122 @@
+import os
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend_common.fastapi_support import DatabaseBundle, build_database_bundle
+
+from ..analyzer import ANALYZER_VERSION, default_taxonomy_store
+from ..exceptions import ResumeParseStoreError
+from ..responseVO.ResumeReaderResponseVO import ResumeReaderResponseVOData
+from .entity import BaseEntity, ResumeParseResultEntity, ResumeParseSkillEntity
+
+
+class ResumeParseStore:
+    """Writes parse results to the structured ``resume_parse_*`` tables.
+
+    One result row is kept per (user, file content): parsing the same file
+    for the same user again replaces the row's fields and its skill rows in
+    a single transaction, so readers never see a result without its skills.
+    """
+
+    def __init__(self, session_scope: Callable):
+        self._session_scope = session_scope
+
+    @classmethod
+    def from_bundle(cls, bundle: DatabaseBundle) -> "ResumeParseStore":
+        return cls(bundle.session_scope)
+
+    @classmethod
+    def from_env(cls) -> Optional["ResumeParseStore"]:
+        """Build a store from RESUME_READER_DATABASE_URL, or None when persistence is off."""
+
+        if not os.getenv("RESUME_READER_DATABASE_URL"):
+            return None
+        bundle = build_database_bundle(
+            base_entity=BaseEntity,
+            model_modules=(),
+            env_vars=("RESUME_READER_DATABASE_URL",),
+        )
+        return cls.from_bundle(bundle)
+
+    def save(
+        self,
+        user_id: int,
+        content_hash: str,
+        filename: Optional[str],
+        data: ResumeReaderResponseVOData,
+    ) -> int:
+        """Store ``data`` for ``user_id`` and return the result row id.
+
+        The taxonomy version is the one recorded in ``data`` when its skills
+        were detected; only results cached before that was recorded fall
+        back to the current taxonomy.
+        """
+
+        taxonomy_version = data.taxonomy_version or default_taxonomy_store.current.version
+        try:
+            with self._session_scope() as session:
+                return self._save(session, user_id, content_hash, filename, data, taxonomy_version)
+        except SQLAlchemyError as exc:
+            raise ResumeParseStoreError("Parse result could not be saved.") from exc
+
+    def _save(
+        self,
+        session: Session,
+        user_id: int,
+        content_hash: str,
+        filename: Optional[str],
+        data: ResumeReaderResponseVOData,
+        taxonomy_version: str,
+    ) -> int:
+        key = {"user_id": user_id, "content_hash": content_hash}
+        values = {
+            "filename": filename,
+            "analyzer_version": ANALYZER_VERSION,
+            "taxonomy_version": taxonomy_version,
+            "probable_name": data.probable_name,
+            "emails_json": list(data.emails),
+            "phone_numbers_json": list(data.phone_numbers),
+            "urls_json": list(data.urls),
+            "sections_json": dict(data.sections),
+            "section_headers_json": dict(data.section_headers),
+            "page_count": data.page_count,
+            "lastUpdateTime": datetime.utcnow(),
+        }
+        table = ResumeParseResultEntity.__table__
+
+        if session.get_bind().dialect.name == "mysql":
+            # One statement, so two concurrent saves of the same file cannot
+            # both miss the row and collide on the unique key; the loser
+            # waits on the winner's row lock and then updates it.
+            statement = mysql_insert(table).values(**key, **values)
+            statement = statement.on_duplicate_key_update({column: statement.inserted[column] for column in values})
+            session.execute(statement)
+        else:
+            # Portable fallback: update what exists, insert otherwise.
+            updated = session.execute(
+                update(table).where(table.c.user_id == user_id, table.c.content_hash == content_hash).values(**values)
+            )
+            if not updated.rowcount:
+                session.execute(insert(table).values(**key, **values))
+
+        result_id = session.execute(
+            select(table.c.id).where(table.c.user_id == user_id, table.c.content_hash == content_hash)
+        ).scalar_one()
+        session.execute(delete(ResumeParseSkillEntity).where(ResumeParseSkillEntity.parse_result_id == result_id))
+
+        skills = sorted(set(data.skills))
+        if skills:
+            # One multi-row INSERT rather than an ORM object per skill.
+            session.execute(
+                insert(ResumeParseSkillEntity),
+                [{"parse_result_id": result_id, "user_id": user_id, "skill": skill} for skill in skills],
+            )
+        return result_id
+
+
+__all__ = ["ResumeParseStore"]
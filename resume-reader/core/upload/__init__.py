@@ -0,0 +1,4 @@
+from .form import SpooledForm, spool_form
+from .spool import SpoolConfig, SpooledUpload
+
+__all__ = ["SpoolConfig", "SpooledForm", "SpooledUpload", "spool_form"]
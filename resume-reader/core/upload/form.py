@@ -0,0 +1,151 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterable, Dict, List, Optional
+
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+
+from ..exceptions import InvalidUploadError, ResumeTooLargeError
+from .spool import SpoolConfig, SpooledUpload
+
+# Plain form fields are small settings such as callback_url.
+MAX_FIELD_BYTES = 8 * 1024
+MAX_FIELDS = 16
+
+
+@dataclass
+class SpooledForm:
+    """A multipart body: text fields plus one spooled upload per file part."""
+
+    fields: Dict[str, str] = field(default_factory=dict)
+    files: List[SpooledUpload] = field(default_factory=list)
+
+    def close(self) -> None:
+        for upload in self.files:
+            upload.close()
+
+
+def _decode(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+class _FormSpooler:
+    """Callbacks for ``MultipartParser`` that write file parts straight into spools."""
+
+    def __init__(self, config: SpoolConfig, file_field: str, max_files: int):
+        self.form = SpooledForm()
+        self.complete = False
+        self._config = config
+        self._file_field = file_field
+        self._max_files = max_files
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._name = ""
+        self._upload: Optional[SpooledUpload] = None
+        self._data = bytearray()
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_end": self.on_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._disposition = b""
+        self._upload = None
+        self._data = bytearray()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if b"name" not in options:
+            raise InvalidUploadError('Every form part needs a Content-Disposition "name".')
+        self._name = _decode(options[b"name"])
+        if b"filename" in options:
+            if self._name != self._file_field:
+                raise InvalidUploadError(f"Files must be sent in the {self._file_field!r} field.")
+            if len(self.form.files) >= self._max_files:
+                raise ResumeTooLargeError(f"At most {self._max_files} file(s) may be uploaded at once.")
+            self._upload = SpooledUpload(_decode(options[b"filename"]), self._config)
+            self.form.files.append(self._upload)
+        elif len(self.form.fields) >= MAX_FIELDS:
+            raise InvalidUploadError(f"At most {MAX_FIELDS} form fields are accepted.")
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._upload is not None:
+            # SpooledUpload.write enforces the size limit, so an oversized
+            # file stops the body being read here.
+            self._upload.write(data[start:end])
+            return
+        self._data += data[start:end]
+        if len(self._data) > MAX_FIELD_BYTES:
+            raise InvalidUploadError(f"Form field {self._name!r} exceeds {MAX_FIELD_BYTES} bytes.")
+
+    def on_part_end(self) -> None:
+        if self._upload is not None:
+            self._upload.finish()
+        else:
+            self.form.fields[self._name] = _decode(bytes(self._data))
+
+    def on_end(self) -> None:
+        self.complete = True
+
+
+async def spool_form(
+    content_type: Optional[str],
+    body: AsyncIterable[bytes],
+    config: SpoolConfig,
+    *,
+    file_field: str = "file",
+    max_files: int = 1,
+) -> SpooledForm:
+    """Read a multipart/form-data ``body`` as it streams in.
+
+    File parts go straight into :class:`SpooledUpload` instances, so the
+    content is stored once and the size limit applies while the body is
+    still arriving rather than after it has been buffered. Files are only
+    accepted in ``file_field``, at most ``max_files`` of them.
+    """
+
+    kind, options = parse_options_header(content_type or "")
+    if kind != b"multipart/form-data" or b"boundary" not in options:
+        raise InvalidUploadError("Expected a multipart/form-data body.")
+
+    spooler = _FormSpooler(config, file_field, max_files)
+    parser = MultipartParser(options[b"boundary"], spooler.callbacks())
+    try:
+        async for chunk in body:
+            parser.write(chunk)
+        parser.finalize()
+        if not spooler.complete:
+            raise InvalidUploadError("The multipart body ended before its closing boundary.")
+    except MultipartParseError as exc:
+        spooler.form.close()
+        raise InvalidUploadError("The multipart body is malformed.") from exc
+    except BaseException:
+        spooler.form.close()
+        raise
+    return spooler.form
+
+
+__all__ = ["MAX_FIELD_BYTES", "MAX_FIELDS", "SpooledForm", "spool_form"]
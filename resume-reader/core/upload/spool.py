@@ -0,0 +1,125 @@
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional
+
+from ..exceptions import ResumeTooLargeError
+from ..requestVO.ResumeReaderRequestVO import ResumeReaderRequestVO
+
+
+@dataclass(frozen=True)
+class SpoolConfig:
+    """Limits applied while receiving an upload."""
+
+    spool_threshold_bytes: int = 1024 * 1024
+    max_bytes: int = 20 * 1024 * 1024
+    temp_dir: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "SpoolConfig":
+        return cls(
+            spool_threshold_bytes=int(os.getenv("RESUME_READER_SPOOL_THRESHOLD_BYTES") or 1024 * 1024),
+            max_bytes=int(os.getenv("RESUME_READER_MAX_UPLOAD_BYTES") or 20 * 1024 * 1024),
+            temp_dir=os.getenv("RESUME_READER_SPOOL_DIR") or None,
+        )
+
+
+class SpooledUpload:
+    """Upload body held in memory until it crosses the spool threshold.
+
+    Past the threshold the content moves to a named temporary file, so parsers
+    (including worker processes) can read it by path instead of receiving a
+    copy. The SHA-256 digest is computed as chunks arrive and the size limit
+    is enforced before each chunk is stored.
+    """
+
+    def __init__(self, filename: str, config: SpoolConfig):
+        self.filename = filename
+        self._config = config
+        self._chunks: List[bytes] = []
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        self._digest = hashlib.sha256()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._file.name if self._file else None
+
+    @property
+    def content_hash(self) -> str:
+        return self._digest.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        if self._size + len(chunk) > self._config.max_bytes:
+            raise ResumeTooLargeError(
+                f"{self.filename or 'Upload'} exceeds the {self._config.max_bytes} byte limit."
+            )
+
+        self._size += len(chunk)
+        self._digest.update(chunk)
+
+        if self._file is None and self._size > self._config.spool_threshold_bytes:
+            self._file = tempfile.NamedTemporaryFile(
+                prefix="resume-upload-",
+                dir=self._config.temp_dir,
+                delete=False,
+            )
+            for buffered in self._chunks:
+                self._file.write(buffered)
+            self._chunks = []
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def finish(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def open(self) -> BinaryIO:
+        """Return a fresh binary stream over the content."""
+
+        if self._file is not None:
+            return open(self._file.name, "rb")
+        return io.BytesIO(b"".join(self._chunks))
+
+    def to_request(self) -> ResumeReaderRequestVO:
+        if self._file is not None:
+            return ResumeReaderRequestVO(
+                filename=self.filename,
+                file_path=self._file.name,
+                content_hash=self.content_hash,
+            )
+        content = b"".join(self._chunks)
+        # Keep a single reference to the joined body rather than both copies.
+        self._chunks = [content] if content else []
+        return ResumeReaderRequestVO(
+            filename=self.filename,
+            file_bytes=content,
+            content_hash=self.content_hash,
+        )
+
+    def close(self) -> None:
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+            with suppress(OSError):
+                os.unlink(self._file.name)
+            self._file = None
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = ["SpoolConfig", "SpooledUpload"]
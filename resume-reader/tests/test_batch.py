@@ -0,0 +1,95 @@
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.batch import expand_archive
+from core.exceptions import ResumeExtractionError, ResumeTooLargeError
+from core.upload import SpoolConfig
+from web.restController import ResumeReaderController as controller
+
+
+def _zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def _expand(archive, config=SpoolConfig(), **limits):
+    limits = {"max_entries": 10, "max_entry_bytes": 10_000, "max_total_bytes": 100_000, **limits}
+    return expand_archive("cvs.zip", archive, config, **limits)
+
+
+def test_entries_are_spooled_and_large_ones_spill_to_disk():
+    uploads = _expand(
+        _zip({"a/small.txt": b"Jane Doe", "big.txt": b"x" * 5000, "__MACOSX/._big.txt": b"fork"}),
+        SpoolConfig(spool_threshold_bytes=1024),
+    )
+    try:
+        small, big = uploads
+        assert (small.filename, small.size, small.path) == ("small.txt", 8, None)
+        assert big.size == 5000 and big.path is not None
+        with big.open() as stream:
+            assert stream.read() == b"x" * 5000
+    finally:
+        for upload in uploads:
+            upload.close()
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [{"max_entries": 1}, {"max_entry_bytes": 4999}, {"max_total_bytes": 5007}],
+)
+def test_archive_limits_are_enforced(limits):
+    with pytest.raises(ResumeTooLargeError):
+        _expand(_zip({"a.txt": b"Jane Doe", "b.txt": b"x" * 5000}), **limits)
+
+
+def test_invalid_archives_are_refused():
+    with pytest.raises(ResumeExtractionError):
+        _expand(io.BytesIO(b"not a zip"))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(controller, "BATCH_MAX_TOTAL_BYTES", 4000)
+    app = FastAPI()
+    app.include_router(controller.router)
+    return TestClient(app)
+
+
+def test_batch_expands_archives_into_items(client):
+    archive = _zip({"one.txt": b"one@example.com", "two.txt": b"two@example.com"})
+
+    response = client.post(
+        "/resume-reader/extract/batch",
+        files=[("files", ("cvs.zip", archive)), ("files", ("three.txt", io.BytesIO(b"three@example.com")))],
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(email for line in lines for email in line["data"]["emails"]) == [
+        "one@example.com",
+        "three@example.com",
+        "two@example.com",
+    ]
+
+
+def test_batch_refuses_oversized_bodies_and_expansions(client):
+    declared = client.post(
+        "/resume-reader/extract/batch",
+        files=[("files", ("big.txt", io.BytesIO(b"x" * 30_000)))],
+    )
+    expanded = client.post(
+        "/resume-reader/extract/batch",
+        files=[("files", ("cvs.zip", _zip({"a.txt": b"x" * 3000, "b.txt": b"x" * 3000})))],
+    )
+
+    assert declared.status_code == 413
+    assert expanded.status_code == 413
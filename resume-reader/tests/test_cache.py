@@ -0,0 +1,57 @@
+import asyncio
+import os
+import time
+
+from core.cache import ResumeParseCache
+from core.responseVO.ResumeReaderResponseVO import ResumeReaderResponseVOData
+
+
+def _data(text):
+    return ResumeReaderResponseVOData(raw_text=text)
+
+
+def _disk_files(directory):
+    return sorted(path.name for path in directory.glob("*/*.json"))
+
+
+def test_async_access_reads_and_writes_the_disk_tier(tmp_path):
+    writer = ResumeParseCache(max_entries=0, disk_dir=str(tmp_path))
+    asyncio.run(writer.put_async("key", _data("stored")))
+
+    reader = ResumeParseCache(max_entries=4, disk_dir=str(tmp_path))
+
+    assert asyncio.run(reader.get_async("key")) == _data("stored")
+    assert asyncio.run(reader.get_async("missing")) is None
+    assert reader.stats()["diskHits"] == 1 and reader.stats()["misses"] == 1
+
+
+def test_disk_tier_evicts_least_recently_used_entries(tmp_path):
+    cache = ResumeParseCache(max_entries=0, disk_dir=str(tmp_path), disk_max_bytes=12_000)
+    cache.put("old", _data("x" * 3000))
+    cache.put("used", _data("x" * 3000))
+    past = time.time() - 60
+    for path in tmp_path.glob("*/*.json"):
+        os.utime(path, (past, past))
+    assert cache.get("used") is not None
+
+    cache.put("new", _data("x" * 3000))
+    cache.put("newer", _data("x" * 3000))
+
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.stats()["diskBytes"] <= 12_000
+
+
+def test_expired_disk_entries_are_misses_and_pruned_at_startup(tmp_path):
+    ResumeParseCache(max_entries=0, disk_dir=str(tmp_path)).put("stale", _data("old"))
+    past = time.time() - 3600
+    for path in tmp_path.glob("*/*.json"):
+        os.utime(path, (past, past))
+
+    assert ResumeParseCache(max_entries=0, disk_dir=str(tmp_path), disk_max_age_seconds=7200).get("stale") is not None
+    past = time.time() - 3600
+    for path in tmp_path.glob("*/*.json"):
+        os.utime(path, (past, past))
+    ResumeParseCache(max_entries=0, disk_dir=str(tmp_path), disk_max_age_seconds=60)
+
+    assert _disk_files(tmp_path) == []
@@ -0,0 +1,46 @@
+from core.parser import ExtractorRegistry, PlainTextBackend, PyMuPdfBackend, PyPdf2Backend, default_registry
+from core.serviceImpl.ResumeReaderServiceImpl import ResumeReaderServiceImpl
+
+
+class _FakeModule:
+    __version__ = "1.0"
+
+
+def _registry(*backends):
+    return ExtractorRegistry(list(backends))
+
+
+def test_registry_fingerprint_follows_installed_backends_and_versions():
+    base = _registry(PlainTextBackend(), PyPdf2Backend()).fingerprint
+
+    with_pymupdf = PyMuPdfBackend()
+    with_pymupdf.load()
+    with_pymupdf._module = _FakeModule()
+    assert _registry(PlainTextBackend(), PyPdf2Backend(), with_pymupdf).fingerprint != base
+
+    upgraded = _FakeModule()
+    upgraded.__version__ = "2.0"
+    newer = PyMuPdfBackend()
+    newer.load()
+    newer._module = upgraded
+    assert _registry(PlainTextBackend(), PyPdf2Backend(), newer).fingerprint not in (
+        base,
+        _registry(PlainTextBackend(), PyPdf2Backend(), with_pymupdf).fingerprint,
+    )
+
+
+def test_missing_backends_do_not_change_the_fingerprint():
+    missing = PyMuPdfBackend()
+    missing.load()
+    missing._module = None
+
+    assert _registry(PlainTextBackend(), missing).fingerprint == _registry(PlainTextBackend()).fingerprint
+
+
+def test_service_namespace_includes_the_registry_fingerprint(monkeypatch):
+    service = ResumeReaderServiceImpl()
+    before = service.cache_namespace
+    monkeypatch.setattr(type(default_registry), "fingerprint", property(lambda self: "other"))
+
+    assert service.cache_namespace != before
+    assert service.cache_namespace.endswith(":other")
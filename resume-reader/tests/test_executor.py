@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+
+from core.exceptions import ResumeExtractionTimeoutError, ResumeReaderBusyError
+from core.executor import ResumeExecutorConfig, ResumeExtractionExecutor
+from core.requestVO import ResumeReaderRequestVO
+from core.responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
+
+
+class GatedService:
+    """Holds every parse until ``release`` is set."""
+
+    cache_namespace = "stub"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def read_resume(self, request):
+        self.release.wait(5)
+        self.finished.set()
+        return ResumeReaderResponseVO(success=True, data=ResumeReaderResponseVOData(raw_text="ok"))
+
+
+def test_timed_out_jobs_keep_their_slot_until_they_finish():
+    service = GatedService()
+    executor = ResumeExtractionExecutor(
+        service, ResumeExecutorConfig(max_workers=1, queue_size=0, job_timeout_seconds=0.1)
+    )
+    request = ResumeReaderRequestVO(filename="cv.txt", file_bytes=b"x")
+
+    async def scenario():
+        with pytest.raises(ResumeExtractionTimeoutError):
+            await executor.run(request)
+        # The parse is still running, so capacity is still taken.
+        with pytest.raises(ResumeReaderBusyError):
+            await executor.run(request)
+        service.release.set()
+        await asyncio.to_thread(service.finished.wait, 5)
+        await asyncio.sleep(0.05)
+        return await executor.run(request)
+
+    try:
+        response = asyncio.run(scenario())
+    finally:
+        service.release.set()
+        executor.shutdown()
+
+    assert response.success
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.exceptions import ResumeExtractionError, ResumeReaderBusyError
+from core.executor import ResumeExecutorConfig, ResumeExtractionExecutor
+from core.jobs import JOB_STATUS_FAILED, JOB_STATUS_SUCCEEDED, ResumeJobConfig, ResumeJobManager
+from core.responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
+from core.upload import SpoolConfig, SpooledUpload
+
+
+class StubService:
+    """Echoes the upload back as raw text; fails for files named ``bad.txt``."""
+
+    cache_namespace = "stub"
+
+    def read_resume(self, request):
+        if request.filename == "bad.txt":
+            raise ResumeExtractionError("Unable to extract readable text from resume.")
+        return ResumeReaderResponseVO(success=True, data=ResumeReaderResponseVOData(raw_text=request.file_bytes.decode()))
+
+
+class CallbackServer:
+    """Local HTTP endpoint that records callback bodies and answers with ``status``."""
+
+    def __init__(self, status=200):
+        self.bodies = []
+        received = self.bodies
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                received.append(json.loads(self.rfile.read(length)))
+                self.send_response(status)
+                if status in (301, 302, 307):
+                    self.send_header("Location", "http://127.0.0.1:1/elsewhere")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/hook"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _upload(filename="resume.txt", content=b"Jane Doe\njane@example.com"):
+    upload = SpooledUpload(filename, SpoolConfig())
+    upload.write(content)
+    upload.finish()
+    return upload
+
+
+def _serialize(job):
+    body = job.describe()
+    if job.status == JOB_STATUS_SUCCEEDED:
+        body["rawText"] = job.response.data.raw_text
+    return body
+
+
+async def _wait_done(manager, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = manager.get(job_id)
+        if job is None or job.done:
+            return job
+        assert time.monotonic() < deadline, "job did not finish"
+        await asyncio.sleep(0.01)
+
+
+async def _with_manager(config, scenario, serialize=_serialize):
+    executor = ResumeExtractionExecutor(StubService(), ResumeExecutorConfig(max_workers=2))
+    manager = ResumeJobManager(executor, config, serialize=serialize)
+    manager.start()
+    try:
+        return await scenario(manager)
+    finally:
+        await manager.shutdown()
+        executor.shutdown()
+
+
+def test_submit_poll_and_result():
+    async def scenario(manager):
+        job = manager.submit(_upload())
+        assert manager.get(job.id).status in ("queued", "running")
+        return await _wait_done(manager, job.id)
+
+    job = asyncio.run(_with_manager(ResumeJobConfig(), scenario))
+
+    assert job.status == JOB_STATUS_SUCCEEDED
+    assert job.response.data.raw_text == "Jane Doe\njane@example.com"
+    assert job.upload is None
+    assert job.finished_at >= job.started_at >= job.submitted_at
+
+
+def test_failed_job_keeps_the_error():
+    async def scenario(manager):
+        job = manager.submit(_upload("bad.txt"))
+        return await _wait_done(manager, job.id)
+
+    job = asyncio.run(_with_manager(ResumeJobConfig(), scenario))
+
+    assert job.status == JOB_STATUS_FAILED
+    assert isinstance(job.error, ResumeExtractionError)
+
+
+def test_finished_jobs_expire_after_the_ttl():
+    async def scenario(manager):
+        job = manager.submit(_upload())
+        await _wait_done(manager, job.id)
+        assert manager.get(job.id) is not None
+        await asyncio.sleep(0.1)
+        return manager.get(job.id)
+
+    assert asyncio.run(_with_manager(ResumeJobConfig(result_ttl_seconds=0.05), scenario)) is None
+
+
+def test_only_the_newest_finished_jobs_are_retained():
+    async def scenario(manager):
+        jobs = []
+        for _ in range(3):
+            jobs.append(manager.submit(_upload()))
+            await _wait_done(manager, jobs[-1].id)
+        return [manager.get(job.id) is not None for job in jobs]
+
+    assert asyncio.run(_with_manager(ResumeJobConfig(max_retained_jobs=2), scenario)) == [False, True, True]
+
+
+def test_workers_survive_unexpected_errors():
+    server = CallbackServer()
+    config = ResumeJobConfig(workers=1, webhook_allowed_hosts=frozenset({"127.0.0.1"}))
+
+    def broken_serialize(job):
+        raise TypeError("unexpected response shape")
+
+    async def scenario(manager):
+        first = manager.submit(_upload(), callback_url=server.url)
+        await _wait_done(manager, first.id)
+
+        async def broken_notify(job):
+            raise RuntimeError("boom")
+
+        manager._notify = broken_notify
+        second = manager.submit(_upload(), callback_url=server.url)
+        await _wait_done(manager, second.id)
+        await asyncio.sleep(0.05)
+        third = manager.submit(_upload())
+        return first, await _wait_done(manager, third.id)
+
+    try:
+        first, third = asyncio.run(_with_manager(config, scenario, serialize=broken_serialize))
+    finally:
+        server.close()
+
+    assert first.callback_status == 0
+    assert third.status == JOB_STATUS_SUCCEEDED
+
+
+def test_full_queue_rejects_new_jobs():
+    async def scenario(manager):
+        manager.submit(_upload())
+        with pytest.raises(ResumeReaderBusyError):
+            manager.submit(_upload())
+
+    # No worker runs before the first await, so the single slot stays taken.
+    asyncio.run(_with_manager(ResumeJobConfig(queue_size=1), scenario))
+
+
+def test_webhook_receives_the_result():
+    server = CallbackServer()
+    config = ResumeJobConfig(webhook_allowed_hosts=frozenset({"127.0.0.1"}))
+
+    async def scenario(manager):
+        manager.validate_callback_url(server.url)
+        job = manager.submit(_upload(), callback_url=server.url)
+        await _wait_done(manager, job.id)
+        deadline = time.monotonic() + 5
+        while job.callback_status is None and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return job
+
+    try:
+        job = asyncio.run(_with_manager(config, scenario))
+    finally:
+        server.close()
+
+    assert job.callback_status == 200
+    assert len(server.bodies) == 1
+    assert server.bodies[0]["jobId"] == job.id
+    assert server.bodies[0]["status"] == JOB_STATUS_SUCCEEDED
+    assert server.bodies[0]["rawText"] == "Jane Doe\njane@example.com"
+
+
+def test_webhook_redirects_are_not_followed():
+    server = CallbackServer(status=302)
+    config = ResumeJobConfig(webhook_allowed_hosts=frozenset({"127.0.0.1"}))
+
+    async def scenario(manager):
+        job = manager.submit(_upload(), callback_url=server.url)
+        await _wait_done(manager, job.id)
+        deadline = time.monotonic() + 5
+        while job.callback_status is None and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return job
+
+    try:
+        job = asyncio.run(_with_manager(config, scenario))
+    finally:
+        server.close()
+
+    assert job.callback_status == 302
+    assert len(server.bodies) == 1
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/hook",
+        "http://localhost:8000/hook",
+        "http://[::1]/hook",
+        "http://[::ffff:127.0.0.1]/hook",
+        "http://10.1.2.3/hook",
+        "http://192.168.0.10/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "ftp://example.com/hook",
+    ],
+)
+def test_internal_callback_hosts_are_refused_without_an_allowlist(url):
+    manager = ResumeJobManager(None, ResumeJobConfig(), serialize=_serialize)
+    with pytest.raises(ValueError):
+        manager.validate_callback_url(url)
+
+
+def test_public_callback_hosts_pass_without_an_allowlist():
+    manager = ResumeJobManager(None, ResumeJobConfig(), serialize=_serialize)
+    manager.validate_callback_url("https://93.184.216.34/hook")
+
+
+def test_allowlist_limits_callback_hosts():
+    manager = ResumeJobManager(None, ResumeJobConfig(webhook_allowed_hosts=frozenset({"hooks.example.com"})), serialize=_serialize)
+    manager.validate_callback_url("https://hooks.example.com/cb")
+    with pytest.raises(ValueError):
+        manager.validate_callback_url("https://93.184.216.34/hook")
+
+
+def test_callback_is_checked_again_before_delivery():
+    server = CallbackServer()
+
+    async def scenario(manager):
+        # Bypasses validate_callback_url, as if DNS changed after submission.
+        job = manager.submit(_upload(), callback_url=server.url)
+        await _wait_done(manager, job.id)
+        deadline = time.monotonic() + 5
+        while job.callback_status is None and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return job
+
+    try:
+        job = asyncio.run(_with_manager(ResumeJobConfig(), scenario))
+    finally:
+        server.close()
+
+    assert job.status == JOB_STATUS_SUCCEEDED
+    assert job.callback_status == 0
+    assert server.bodies == []
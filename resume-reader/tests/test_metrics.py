@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+import pytest
+
+from core.exceptions import ResumeExtractionError, ResumeExtractionTimeoutError, ResumeReaderBusyError
+from core.executor import ResumeExecutorConfig, ResumeExtractionExecutor
+from core.metrics import ResumeReaderMetrics
+from core.requestVO import ResumeReaderRequestVO
+from core.responseVO.ResumeReaderResponseVO import ResumeReaderResponseVO, ResumeReaderResponseVOData
+
+
+class BlockingService:
+    """Fails for ``bad.txt`` and holds ``slow.txt`` until ``release`` is set."""
+
+    cache_namespace = "stub"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def read_resume(self, request):
+        if request.filename == "bad.txt":
+            raise ResumeExtractionError("Unable to extract readable text from resume.")
+        if request.filename == "slow.txt":
+            self.release.wait(5)
+        return ResumeReaderResponseVO(success=True, data=ResumeReaderResponseVOData(raw_text="ok"))
+
+
+def _count(metrics, outcome):
+    prefix = f'resume_reader_request_seconds_count{{outcome="{outcome}"}} '
+    for line in metrics.render_prometheus().splitlines():
+        if line.startswith(prefix):
+            return int(line[len(prefix):])
+    return 0
+
+
+def test_every_outcome_is_observed():
+    service = BlockingService()
+    metrics = ResumeReaderMetrics()
+    executor = ResumeExtractionExecutor(
+        service, ResumeExecutorConfig(max_workers=1, job_timeout_seconds=0.2), metrics=metrics
+    )
+
+    async def scenario():
+        await executor.run(ResumeReaderRequestVO(filename="good.txt", file_bytes=b"x"))
+        with pytest.raises(ResumeExtractionError):
+            await executor.run(ResumeReaderRequestVO(filename="bad.txt", file_bytes=b"x"))
+        slow = asyncio.ensure_future(executor.run(ResumeReaderRequestVO(filename="slow.txt", file_bytes=b"x")))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ResumeReaderBusyError):
+            await executor.run(ResumeReaderRequestVO(filename="good.txt", file_bytes=b"x"))
+        with pytest.raises(ResumeExtractionTimeoutError):
+            await slow
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        service.release.set()
+        executor.shutdown()
+
+    counts = {outcome: _count(metrics, outcome) for outcome in ("success", "failed", "rejected", "timeout")}
+    assert counts == {"success": 1, "failed": 1, "rejected": 1, "timeout": 1}
+
+
+def test_waiting_for_a_slot_is_observed_once():
+    service = BlockingService()
+    metrics = ResumeReaderMetrics()
+    executor = ResumeExtractionExecutor(
+        service, ResumeExecutorConfig(max_workers=1, job_timeout_seconds=2.0), metrics=metrics
+    )
+
+    async def scenario():
+        slow = asyncio.ensure_future(executor.run(ResumeReaderRequestVO(filename="slow.txt", file_bytes=b"x")))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.ensure_future(
+            executor.run_when_available(ResumeReaderRequestVO(filename="good.txt", file_bytes=b"x"))
+        )
+        await asyncio.sleep(0.2)
+        service.release.set()
+        await slow
+        await waiting
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        service.release.set()
+        executor.shutdown()
+
+    assert (_count(metrics, "success"), _count(metrics, "rejected")) == (2, 0)
@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.corpus import PDF_LINES_PER_PAGE, render_pdf
+from core.parser import (
+    ExtractionLimits,
+    PageParallelConfig,
+    configure_page_parallelism,
+    disable_page_parallelism,
+    extract_document,
+)
+from core.parser import parallel
+
+PAGES = 6
+
+
+@pytest.fixture
+def resume_pdf():
+    return render_pdf([f"Line {n} of the resume" for n in range(PAGES * PDF_LINES_PER_PAGE)])
+
+
+@pytest.fixture
+def page_workers(monkeypatch):
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 4)
+    configure_page_parallelism(PageParallelConfig(workers=2, min_pages=2, pages_per_worker=1))
+    yield
+    configure_page_parallelism(PageParallelConfig())
+
+
+def test_parallel_pages_match_the_sequential_read(resume_pdf, page_workers):
+    parallel_text = extract_document("cv.pdf", resume_pdf, ExtractionLimits()).text
+
+    assert parallel._pool is not None
+    assert parallel._pool._mp_context.get_start_method() == "spawn"
+    configure_page_parallelism(PageParallelConfig())
+    assert extract_document("cv.pdf", resume_pdf, ExtractionLimits()).text == parallel_text
+
+
+def test_disabled_page_parallelism_drops_the_pool_without_using_it(resume_pdf, page_workers):
+    extract_document("cv.pdf", resume_pdf, ExtractionLimits())
+    inherited = parallel._pool
+
+    disable_page_parallelism()
+
+    assert parallel._pool is None
+    assert parallel.parallel_page_texts("pymupdf", resume_pdf, PAGES, ExtractionLimits()) is None
+    inherited.shutdown()
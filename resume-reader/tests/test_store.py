@@ -0,0 +1,104 @@
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import BigInteger, create_engine, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+from backend_common.database import create_session_factory, session_scope_factory
+from core.analyzer import default_taxonomy_store
+from core.responseVO.ResumeReaderResponseVO import ResumeReaderResponseVOData
+from core.store import ResumeParseStore
+from core.store.entity import BaseEntity, ResumeParseResultEntity, ResumeParseSkillEntity
+from web import security
+from web.restController import ResumeReaderController as controller
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns.
+    return "INTEGER"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    BaseEntity.metadata.create_all(engine)
+    yield create_session_factory(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def store(session_factory):
+    return ResumeParseStore(session_scope_factory(session_factory))
+
+
+def _rows(session_factory):
+    with session_factory() as session:
+        results = session.execute(select(ResumeParseResultEntity)).scalars().all()
+        skills = session.execute(select(ResumeParseSkillEntity.parse_result_id, ResumeParseSkillEntity.skill)).all()
+        return results, sorted(skills)
+
+
+def test_saving_the_same_file_again_replaces_the_result(store, session_factory):
+    first = store.save(7, "a" * 64, "cv.pdf", ResumeReaderResponseVOData(raw_text="x", skills=["python", "sql"], taxonomy_version="v1"))
+    second = store.save(7, "a" * 64, "cv-2.pdf", ResumeReaderResponseVOData(raw_text="x", skills=["go"], taxonomy_version="v2"))
+    other = store.save(8, "a" * 64, "cv.pdf", ResumeReaderResponseVOData(raw_text="x", skills=["go"], taxonomy_version="v2"))
+
+    results, skills = _rows(session_factory)
+    assert first == second != other
+    assert len(results) == 2
+    saved = next(result for result in results if result.id == first)
+    assert (saved.filename, saved.taxonomy_version) == ("cv-2.pdf", "v2")
+    assert skills == [(first, "go"), (other, "go")]
+
+
+def test_taxonomy_version_comes_from_the_parse_result(store, session_factory):
+    store.save(7, "b" * 64, None, ResumeReaderResponseVOData(raw_text="x", taxonomy_version="parsed-with"))
+    store.save(7, "c" * 64, None, ResumeReaderResponseVOData(raw_text="x"))
+
+    results, _ = _rows(session_factory)
+    versions = {result.content_hash[0]: result.taxonomy_version for result in results}
+    assert versions == {"b": "parsed-with", "c": default_taxonomy_store.current.version}
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(controller, "parse_store", store)
+    app = FastAPI()
+    app.include_router(controller.router)
+    return TestClient(app)
+
+
+def _token(subject):
+    return jwt.encode({"sub": subject}, security.SECRET_KEY, algorithm=security.ALGORITHM)
+
+
+def _extract(client, *, headers=None, params=None):
+    resume = io.BytesIO(b"Jane Doe\njane@example.com\nSkills: Python, SQL")
+    return client.post("/resume-reader/extract", files={"file": ("cv.txt", resume)}, params=params, headers=headers)
+
+
+def test_results_are_saved_for_the_authenticated_user(client, session_factory):
+    response = _extract(client, headers={"Authorization": f"Bearer {_token('42')}"}, params={"save": "true"})
+
+    assert response.status_code == 200
+    results, _ = _rows(session_factory)
+    assert [(result.id, result.user_id) for result in results] == [(response.json()["parseResultId"], 42)]
+
+
+def test_saving_requires_a_valid_token(client, session_factory):
+    assert _extract(client, params={"save": "true", "user_id": "42"}).status_code == 401
+    assert _extract(client, headers={"Authorization": "Bearer nope"}, params={"save": "true"}).status_code == 401
+    assert _rows(session_factory) == ([], [])
+
+
+def test_extract_without_save_stores_nothing(client, session_factory):
+    response = _extract(client, headers={"Authorization": f"Bearer {_token('42')}"})
+
+    assert response.status_code == 200
+    assert "parseResultId" not in response.json()
+    assert _rows(session_factory) == ([], [])
@@ -0,0 +1,81 @@
+import json
+import os
+import pickle
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend_common.skills import canonicalize_skill, skill_aliases_from_env
+from core.analyzer import SkillTaxonomy, TaxonomyStore
+from core.analyzer.taxonomy import builtin_taxonomy, load_taxonomy_file
+from web.restController import ResumeReaderController as controller
+
+
+def test_aliases_are_read_only():
+    taxonomy = SkillTaxonomy.build({"kubernetes": ["k8s"]})
+
+    with pytest.raises(TypeError):
+        taxonomy.aliases["k8s"] = "docker"
+    assert taxonomy.canonicalize("K8s") == "kubernetes"
+
+
+def test_taxonomy_survives_pickling_for_process_workers():
+    taxonomy = SkillTaxonomy.build({"kubernetes": ["k8s"]}, version="v1")
+
+    restored = pickle.loads(pickle.dumps(taxonomy))
+
+    assert restored == taxonomy
+    assert restored.canonicalize("k8s") == "kubernetes"
+    with pytest.raises(TypeError):
+        restored.aliases["k8s"] = "docker"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = TaxonomyStore(SkillTaxonomy.build({"python": []}, version="before"))
+    monkeypatch.setattr(store, "reload", lambda: store.swap(SkillTaxonomy.build({"go": []}, version="after")))
+    monkeypatch.setattr(controller, "default_taxonomy_store", store)
+    app = FastAPI()
+    app.include_router(controller.router)
+    return TestClient(app), store
+
+
+def test_reload_is_refused_without_a_configured_admin_token(client, monkeypatch):
+    test_client, store = client
+    monkeypatch.delenv("RESUME_READER_ADMIN_TOKEN", raising=False)
+
+    response = test_client.post("/resume-reader/taxonomy/reload", headers={"X-Admin-Token": "anything"})
+
+    assert response.status_code == 403
+    assert store.current.version == "before"
+
+
+def test_reload_requires_the_admin_token(client, monkeypatch):
+    test_client, store = client
+    monkeypatch.setenv("RESUME_READER_ADMIN_TOKEN", "s3cret")
+
+    assert test_client.post("/resume-reader/taxonomy/reload").status_code == 403
+    assert test_client.post("/resume-reader/taxonomy/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert store.current.version == "before"
+
+    response = test_client.post("/resume-reader/taxonomy/reload", headers={"X-Admin-Token": "s3cret"})
+
+    assert response.status_code == 200
+    assert response.json()["version"] == "after"
+
+
+def test_query_side_aliases_follow_the_configured_taxonomy(tmp_path, monkeypatch):
+    monkeypatch.delenv("RESUME_READER_SKILL_TAXONOMY_PATH", raising=False)
+    assert dict(skill_aliases_from_env()) == dict(builtin_taxonomy().aliases)
+
+    path = tmp_path / "skills.json"
+    path.write_text(json.dumps({"version": "v1", "skills": {"kubernetes": ["k8s"]}}))
+    monkeypatch.setenv("RESUME_READER_SKILL_TAXONOMY_PATH", str(path))
+    assert canonicalize_skill(" K8s ", skill_aliases_from_env()) == "kubernetes"
+    assert dict(skill_aliases_from_env()) == dict(load_taxonomy_file(str(path)).aliases)
+
+    path.write_text(json.dumps({"version": "v2", "skills": {"kubernetes": ["kube"]}}))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000_000))
+    assert canonicalize_skill("k8s", skill_aliases_from_env()) == "k8s"
+    assert canonicalize_skill("kube", skill_aliases_from_env()) == "kubernetes"
@@ -0,0 +1,124 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.exceptions import InvalidUploadError, ResumeTooLargeError
+from core.upload import SpoolConfig, spool_form
+from web.restController import ResumeReaderController as controller
+
+BOUNDARY = "resume-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def _part(name, content, filename=None):
+    disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+    return f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + content + b"\r\n"
+
+
+def _body(*parts):
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+class _Stream:
+    """Feeds a body in small chunks and records how much was consumed."""
+
+    def __init__(self, body, chunk_size=1024):
+        self.consumed = 0
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self._body), self._chunk_size):
+            chunk = self._body[start:start + self._chunk_size]
+            self.consumed += len(chunk)
+            yield chunk
+
+
+def _spool(body, config=SpoolConfig(), **kwargs):
+    stream = _Stream(body)
+    return asyncio.run(spool_form(CONTENT_TYPE, stream, config, **kwargs)), stream
+
+
+def test_file_and_fields_are_read_from_the_stream():
+    form, _ = _spool(_body(_part("note", b"hello"), _part("file", b"resume text", filename="cv.txt")))
+
+    [upload] = form.files
+    assert form.fields == {"note": "hello"}
+    assert upload.filename == "cv.txt"
+    assert upload.to_request().file_bytes == b"resume text"
+    form.close()
+
+
+def test_large_files_are_spooled_to_disk_once():
+    content = b"x" * 5000
+    form, _ = _spool(_body(_part("file", content, filename="cv.pdf")), SpoolConfig(spool_threshold_bytes=1000))
+
+    [upload] = form.files
+    assert upload.path is not None
+    with open(upload.path, "rb") as handle:
+        assert handle.read() == content
+    form.close()
+
+
+def test_size_limit_stops_reading_the_body():
+    body = _body(_part("file", b"x" * 100_000, filename="cv.pdf"))
+    stream = _Stream(body)
+
+    with pytest.raises(ResumeTooLargeError):
+        asyncio.run(spool_form(CONTENT_TYPE, stream, SpoolConfig(max_bytes=10_000)))
+    assert stream.consumed < 20_000
+
+
+@pytest.mark.parametrize(
+    "body, error",
+    [
+        (_body(_part("file", b"a", filename="a.txt"), _part("file", b"b", filename="b.txt")), ResumeTooLargeError),
+        (_body(_part("other", b"a", filename="a.txt")), InvalidUploadError),
+        (_body(_part("note", b"x" * 10_000)), InvalidUploadError),
+        (_part("file", b"a", filename="a.txt"), InvalidUploadError),
+    ],
+)
+def test_malformed_or_oversized_forms_are_refused(body, error):
+    with pytest.raises(error):
+        _spool(body)
+
+
+def test_only_multipart_bodies_are_accepted():
+    with pytest.raises(InvalidUploadError):
+        asyncio.run(spool_form("application/json", _Stream(b"{}"), SpoolConfig()))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(controller, "spool_config", SpoolConfig(max_bytes=1000))
+    app = FastAPI()
+    app.include_router(controller.router)
+    return TestClient(app)
+
+
+def test_extract_reads_the_upload(client):
+    response = client.post("/resume-reader/extract", files={"file": ("cv.txt", io.BytesIO(b"Jane Doe\njane@example.com"))})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["emails"] == ["jane@example.com"]
+
+
+def test_extract_refuses_oversized_and_missing_uploads(client):
+    chunked = client.post(
+        "/resume-reader/extract",
+        content=iter([_body(_part("file", b"x" * 5000, filename="cv.txt"))]),
+        headers={"content-type": CONTENT_TYPE},
+    )
+    missing = client.post(
+        "/resume-reader/extract",
+        content=_body(_part("note", b"no file")),
+        headers={"content-type": CONTENT_TYPE},
+    )
+    not_multipart = client.post("/resume-reader/extract", json={"file": "cv.txt"})
+
+    assert chunked.status_code == 413
+    assert missing.status_code == 422
+    assert not_multipart.status_code == 400
@@ -5,7 +5,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend_common import get_server_environment
+from .restController import executor as resume_reader_executor
+from .restController import job_manager as resume_job_manager
 from .restController import router as resume_reader_router
+from .restController import shutdown_page_pool
 
 
 def _build_allowed_origins(server_env) -> List[str]:
@@ -33,6 +36,16 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.on_event("startup")
+    async def on_startup():
+        resume_job_manager.start()
+
+    @app.on_event("shutdown")
+    async def on_shutdown():
+        await resume_job_manager.shutdown()
+        resume_reader_executor.shutdown()
+        shutdown_page_pool()
+
     @app.get("/health")
     def health():
         return {"status": "ok"}
@@ -1,8 +1,14 @@
-from dataclasses import asdict
+import asyncio
+from dataclasses import replace
+import json
+import os
 from pathlib import Path
 import sys
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ROOT_DIR = BASE_DIR.parent
@@ -10,31 +16,378 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from core import (  # noqa: E402
+    ResumeExecutorConfig,
+    ResumeExtractionExecutor,
+    ResumeParseCache,
     ResumeReaderRequestVO,
     ResumeReaderResponseVO,
     ResumeReaderServiceImpl,
 )
+from core.analyzer import default_taxonomy_store  # noqa: E402
+from core.batch import BatchItemResult, expand_archive, is_archive, iter_batch_results  # noqa: E402
 from core.exceptions import (  # noqa: E402
+    InvalidResumeFieldError,
+    InvalidUploadError,
     ResumeExtractionError,
+    ResumeExtractionTimeoutError,
+    ResumeParseStoreError,
+    ResumeReaderBusyError,
+    ResumeReaderError,
+    ResumeTooLargeError,
     UnsupportedResumeFormatError,
 )
+from core.jobs import JOB_STATUS_FAILED, JOB_STATUS_SUCCEEDED, ResumeJob, ResumeJobConfig, ResumeJobManager  # noqa: E402
+from core.metrics import ResumeReaderMetrics, format_server_timing  # noqa: E402
+from core.parser import default_registry, shutdown_page_pool  # noqa: E402
+from core.projection import parse_fields, project_response  # noqa: E402
+from core.store import ResumeParseStore  # noqa: E402
+from core.upload import SpoolConfig, SpooledForm, SpooledUpload, spool_form  # noqa: E402
+from ..security import get_optional_user_id, require_admin, require_user_id  # noqa: E402
 
 router = APIRouter(prefix="/resume-reader", tags=["resume-reader"])
 service = ResumeReaderServiceImpl()
+executor = ResumeExtractionExecutor(
+    service,
+    ResumeExecutorConfig.from_env(),
+    cache=ResumeParseCache.from_env(),
+    metrics=ResumeReaderMetrics.from_env(),
+)
+
+# Structured parse results are only stored when a database is configured.
+parse_store = ResumeParseStore.from_env()
+
+# Worker processes hold their own copy of the taxonomy; recycle them on swap.
+default_taxonomy_store.add_listener(executor.recycle_workers)
+
+spool_config = SpoolConfig.from_env()
+
+# Allowance for multipart boundaries and part headers around a single file.
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+BATCH_MAX_FILES = int(os.getenv("RESUME_READER_BATCH_MAX_FILES", "500"))
+BATCH_MAX_ENTRY_BYTES = int(os.getenv("RESUME_READER_BATCH_MAX_ENTRY_BYTES", str(spool_config.max_bytes)))
+# Upper bound on a whole batch: the request body and, separately, everything
+# its archives expand to.
+BATCH_MAX_TOTAL_BYTES = int(os.getenv("RESUME_READER_BATCH_MAX_TOTAL_BYTES", str(5 * spool_config.max_bytes)))
+BATCH_CONCURRENCY = int(os.getenv("RESUME_READER_BATCH_CONCURRENCY", str(executor.config.max_workers)))
+
+_ERROR_STATUSES = (
+    (ResumeTooLargeError, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE),
+    (ResumeReaderBusyError, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (ResumeParseStoreError, status.HTTP_503_SERVICE_UNAVAILABLE),
+    (ResumeExtractionTimeoutError, status.HTTP_504_GATEWAY_TIMEOUT),
+    (UnsupportedResumeFormatError, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+    (ResumeExtractionError, status.HTTP_400_BAD_REQUEST),
+    (InvalidResumeFieldError, status.HTTP_400_BAD_REQUEST),
+    (InvalidUploadError, status.HTTP_400_BAD_REQUEST),
+)
+
+
+def _status_for(exc: Exception) -> int:
+    for error_type, status_code in _ERROR_STATUSES:
+        if isinstance(exc, error_type):
+            return status_code
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _http_error(exc: ResumeReaderError) -> HTTPException:
+    headers = {"Retry-After": "1"} if isinstance(exc, ResumeReaderBusyError) else None
+    return HTTPException(_status_for(exc), str(exc), headers=headers)
+
+
+def _job_payload(job: ResumeJob) -> Dict[str, Any]:
+    payload = job.describe()
+    if job.status == JOB_STATUS_SUCCEEDED:
+        payload["result"] = project_response(job.response, job.fields)
+    elif job.status == JOB_STATUS_FAILED:
+        payload["error"] = {"status": _status_for(job.error), "detail": str(job.error)}
+    return payload
+
+
+job_manager = ResumeJobManager(
+    executor,
+    ResumeJobConfig.from_env(default_workers=executor.config.max_workers),
+    serialize=_job_payload,
+    store=parse_store,
+)
+
+
+def _save_for(save: bool, current_user_id: Optional[int], selected) -> Optional[int]:
+    """The user a parse result is saved for: always the caller, never a form value."""
+
+    if not save:
+        return None
+    user_id = require_user_id(current_user_id)
+    if parse_store is None:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Parse result storage is not configured.")
+    if selected is not None:
+        # Stored results are always complete, so they cannot come from a projection.
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "save cannot be combined with fields.")
+    return user_id
+
+
+def _form_body(file_field: str, *, multiple: bool = False) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that read their multipart body themselves."""
+
+    file_schema: Dict[str, Any] = {"type": "string", "format": "binary"}
+    if multiple:
+        file_schema = {"type": "array", "items": file_schema}
+    schema = {"type": "object", "properties": {file_field: file_schema}, "required": [file_field]}
+    return {"requestBody": {"required": True, "content": {"multipart/form-data": {"schema": schema}}}}
+
+
+async def _read_form(http_request: Request, file_field: str = "file", max_files: int = 1) -> SpooledForm:
+    # The body is parsed here rather than through UploadFile parameters, so
+    # each file is written once, into its spool, and the size limit stops the
+    # upload while it is still arriving.
+    try:
+        form = await spool_form(
+            http_request.headers.get("content-type"),
+            http_request.stream(),
+            spool_config,
+            file_field=file_field,
+            max_files=max_files,
+        )
+    except ResumeReaderError as exc:
+        raise _http_error(exc) from exc
+    if not form.files:
+        form.close()
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, f"A file is required in the {file_field!r} field.")
+    return form
+
+
+@router.post("/extract", openapi_extra=_form_body("file"))
+async def extract_resume(
+    http_request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated response fields to compute, e.g. emails,phone_numbers. "
+        "Only the analyzers these fields need are run; raw_text is left out unless listed.",
+    ),
+    save: bool = Query(False, description="Save the parse result to the structured store for the signed-in user."),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    try:
+        selected = parse_fields(fields)
+    except ResumeReaderError as exc:
+        raise _http_error(exc) from exc
+    user_id = _save_for(save, current_user_id, selected)
+
+    content_length = http_request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > spool_config.max_bytes + MULTIPART_OVERHEAD_BYTES:
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                f"Upload exceeds the {spool_config.max_bytes} byte limit.",
+            )
+
+    form = await _read_form(http_request)
+    try:
+        with form.files[0] as spool:
+            request = replace(spool.to_request(), fields=selected)
+            started = time.perf_counter()
+            response: ResumeReaderResponseVO = await executor.run(request)
+            elapsed = time.perf_counter() - started
+            parse_result_id = None
+            if user_id is not None and response.success and not response.data.cut_short_by_time_budget:
+                parse_result_id = await asyncio.to_thread(
+                    parse_store.save, user_id, spool.content_hash, spool.filename, response.data
+                )
+    except ResumeReaderError as exc:
+        raise _http_error(exc) from exc
+    finally:
+        form.close()
+
+    # "job" covers the executor round trip, including any queueing; cache hits
+    # carry no profile and report only that.
+    server_timing = f"job;dur={elapsed * 1000:.3f}"
+    if response.profile is not None:
+        server_timing = f"{format_server_timing(response.profile.stages)}, {server_timing}"
+    else:
+        server_timing = f'cache;desc="hit", {server_timing}'
+    body = project_response(response, selected)
+    if parse_result_id is not None:
+        body["parseResultId"] = parse_result_id
+    return JSONResponse(body, headers={"Server-Timing": server_timing})
+
 
+def _batch_line(result: BatchItemResult) -> str:
+    if result.error is None:
+        payload = {"index": result.index, "filename": result.filename, **project_response(result.response, None)}
+    else:
+        status_code = _status_for(result.error)
+        message = str(result.error) if isinstance(result.error, ResumeReaderError) else "Resume extraction failed."
+        payload = {
+            "index": result.index,
+            "filename": result.filename,
+            "success": False,
+            "error": {"status": status_code, "detail": message},
+        }
+    return json.dumps(payload) + "\n"
 
-@router.post("/extract")
-async def extract_resume(file: UploadFile = File(...)):
+
+async def _stream_batch(
+    requests: List[ResumeReaderRequestVO],
+    spools: List[SpooledUpload],
+) -> AsyncIterator[str]:
     try:
-        content = await file.read()
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Unable to read uploaded resume.") from exc
+        async for result in iter_batch_results(executor, requests, concurrency=BATCH_CONCURRENCY):
+            yield _batch_line(result)
+    finally:
+        for spool in spools:
+            spool.close()
+
+
+def _expand_batch(form: SpooledForm) -> List[SpooledUpload]:
+    """One spooled upload per batch item, with archives replaced by their entries.
 
+    Runs in a worker thread because archives are decompressed here. On
+    success every upload in the form is either returned or already closed.
+    """
+
+    uploads: List[SpooledUpload] = []
+    remaining = BATCH_MAX_TOTAL_BYTES
     try:
-        request = ResumeReaderRequestVO(filename=file.filename or "", file_bytes=content)
-        response: ResumeReaderResponseVO = service.read_resume(request)
-        return asdict(response)
-    except UnsupportedResumeFormatError as exc:
-        raise HTTPException(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, str(exc)) from exc
-    except ResumeExtractionError as exc:
+        for spool in form.files:
+            if not is_archive(spool.filename):
+                uploads.append(spool)
+                remaining -= spool.size
+                continue
+            with spool.open() as stream:
+                entries = expand_archive(
+                    spool.filename,
+                    stream,
+                    spool_config,
+                    max_entries=BATCH_MAX_FILES - len(uploads),
+                    max_entry_bytes=BATCH_MAX_ENTRY_BYTES,
+                    max_total_bytes=max(remaining, 0),
+                )
+            spool.close()
+            uploads.extend(entries)
+            remaining -= sum(entry.size for entry in entries)
+        if remaining < 0:
+            raise ResumeTooLargeError(f"A batch may contain at most {BATCH_MAX_TOTAL_BYTES} bytes.")
+    except BaseException:
+        form.close()
+        for upload in uploads:
+            upload.close()
+        raise
+    return uploads
+
+
+@router.post("/extract/batch", openapi_extra=_form_body("files", multiple=True))
+async def extract_resume_batch(http_request: Request):
+    content_length = http_request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > BATCH_MAX_TOTAL_BYTES + MULTIPART_OVERHEAD_BYTES:
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                f"A batch may contain at most {BATCH_MAX_TOTAL_BYTES} bytes.",
+            )
+
+    form = await _read_form(http_request, "files", max_files=BATCH_MAX_FILES)
+    try:
+        uploads = await asyncio.to_thread(_expand_batch, form)
+    except ResumeReaderError as exc:
+        raise _http_error(exc) from exc
+
+    # The spools outlive this handler: they are closed once the streamed body
+    # has been produced.
+    requests = [upload.to_request() for upload in uploads]
+    return StreamingResponse(_stream_batch(requests, uploads), media_type="application/x-ndjson")
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED, openapi_extra=_form_body("file"))
+async def submit_resume_job(
+    http_request: Request,
+    fields: Optional[str] = Query(None, description="Same selector as /extract."),
+    callback_url: Optional[str] = Query(None, description="URL that receives the job result as a JSON POST."),
+    save: bool = Query(False, description="Save the parse result to the structured store for the signed-in user."),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    try:
+        selected = parse_fields(fields)
+        user_id = _save_for(save, current_user_id, selected)
+        if callback_url:
+            await asyncio.to_thread(job_manager.validate_callback_url, callback_url)
+    except ResumeReaderError as exc:
+        raise _http_error(exc) from exc
+    except ValueError as exc:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, str(exc)) from exc
+
+    form = await _read_form(http_request)
+    spool = form.files[0]
+    try:
+        job = job_manager.submit(spool, fields=selected, callback_url=callback_url, user_id=user_id)
+    except BaseException as exc:
+        spool.close()
+        if isinstance(exc, ResumeReaderError):
+            raise _http_error(exc) from exc
+        raise
+
+    return {
+        **job.describe(),
+        "statusUrl": str(http_request.url_for("get_resume_job", job_id=job.id)),
+        "resultUrl": str(http_request.url_for("get_resume_job_result", job_id=job.id)),
+    }
+
+
+def _find_job(job_id: str) -> ResumeJob:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Unknown or expired job.")
+    return job
+
+
+@router.get("/jobs/{job_id}")
+def get_resume_job(job_id: str):
+    return _find_job(job_id).describe()
+
+
+@router.get("/jobs/{job_id}/result")
+def get_resume_job_result(job_id: str):
+    job = _find_job(job_id)
+    if not job.done:
+        return JSONResponse(job.describe(), status_code=status.HTTP_202_ACCEPTED)
+    if job.status == JOB_STATUS_FAILED:
+        return JSONResponse(_job_payload(job), status_code=_status_for(job.error))
+    return _job_payload(job)
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    cache = executor.cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+def _taxonomy_summary() -> Dict[str, Any]:
+    taxonomy = default_taxonomy_store.current
+    return {"version": taxonomy.version, "skills": len(taxonomy.skills), "aliases": len(taxonomy.aliases)}
+
+
+@router.get("/taxonomy")
+def get_taxonomy():
+    return _taxonomy_summary()
+
+
+@router.post("/taxonomy/reload", dependencies=[Depends(require_admin)])
+def reload_taxonomy():
+    try:
+        default_taxonomy_store.reload()
+    except (OSError, ValueError) as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, f"Taxonomy not reloaded: {exc}") from exc
+    return _taxonomy_summary()
+
+
+@router.get("/extractors")
+def list_extractors():
+    return {"extractors": default_registry.describe()}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    registry = executor.metrics
+    body = registry.render_prometheus() if registry is not None else ""
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
@@ -1,3 +1,3 @@
-from .ResumeReaderController import router
+from .ResumeReaderController import executor, job_manager, router, shutdown_page_pool
 
-__all__ = ["router"]
+__all__ = ["executor", "job_manager", "router", "shutdown_page_pool"]
@@ -0,0 +1,60 @@
+import hmac
+import os
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from jose import JWTError, jwt
+
+# Tokens are issued by the job-recommendation-system API (/auth/token) and
+# verified here with the same secret; resume-reader keeps no user table.
+SECRET_KEY = os.getenv("AUTH_SECRET_KEY", "dev-insecure-secret-change-me")
+ALGORITHM = os.getenv("AUTH_JWT_ALGORITHM", "HS256")
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_optional_user_id(token: Optional[str] = Depends(oauth2_scheme)) -> Optional[int]:
+    """Id of the user the bearer token was issued to, or None when no token was sent.
+
+    A token that is present but invalid or expired is still refused.
+    """
+
+    if token is None:
+        return None
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        subject = payload.get("sub")
+        if subject is None:
+            raise _credentials_exception()
+        return int(subject)
+    except (JWTError, ValueError):
+        raise _credentials_exception()
+
+
+def require_user_id(user_id: Optional[int]) -> int:
+    if user_id is None:
+        raise _credentials_exception()
+    return user_id
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Guard for operational endpoints such as taxonomy reloads.
+
+    Callers send the RESUME_READER_ADMIN_TOKEN value in ``X-Admin-Token``;
+    with no token configured the endpoints are refused outright.
+    """
+
+    expected = os.getenv("RESUME_READER_ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Admin endpoints are disabled.")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode("utf-8"), expected.encode("utf-8")):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "A valid admin token is required.")